@@ -0,0 +1,66 @@
+"""
+Microbenchmark for OCPI data types validation.
+
+Validates the 2.2.1 test payloads of the heaviest models and prints the mean
+time per validation. The Location payload is inflated to 200 EVSEs to mimic
+a big site.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_data_types
+"""
+
+import copy
+import timeit
+
+from py_ocpi.modules.cdrs.v_2_2_1.schemas import Cdr
+from py_ocpi.modules.locations.v_2_2_1.schemas import Location
+from py_ocpi.modules.sessions.v_2_2_1.schemas import Session
+from py_ocpi.modules.tariffs.v_2_2_1.schemas import Tariff
+from py_ocpi.modules.tokens.v_2_2_1.schemas import Token
+
+from tests.test_modules.test_v_2_2_1.test_cdrs.utils import CDRS
+from tests.test_modules.test_v_2_2_1.test_locations.utils import LOCATIONS
+from tests.test_modules.test_v_2_2_1.test_sessions.utils import SESSIONS
+from tests.test_modules.test_v_2_2_1.test_tariffs.utils import TARIFFS
+from tests.test_modules.test_v_2_2_1.test_tokens.utils import TOKENS
+
+EVSE_AMOUNT = 200
+
+
+def big_location() -> dict:
+    location = copy.deepcopy(LOCATIONS[0])
+    evse = location["evses"][0]
+    location["evses"] = []
+    for i in range(EVSE_AMOUNT):
+        new_evse = copy.deepcopy(evse)
+        new_evse["uid"] = f"evse-{i}"
+        location["evses"].append(new_evse)
+    return location
+
+
+CASES = [
+    ("Location", Location, LOCATIONS[0]),
+    (f"Location ({EVSE_AMOUNT} EVSEs)", Location, big_location()),
+    ("Session", Session, SESSIONS[0]),
+    ("Cdr", Cdr, CDRS[0]),
+    ("Tariff", Tariff, TARIFFS[0]),
+    ("Token", Token, TOKENS[0]),
+]
+
+
+def main(repeat: int = 5) -> None:
+    for name, model, data in CASES:
+        number = 10 if model is Location and len(data["evses"]) > 1 else 2000
+        best = min(
+            timeit.repeat(
+                lambda: model.model_validate(data),
+                number=number,
+                repeat=repeat,
+            )
+        )
+        print(f"{name:<28} {best / number * 1e6:>10.1f} us/validation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark of the per-request overhead of ExceptionHandlerMiddleware.
+
+Requests a trivial endpoint in-process through the ASGI transport of httpx
+without middleware, with the former BaseHTTPMiddleware implementation and
+with the ASGI one, and prints p50 / p99 latencies and the overhead over
+the bare application.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_middleware
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+
+from py_ocpi.core.config import logger
+from py_ocpi.main import ExceptionHandlerMiddleware, exception_response
+
+REQUESTS = 5000
+
+
+class BaseHTTPExceptionHandlerMiddleware(BaseHTTPMiddleware):
+    """The former implementation, kept as reference."""
+
+    async def dispatch(self, request, call_next: RequestResponseEndpoint):
+        logger.debug("%s: %s" % (request.method, request.url))
+        logger.debug("Request headers - %s" % request.headers)
+        try:
+            response = await call_next(request)
+        except Exception as e:
+            response = exception_response(e)
+        logger.debug(f"Response status_code -> {response.status_code}.")
+        return response
+
+
+def make_app(middleware=None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"data": []}
+
+    if middleware:
+        app.add_middleware(middleware)
+    return app
+
+
+async def measure(apps: dict, rounds: int = 10) -> dict:
+    # configurations are measured in interleaved rounds to even out drift
+    timings = {name: [] for name in apps}
+    clients = {
+        name: httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://testserver",
+        )
+        for name, app in apps.items()
+    }
+    for client in clients.values():
+        for _ in range(100):
+            await client.get("/ping")
+
+    for _ in range(rounds):
+        for name, client in clients.items():
+            for _ in range(REQUESTS // rounds):
+                start = time.perf_counter()
+                await client.get("/ping")
+                timings[name].append((time.perf_counter() - start) * 1e6)
+
+    for client in clients.values():
+        await client.aclose()
+    return {
+        name: statistics.quantiles(values, n=100)
+        for name, values in timings.items()
+    }
+
+
+def main() -> None:
+    logger.setLevel(logging.WARNING)
+    results = asyncio.run(
+        measure(
+            {
+                "no middleware": make_app(),
+                "BaseHTTPMiddleware": make_app(
+                    BaseHTTPExceptionHandlerMiddleware
+                ),
+                "ASGI middleware": make_app(ExceptionHandlerMiddleware),
+            }
+        )
+    )
+    baseline = results["no middleware"][49]
+    for name, percentiles in results.items():
+        print(
+            f"{name:<20} p50 {percentiles[49]:>8.1f} us  "
+            f"p99 {percentiles[98]:>8.1f} us  "
+            f"overhead {percentiles[49] - baseline:>7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark of push_object fanning out to many receivers.
+
+Pushes a location to 20 receivers served in-process by a partner stand-in
+(ASGI transport of httpx), each receiver answering after its own delay,
+and prints the push duration for several PUSH_CONCURRENCY values next to
+the delay of the slowest receiver.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_push
+"""
+
+import asyncio
+import logging
+import random
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+
+from py_ocpi.core import enums, schemas
+from py_ocpi.core.config import logger, settings
+from py_ocpi.core.endpoints import ENDPOINTS
+from py_ocpi.core.partners import partner_registry
+from py_ocpi.core.push import push_object
+from py_ocpi.modules.locations.v_2_2_1.schemas import Location
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.test_v_2_2_1.test_locations.utils import LOCATIONS
+
+RECEIVERS = 20
+CONCURRENCIES = [1, 5, 10, 20]
+
+random.seed(0)
+DELAYS = {i: random.uniform(0.02, 0.1) for i in range(RECEIVERS)}
+
+
+def make_partner() -> FastAPI:
+    partner = FastAPI()
+    locations_endpoint = ENDPOINTS[VersionNumber.v_2_2_1][enums.RoleEnum.emsp][
+        enums.ModuleID.locations
+    ].model_dump()
+
+    @partner.get("/{receiver}/details")
+    async def details(receiver: int):
+        await asyncio.sleep(DELAYS[receiver] / 2)
+        endpoint = dict(
+            locations_endpoint,
+            url=f"http://partner/{receiver}/locations/",
+        )
+        return {"data": {"version": "2.2.1", "endpoints": [endpoint]}}
+
+    @partner.put("/{receiver}/locations/{country_code}/{party_id}/{id}")
+    async def put_location(receiver: int, request: Request):
+        await request.body()
+        await asyncio.sleep(DELAYS[receiver] / 2)
+        return {"data": [], "status_code": 1000}
+
+    return partner
+
+
+class Crud:
+    @classmethod
+    async def get(cls, module, role, id, *args, **kwargs):
+        return LOCATIONS[0]
+
+
+class Adapter:
+    @classmethod
+    def location_adapter(cls, data, version=VersionNumber.v_2_2_1):
+        return Location(**data)
+
+
+async def measure(concurrency: int) -> float:
+    settings.PUSH_CONCURRENCY = concurrency
+    # every run requests the version details of the receivers
+    partner_registry.invalidate()
+    push = schemas.Push(
+        module_id=enums.ModuleID.locations,
+        object_id=LOCATIONS[0]["id"],
+        receivers=[
+            schemas.Receiver(
+                endpoints_url=f"http://partner/{i}/details", auth_token="token"
+            )
+            for i in range(RECEIVERS)
+        ],
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=make_partner())
+    ) as client:
+        start = time.perf_counter()
+        result = await push_object(
+            VersionNumber.v_2_2_1, push, Crud, Adapter, http_client=client
+        )
+        duration = time.perf_counter() - start
+    assert all(r.status_code == 200 for r in result.receiver_responses)
+    return duration * 1e3
+
+
+def main() -> None:
+    logger.setLevel(logging.WARNING)
+    print(
+        f"{RECEIVERS} receivers, slowest {max(DELAYS.values()) * 1e3:.1f} ms, "
+        f"sum {sum(DELAYS.values()) * 1e3:.1f} ms"
+    )
+    for concurrency in CONCURRENCIES:
+        duration = asyncio.run(measure(concurrency))
+        print(f"PUSH_CONCURRENCY {concurrency:>3}  {duration:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
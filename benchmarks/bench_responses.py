@@ -0,0 +1,87 @@
+"""
+Benchmark of the OCPI JSON response pipeline.
+
+Requests GET /locations of a 2.2.1 CPO application in-process through the
+ASGI transport of httpx and prints p50 / p99 latencies for 50 and 1000
+locations, which covers adapting, serializing and enveloping the list.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_responses
+"""
+
+import asyncio
+import copy
+import logging
+import statistics
+import time
+
+import httpx
+
+from py_ocpi.main import get_application
+from py_ocpi.core import enums
+from py_ocpi.core.config import logger
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.test_v_2_2_1.test_locations.utils import (
+    AUTH_HEADERS,
+    CPO_BASE_URL,
+    LOCATIONS,
+    ClientAuthenticator,
+)
+
+LOCATION_AMOUNTS = [50, 1000]
+
+
+def make_crud(amount: int):
+    locations = []
+    for i in range(amount):
+        location = copy.deepcopy(LOCATIONS[0])
+        location["id"] = f"location-{i}"
+        locations.append(location)
+
+    class Crud:
+        @classmethod
+        async def list(cls, module, role, filters, *args, **kwargs):
+            return locations, amount, True
+
+    return Crud
+
+
+async def measure(amount: int, requests: int) -> None:
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=make_crud(amount),
+        authenticator=ClientAuthenticator,
+        modules=[enums.ModuleID.locations],
+    )
+    url = f"http://testserver{CPO_BASE_URL}?limit={amount}"
+
+    timings = []
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app)
+    ) as client:
+        for _ in range(5):
+            await client.get(url, headers=AUTH_HEADERS)
+
+        for _ in range(requests):
+            start = time.perf_counter()
+            await client.get(url, headers=AUTH_HEADERS)
+            timings.append((time.perf_counter() - start) * 1e3)
+
+    percentiles = statistics.quantiles(timings, n=100)
+    print(
+        f"{amount:>5} locations  "
+        f"p50 {percentiles[49]:>8.2f} ms  p99 {percentiles[98]:>8.2f} ms"
+    )
+
+
+def main() -> None:
+    logger.setLevel(logging.WARNING)
+    for amount in LOCATION_AMOUNTS:
+        asyncio.run(measure(amount, requests=500 if amount <= 50 else 100))
+
+
+if __name__ == "__main__":
+    main()
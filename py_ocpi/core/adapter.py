@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
 
-from py_ocpi.core.utils import get_module_model
+from py_ocpi.core.registry import model_registry
 from py_ocpi.modules.versions.enums import VersionNumber
 
 
@@ -231,12 +232,53 @@ class Adapter(ABC):
 
 
 class BaseAdapter(Adapter):
+    # custom models registered by the adapter class, see register_model
+    _models: Dict[Tuple[str, str, str], Any] = {}
+
+    @classmethod
+    def register_model(
+        cls,
+        class_name: str,
+        module_name: str,
+        version: VersionNumber,
+        model: Any,
+    ):
+        """Register a custom model used instead of the OCPI schema by the
+        adapter class and its subclasses
+
+        Args:
+            class_name (str): The schema class name, e.g. `Location`
+            module_name (str): The OCPI module name, e.g. `locations`
+            version (VersionNumber): The version number of the OCPI module
+            model (Any): The model class
+        """
+        if "_models" not in vars(cls):
+            cls._models = {}
+        cls._models[(module_name, version.name, class_name)] = model
+
+    @classmethod
+    def get_model(cls, class_name: str, module_name: str, version_name: str):
+        """Return the model registered by the adapter class or its bases,
+        the OCPI schema otherwise
+
+        Args:
+            class_name (str): The schema class name, e.g. `Location`
+            module_name (str): The OCPI module name, e.g. `locations`
+            version_name (str): The name of the version, e.g. `v_2_2_1`
+        """
+        key = (module_name, version_name, class_name)
+        for base in cls.__mro__:
+            models = vars(base).get("_models")
+            if models and key in models:
+                return models[key]
+        return model_registry.get(class_name, module_name, version_name)
+
     @classmethod
     def location_adapter(
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI Location schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="Location",
             module_name="locations",
             version_name=version.name,
@@ -247,7 +289,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI Session schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="Session",
             module_name="sessions",
             version_name=version.name,
@@ -258,7 +300,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI ChargingPreference schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="ChargingPreferences",
             module_name="sessions",
             version_name=version.name,
@@ -269,7 +311,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI Credentials schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="Credentials",
             module_name="credentials",
             version_name=version.name,
@@ -280,7 +322,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI Cdr schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="Cdr",
             module_name="cdrs",
             version_name=version.name,
@@ -291,7 +333,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI Tariff schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="Tariff",
             module_name="tariffs",
             version_name=version.name,
@@ -302,7 +344,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI CommandResponse schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="CommandResponse",
             module_name="commands",
             version_name=version.name,
@@ -313,7 +355,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI CommandResult schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="CommandResult",
             module_name="commands",
             version_name=version.name,
@@ -324,7 +366,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI Token schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="Token",
             module_name="tokens",
             version_name=version.name,
@@ -335,7 +377,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI AuthorizationInfo schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="AuthorizationInfo",
             module_name="tokens",
             version_name=version.name,
@@ -346,7 +388,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI ClientInfo schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="ClientInfo",
             module_name="hubclientinfo",
             version_name=version.name,
@@ -357,7 +399,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI ChargingProfileResponse schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="ChargingProfileResponse",
             module_name="chargingprofiles",
             version_name=version.name,
@@ -368,7 +410,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI ActiveChargingProfileResult schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="ActiveChargingProfileResult",
             module_name="chargingprofiles",
             version_name=version.name,
@@ -379,7 +421,7 @@ class BaseAdapter(Adapter):
         cls, data: dict, version: VersionNumber = VersionNumber.latest
     ):
         """Adapt the data to OCPI ClearProfileResult schema"""
-        return get_module_model(
+        return cls.get_model(
             class_name="ClearProfileResult",
             module_name="chargingprofiles",
             version_name=version.name,
@@ -10,15 +10,19 @@ class Authenticator(ABC):
     """Base class responsible for verifying authorization tokens."""
 
     @classmethod
-    async def authenticate(cls, auth_token: str) -> None:
+    async def authenticate(cls, auth_token: str) -> dict | None:
         """Authenticate given auth token.
 
+        May return the identity of the authenticated party, a dict with
+        `country_code`, `party_id` and `roles` keys, which is given to
+        the crud in the party context.
+
         :raises AuthorizationOCPIError: If auth_token is not in a given
           list of verified tokens C.
         """
         list_token_c = await cls.get_valid_token_c()
         if auth_token not in list_token_c:
-            logger.debug("Given `%s` token is not valid" % auth_token)
+            logger.debug("Given `%s` token is not valid", auth_token)
             raise AuthorizationOCPIError
 
     @classmethod
@@ -30,14 +34,14 @@ class Authenticator(ABC):
         if auth_token:
             list_token_a = await cls.get_valid_token_a()
             if auth_token in list_token_a:
-                logger.debug("Token A `%s` is used." % auth_token)
+                logger.debug("Token A `%s` is used.", auth_token)
                 return {}
 
             list_token_c = await cls.get_valid_token_c()
             if auth_token in list_token_c:
-                logger.debug("Token C `%s` is used." % auth_token)
+                logger.debug("Token C `%s` is used.", auth_token)
                 return auth_token
-        logger.debug("Token `%s` is not of type A or C." % auth_token)
+        logger.debug("Token `%s` is not of type A or C.", auth_token)
         return None
 
     @classmethod
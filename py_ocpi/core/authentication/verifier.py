@@ -1,7 +1,12 @@
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, Tuple
+
 from fastapi import (
     Depends,
     Header,
     Path,
+    Request,
     Security,
     status,
     Query,
@@ -12,6 +17,7 @@ from fastapi.security import APIKeyHeader
 from py_ocpi.core.authentication.authenticator import Authenticator
 from py_ocpi.core.config import logger, settings
 from py_ocpi.core.dependencies import get_authenticator
+from py_ocpi.core.enums import RoleEnum
 from py_ocpi.core.exceptions import AuthorizationOCPIError
 from py_ocpi.core.utils import decode_string_base64
 from py_ocpi.modules.versions.enums import VersionNumber
@@ -24,6 +30,133 @@ api_key_header = APIKeyHeader(
 auth_verifier = Security(api_key_header) if not settings.NO_AUTH else ""
 
 
+class PartyContext(NamedTuple):
+    """
+    Request-scoped context of the authenticated party, built once
+    by the verifier and given to the crud as `party_context`.
+    Identity fields are set if the authenticator returns them.
+    """
+
+    token: Optional[str]
+    version: VersionNumber
+    country_code: Optional[str] = None
+    party_id: Optional[str] = None
+    roles: Tuple[RoleEnum, ...] = ()
+
+
+def get_party_context(request: Request) -> Optional[PartyContext]:
+    """Return the party context set by the verifier, if any."""
+    return getattr(request.state, "party_context", None)
+
+
+def set_party_context(
+    request: Request,
+    token: str,
+    version: VersionNumber,
+    identity: dict,
+) -> PartyContext:
+    party_context = PartyContext(
+        token=token,
+        version=version,
+        country_code=identity.get("country_code"),
+        party_id=identity.get("party_id"),
+        roles=tuple(identity.get("roles", ())),
+    )
+    request.state.party_context = party_context
+    return party_context
+
+
+class AuthTokenCache:
+    """
+    Bounded TTL cache of successfully authenticated tokens
+    with the identity returned by the authenticator.
+
+    Tokens are cached by authenticator, failed authentications
+    are never cached.
+
+    :param ttl (float): Seconds a token stays authenticated, 0 disables
+      the cache.
+    :param maxsize (int): Maximum amount of cached tokens, the least
+      recently used ones are evicted first.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Tuple[Any, str], Tuple[float, dict]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, authenticator: Any, token: str) -> Optional[dict]:
+        """Return the identity of a cached token, None if not cached."""
+        key = (authenticator, token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, identity = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return identity
+
+    def add(self, authenticator: Any, token: str, identity: dict) -> None:
+        if self.ttl <= 0:
+            return
+        key = (authenticator, token)
+        self._entries[key] = (time.monotonic() + self.ttl, identity)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Evict a token for all authenticators, or every token if
+        no token is given.
+        """
+        if token is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[1] == token]:
+            del self._entries[key]
+
+
+auth_token_cache = AuthTokenCache(
+    ttl=settings.AUTH_TOKEN_CACHE_TTL,
+    maxsize=settings.AUTH_TOKEN_CACHE_MAX_SIZE,
+)
+
+
+def invalidate_auth_token(token: Optional[str] = None) -> None:
+    """
+    Evict a token from the authentication cache, to be called
+    once the token is rotated or deleted.
+
+    :param token (str): The decoded token, every token if not given.
+    """
+    auth_token_cache.invalidate(token)
+
+
+async def authenticate(authenticator: Authenticator, token: str) -> dict:
+    """
+    Authenticate the token with the authenticator unless it was
+    authenticated recently.
+
+    :return: Identity of the party returned by the authenticator,
+      empty if it returns none.
+
+    :raises AuthorizationOCPIError: If the token is not valid.
+    """
+    identity = auth_token_cache.get(authenticator, token)
+    if identity is None:
+        identity = await authenticator.authenticate(token) or {}
+        auth_token_cache.add(authenticator, token, identity)
+    return identity
+
+
 class AuthorizationVerifier:
     """
     A class responsible for verifying authorization tokens
@@ -37,6 +170,7 @@ class AuthorizationVerifier:
 
     async def __call__(
         self,
+        request: Request,
         authorization: str = auth_verifier,
         authenticator: Authenticator = Depends(get_authenticator),
     ):
@@ -44,6 +178,8 @@ class AuthorizationVerifier:
         Verifies the authorization token using the specified version
         and an Authenticator.
 
+        :param request (Request): The request, the party context is set
+          in its state.
         :param authorization (str): The authorization header containing
           the token.
         :param authenticator (Authenticator): An Authenticator instance used
@@ -51,6 +187,8 @@ class AuthorizationVerifier:
 
         :raises AuthorizationOCPIError: If there is an issue with
           the authorization token.
+
+        :return: The party context.
         """
         if settings.NO_AUTH and authorization == "":
             logger.debug("Authentication skipped due to NO_AUTH setting.")
@@ -64,16 +202,18 @@ class AuthorizationVerifier:
                 except UnicodeDecodeError:
                     logger.debug(
                         "Token `%s` cannot be decoded. "
-                        "Check if the token is already encoded." % token
+                        "Check if the token is already encoded.",
+                        token,
                     )
                     raise AuthorizationOCPIError
-            await authenticator.authenticate(token)
+            identity = await authenticate(authenticator, token)
         except IndexError:
             logger.debug(
                 "Token `%s` cannot be split in parts. "
                 "Check if it starts with `Token `"
             )
             raise AuthorizationOCPIError
+        return set_party_context(request, token, self.version, identity)
 
 
 class CredentialsAuthorizationVerifier:
@@ -120,7 +260,8 @@ class CredentialsAuthorizationVerifier:
                 except UnicodeDecodeError:
                     logger.debug(
                         "Token `%s` cannot be decoded. "
-                        "Check if the token is already encoded." % token
+                        "Check if the token is already encoded.",
+                        token,
                     )
                     raise AuthorizationOCPIError
         else:
@@ -167,6 +308,7 @@ class HttpPushVerifier:
 
     async def __call__(
         self,
+        request: Request,
         authorization: str = Header(...) if not settings.NO_AUTH else "",
         version: VersionNumber = Path(...),
         authenticator: Authenticator = Depends(get_authenticator),
@@ -175,6 +317,8 @@ class HttpPushVerifier:
         Verifies the authorization token using the specified version
         and an Authenticator.
 
+        :param request (Request): The request, the party context is set
+          in its state.
         :param authorization (str): The authorization header containing
           the token.
         :param version (VersionNumber): The authorization header containing
@@ -184,6 +328,8 @@ class HttpPushVerifier:
 
         :raises AuthorizationOCPIError: If there is an issue with
           the authorization token.
+
+        :return: The party context.
         """
         if settings.NO_AUTH and authorization == "":
             logger.debug("Authentication skipped due to NO_AUTH setting.")
@@ -197,16 +343,18 @@ class HttpPushVerifier:
                 except UnicodeDecodeError:
                     logger.debug(
                         "Token `%s` cannot be decoded. "
-                        "Check if the token is already encoded." % token
+                        "Check if the token is already encoded.",
+                        token,
                     )
                     raise AuthorizationOCPIError
-            await authenticator.authenticate(token)
+            identity = await authenticate(authenticator, token)
         except IndexError:
             logger.debug(
                 "Token `%s` cannot be split in parts. "
                 "Check if it starts with `Token `"
             )
             raise AuthorizationOCPIError
+        return set_party_context(request, token, version, identity)
 
 
 class WSPushVerifier:
@@ -248,9 +396,10 @@ class WSPushVerifier:
                 except UnicodeDecodeError:
                     logger.debug(
                         "Token `%s` cannot be decoded. "
-                        "Check if the token is already encoded." % token
+                        "Check if the token is already encoded.",
+                        token,
                     )
                     raise AuthorizationOCPIError
-            await authenticator.authenticate(token)
+            await authenticate(authenticator, token)
         except AuthorizationOCPIError:
             raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
@@ -0,0 +1,279 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from py_ocpi.core.enums import ModuleID, RoleEnum
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CachedCrud:
+    """
+    Read-through cache wrapper of a Crud.
+
+    `get` results of the modules having a TTL are cached by
+    (module, role, id, country_code, party_id, token_type, version),
+    misses (None) included for `negative_ttl` seconds. The least recently
+    used entries are evicted above `maxsize`. `create`, `update`,
+    `delete` and the EVSE and connector writes made through the wrapper
+    invalidate the cached entries of the object (the location), other
+    calls are passed to the wrapped crud as is.
+
+    A `get` overlapping the invalidation of its object doesn't store the
+    value it loaded, which may be the version before the write.
+
+    Cached objects are shared between requests and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        crud: Any,
+        ttl: Dict[ModuleID, float],
+        maxsize: int = 10000,
+        negative_ttl: float = 5,
+    ) -> None:
+        """
+        :param crud: Crud class or instance to wrap.
+        :param ttl: Seconds the objects of a module stay cached,
+          modules not listed are not cached.
+        :param maxsize: Maximum amount of cached entries.
+        :param negative_ttl: Seconds a not found object stays cached.
+        """
+        self.__wrapped__ = crud
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Tuple, Tuple[float, Any]] = OrderedDict()
+        # (module, id) -> keys of the cached entries of the object
+        self._object_keys: Dict[Tuple[ModuleID, str], Set[Tuple]] = {}
+        # (module, id) -> [loads in flight, generation] of the objects
+        # being loaded, the generation is bumped by the invalidations
+        self._generations: Dict[Tuple[ModuleID, str], List[int]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__wrapped__, name)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._entries)
+        )
+
+    def cache_clear(self) -> None:
+        self._entries.clear()
+        self._object_keys.clear()
+        for generation in self._generations.values():
+            generation[1] += 1
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, module: ModuleID, id: Optional[Any] = None) -> None:
+        """Drop the cached entries of an object, or of the whole module."""
+        if id is None:
+            object_keys = [key for key in self._object_keys if key[0] == module]
+            loading = [key for key in self._generations if key[0] == module]
+        else:
+            object_keys = [(module, str(id))]
+            loading = object_keys
+        for object_key in object_keys:
+            for key in self._object_keys.pop(object_key, ()):
+                self._entries.pop(key, None)
+        for object_key in loading:
+            generation = self._generations.get(object_key)
+            if generation is not None:
+                generation[1] += 1
+
+    def _pop(self, key: Tuple) -> None:
+        self._entries.pop(key, None)
+        object_keys = self._object_keys.get((key[0], key[2]))
+        if object_keys is not None:
+            object_keys.discard(key)
+            if not object_keys:
+                del self._object_keys[(key[0], key[2])]
+
+    def _lookup(self, key: Tuple) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: Tuple, value: Any) -> None:
+        ttl = self.ttl[key[0]] if value is not None else self.negative_ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        self._object_keys.setdefault((key[0], key[2]), set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._pop(next(iter(self._entries)))
+
+    async def get(
+        self, module: ModuleID, role: RoleEnum, id, *args, **kwargs
+    ) -> Any:
+        if module not in self.ttl:
+            return await self.__wrapped__.get(module, role, id, *args, **kwargs)
+
+        key = (
+            module,
+            role,
+            str(id),
+            kwargs.get("country_code"),
+            kwargs.get("party_id"),
+            kwargs.get("token_type"),
+            kwargs.get("version"),
+        )
+        value = self._lookup(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        object_key = (module, str(id))
+        generation = self._generations.setdefault(object_key, [0, 0])
+        generation[0] += 1
+        started_at = generation[1]
+        try:
+            value = await self.__wrapped__.get(
+                module, role, id, *args, **kwargs
+            )
+        finally:
+            generation[0] -= 1
+            if not generation[0]:
+                del self._generations[object_key]
+        if generation[1] == started_at:
+            self._store(key, value)
+        return value
+
+    async def create(
+        self, module: ModuleID, role: RoleEnum, data: dict, *args, **kwargs
+    ) -> Any:
+        result = await self.__wrapped__.create(
+            module, role, data, *args, **kwargs
+        )
+        if module in self.ttl:
+            id = None
+            if isinstance(data, dict):
+                id = data.get("id", data.get("uid"))
+            self.invalidate(module, id)
+        return result
+
+    async def update(
+        self,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        id: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        result = await self.__wrapped__.update(
+            module, role, data, id, *args, **kwargs
+        )
+        if module in self.ttl:
+            self.invalidate(module, id)
+        return result
+
+    async def delete(
+        self, module: ModuleID, role: RoleEnum, id, *args, **kwargs
+    ):
+        result = await self.__wrapped__.delete(
+            module, role, id, *args, **kwargs
+        )
+        if module in self.ttl:
+            self.invalidate(module, id)
+        return result
+
+    async def update_evse(
+        self,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        location_id: Any,
+        evse_uid: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        result = await self.__wrapped__.update_evse(
+            module, role, data, location_id, evse_uid, *args, **kwargs
+        )
+        if module in self.ttl:
+            self.invalidate(module, location_id)
+        return result
+
+    async def update_connector(
+        self,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        location_id: Any,
+        evse_uid: Any,
+        connector_id: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        result = await self.__wrapped__.update_connector(
+            module,
+            role,
+            data,
+            location_id,
+            evse_uid,
+            connector_id,
+            *args,
+            **kwargs,
+        )
+        if module in self.ttl:
+            self.invalidate(module, location_id)
+        return result
+
+    async def patch_evse(
+        self,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        location_id: Any,
+        evse_uid: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        result = await self.__wrapped__.patch_evse(
+            module, role, data, location_id, evse_uid, *args, **kwargs
+        )
+        if module in self.ttl:
+            self.invalidate(module, location_id)
+        return result
+
+    async def patch_connector(
+        self,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        location_id: Any,
+        evse_uid: Any,
+        connector_id: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        result = await self.__wrapped__.patch_connector(
+            module,
+            role,
+            data,
+            location_id,
+            evse_uid,
+            connector_id,
+            *args,
+            **kwargs,
+        )
+        if module in self.ttl:
+            self.invalidate(module, location_id)
+        return result
@@ -0,0 +1,156 @@
+"""
+Coalescing of the successive pushes of the same object to a receiver.
+"""
+
+import asyncio
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from py_ocpi.core.config import settings, logger
+from py_ocpi.core.outbox import OutboxJob
+
+# (module_id, object_id, endpoints_url)
+CoalescingKey = Tuple[str, str, str]
+
+Flush = Callable[[List[OutboxJob]], Awaitable[None]]
+
+
+class PendingPush(NamedTuple):
+    job: OutboxJob
+    first_at: float
+    send_at: float
+
+
+class PushCoalescer:
+    """
+    Holds the pushes of an object to a receiver for `debounce` seconds,
+    a newer push of the same object replaces the held one and restarts
+    the window. A push is held at most `max_delay` seconds after the
+    first one it replaced, so a receiver is never more stale than that.
+
+    :param debounce (float): Seconds without newer push before sending.
+    :param max_delay (float): Maximum seconds a push is held.
+    :param flush (Flush): Sends the pushes, e.g. `Outbox.enqueue`, the
+      timer is then started by the first push if it isn't running.
+    """
+
+    def __init__(
+        self,
+        debounce: float = settings.PUSH_COALESCE_DEBOUNCE,
+        max_delay: float = settings.PUSH_COALESCE_MAX_DELAY,
+        flush: Optional[Flush] = None,
+    ) -> None:
+        self.debounce = debounce
+        self.max_delay = max(max_delay, debounce)
+        self.submitted = 0
+        self.flushed = 0
+        self._pending: Dict[CoalescingKey, PendingPush] = {}
+        self._flush = flush
+        self._wakeup = asyncio.Event()
+        self._next_send_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._sending: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def submit(self, job: OutboxJob) -> bool:
+        """
+        Hold the push until its window ends, the timer is started if
+        needed.
+
+        :return: True if it replaced a held push of the same object.
+        """
+        self.start()
+        self.submitted += 1
+        now = time.monotonic()
+        key = (job.module_id, job.object_id, job.endpoints_url)
+        pending = self._pending.get(key)
+        if pending is None:
+            send_at = now + self.debounce
+            self._pending[key] = PendingPush(job, now, send_at)
+            if self._next_send_at is None or send_at < self._next_send_at:
+                self._wakeup.set()
+            return False
+
+        send_at = min(now + self.debounce, pending.first_at + self.max_delay)
+        self._pending[key] = PendingPush(job, pending.first_at, send_at)
+        return True
+
+    def start(self, flush: Optional[Flush] = None) -> None:
+        """
+        Start the timer sending the pushes whose window ended.
+
+        :param flush (Flush): Sends the pushes, replaces the one given
+          to the constructor.
+        """
+        if flush is not None:
+            self._flush = flush
+        if self.running or self._flush is None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the timer and send the held pushes right away."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._send(list(self._pending))
+        await asyncio.gather(*self._sending, return_exceptions=True)
+
+    def _send(self, keys: List[CoalescingKey]) -> None:
+        if not keys or self._flush is None:
+            return
+        jobs = [self._pending.pop(key).job for key in keys]
+        self.flushed += len(jobs)
+        # the timer doesn't wait for slow receivers
+        task = asyncio.create_task(self._flush_jobs(jobs))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _flush_jobs(self, jobs: List[OutboxJob]) -> None:
+        try:
+            await self._flush(jobs)  # type: ignore
+        except Exception as e:
+            logger.error("Sending %s coalesced pushes failed: %s", len(jobs), e)
+
+    async def _run(self) -> None:
+        # a single timer for all the held pushes
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+            due = [
+                key
+                for key, pending in self._pending.items()
+                if pending.send_at <= now
+            ]
+            if due:
+                self._send(due)
+                continue
+
+            self._next_send_at = min(
+                (pending.send_at for pending in self._pending.values()),
+                default=None,
+            )
+            timeout = None
+            if self._next_send_at is not None:
+                timeout = self._next_send_at - now
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,43 @@
+from typing import Iterable
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from py_ocpi.core.config import settings
+
+
+class ModulesGZipMiddleware:
+    """
+    gzip compression of the responses of the given OCPI modules.
+
+    Module routes are `/{OCPI_PREFIX}/{role}/{version}/{module}/...`,
+    other routes (versions, push, ...) are sent as is. Streamed responses
+    are compressed and flushed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        modules: Iterable[str],
+        minimum_size: int = 1024,
+        compresslevel: int = 6,
+    ) -> None:
+        self.app = app
+        self.gzip_app = GZipMiddleware(
+            app, minimum_size=minimum_size, compresslevel=compresslevel
+        )
+        self.modules = frozenset(modules)
+
+    def is_eligible(self, path: str) -> bool:
+        parts = path.strip("/").split("/")
+        return (
+            len(parts) >= 4
+            and parts[0] == settings.OCPI_PREFIX
+            and parts[3] in self.modules
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and self.is_eligible(scope["path"]):
+            await self.gzip_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
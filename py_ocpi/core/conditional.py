@@ -0,0 +1,141 @@
+"""
+Conditional GET (ETag / If-None-Match / Last-Modified) helpers.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple, Optional
+
+from fastapi import Request, Response, status as fastapistatus
+from pydantic_core import to_json
+
+from py_ocpi.core import status
+from py_ocpi.core.enums import ModuleID, RoleEnum
+from py_ocpi.core.responses import ocpi_raw_response
+from py_ocpi.core.utils import crud_implements
+
+
+class ObjectVersion(NamedTuple):
+    last_modified: datetime
+    etag: str
+
+
+def _to_datetime(value: Any) -> datetime:
+    if not isinstance(value, datetime):
+        value = str(value)
+        if value.endswith("Z"):
+            value = f"{value[:-1]}+00:00"
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def make_object_version(last_updated: Any, content: bytes) -> ObjectVersion:
+    """
+    Build the version of an object.
+
+    :param last_updated: last_updated of the object.
+    :param content: Serialized object or its version given by the crud.
+
+    :return: Last-Modified datetime and strong ETag of the object.
+    """
+    last_modified = _to_datetime(last_updated)
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    return ObjectVersion(
+        last_modified,
+        f'"{int(last_modified.timestamp()):x}-{digest}"',
+    )
+
+
+async def get_object_version(
+    crud, module: ModuleID, role: RoleEnum, id, *args, **kwargs
+) -> Optional[ObjectVersion]:
+    """
+    Return the object version given by `crud.get_version`,
+    None if the crud doesn't implement it or the object is not found.
+    """
+    if not crud_implements(crud, "get_version"):
+        return None
+    current_version = await crud.get_version(module, role, id, *args, **kwargs)
+    if current_version is None:
+        return None
+    last_updated, version = current_version
+    return make_object_version(last_updated, str(version).encode())
+
+
+def is_not_modified(
+    request: Request, object_version: Optional[ObjectVersion]
+) -> bool:
+    """Return True if the client already has this version of the object."""
+    if object_version is None:
+        return False
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        etags = [
+            etag.strip().removeprefix("W/") for etag in if_none_match.split(",")
+        ]
+        return object_version.etag in etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            # `-0000` zone, i.e. UTC
+            since = since.replace(tzinfo=timezone.utc)
+        return object_version.last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def _version_headers(object_version: ObjectVersion) -> dict:
+    return {
+        "ETag": object_version.etag,
+        "Last-Modified": format_datetime(
+            object_version.last_modified.astimezone(timezone.utc),
+            usegmt=True,
+        ),
+    }
+
+
+def not_modified_response(object_version: ObjectVersion) -> Response:
+    return Response(
+        status_code=fastapistatus.HTTP_304_NOT_MODIFIED,
+        headers=_version_headers(object_version),
+    )
+
+
+def conditional_response(
+    request: Request,
+    obj: Any,
+    object_version: Optional[ObjectVersion] = None,
+) -> Response:
+    """
+    Build the successful response of a single object GET
+    with its ETag and Last-Modified headers.
+
+    :param request: The request, checked for If-None-Match
+      and If-Modified-Since headers.
+    :param obj: The adapted object, having `last_updated`.
+    :param object_version: The version given by the crud if any,
+      otherwise it is derived from the object.
+
+    :return: 304 Not Modified response if the client has this version
+      of the object, the OCPI response otherwise.
+    """
+    content = to_json(obj)
+    if object_version is None:
+        object_version = make_object_version(obj.last_updated, content)
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
+    return ocpi_raw_response(
+        b"[" + content + b"]",
+        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        headers=_version_headers(object_version),
+    )
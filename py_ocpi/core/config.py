@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Dict, List, Union
 
 from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,6 +13,8 @@ class Settings(BaseSettings):
     )
 
     ENVIRONMENT: str = "production"
+    LOG_JSON: bool = False
+    LOG_QUEUE: bool = False
     NO_AUTH: bool = False
     PROJECT_NAME: str = "OCPI"
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
@@ -23,9 +25,42 @@ class Settings(BaseSettings):
     PARTY_ID: str = "NON"
     PROTOCOL: str = "https"
     COMMAND_AWAIT_TIME: int = 5
+    COMMAND_RESULT_POLLING: bool = True
     GET_ACTIVE_PROFILE_AWAIT_TIME: int = 5
+    JOB_WORKERS: int = 10
+    JOB_MAX_QUEUED: int = 1000
+    JOB_TYPE_LIMITS: Dict[str, int] = {}
+    JOB_DRAIN_TIMEOUT: float = 10
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30
+    HTTP_CLIENT_TIMEOUT: float = 10
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 5
+    HTTP_CLIENT_HTTP2: bool = False
+    PUSH_CONCURRENCY: int = 20
+    PUSH_RECEIVER_TIMEOUT: float = 30
+    PARTNER_ENDPOINTS_TTL: float = 3600
+    OUTBOX_DB_PATH: Union[str, None] = None
+    OUTBOX_WORKERS: int = 10
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_BACKOFF_BASE: float = 1
+    OUTBOX_BACKOFF_MAX: float = 300
+    OUTBOX_POLL_INTERVAL: float = 1
+    PUSH_COALESCE_DEBOUNCE: float = 0
+    PUSH_COALESCE_MAX_DELAY: float = 5
+    PUSH_PATCH: bool = False
+    PUSH_PATCH_MAX_OBJECTS: int = 10000
+    PUSH_WS_MAX_IN_FLIGHT: int = 100
     TRAILING_SLASH: bool = True
     CI_STRING_LOWERCASE_PREFERENCE: bool = True
+    CURSOR_PAGINATION: bool = False
+    AUTH_TOKEN_CACHE_TTL: float = 0
+    AUTH_TOKEN_CACHE_MAX_SIZE: int = 1000
+    CRUD_CACHE_MAX_SIZE: int = 10000
+    CRUD_CACHE_NEGATIVE_TTL: float = 5
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESS_LEVEL: int = 6
+    GZIP_MODULES: List[str] = []
 
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
@@ -41,5 +76,10 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-logging_config = LoggingConfig(settings.ENVIRONMENT, logger)
+logging_config = LoggingConfig(
+    settings.ENVIRONMENT,
+    logger,
+    json_format=settings.LOG_JSON,
+    use_queue=settings.LOG_QUEUE,
+)
 logging_config.configure_logger()
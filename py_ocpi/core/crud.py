@@ -1,4 +1,4 @@
-from typing import Any, Tuple, Optional
+from typing import Any, AsyncIterator, List, Tuple, Optional
 from abc import ABC, abstractmethod
 
 from py_ocpi.core.enums import ModuleID, RoleEnum, Action
@@ -17,6 +17,8 @@ class Crud(ABC):
 
         :keyword auth_token: (str) The authentication token used by a third
             party
+        :keyword party_context: (PartyContext) The authenticated caller,
+            token and identity returned by the authenticator
         :keyword version: (VersionNumber) The version number of the caller
             OCPI module
         :keyword party_id: (CiString(3))  The requested party ID
@@ -38,6 +40,206 @@ class Crud(ABC):
         """
         pass
 
+    async def get_version(
+        cls, module: ModuleID, role: RoleEnum, id, *args, **kwargs
+    ) -> Optional[Tuple[Any, str]]:
+        """Get the current version of an object (optional)
+
+        Implement it with a cheap query (e.g. last_updated and a row
+        version column) to answer conditional GET requests with
+        `304 Not Modified` without loading the object. The version must
+        change whenever the object changes. When it is not implemented
+        the ETag is derived from the loaded object.
+
+        :param module: The OCPI module
+        :param role: The role of the caller
+        :param id: The ID of the object
+
+        :keyword auth_token: (str) The authentication token used by a third
+            party
+        :keyword party_context: (PartyContext) The authenticated caller,
+            token and identity returned by the authenticator
+        :keyword version: (VersionNumber) The version number of the caller
+            OCPI module
+        :keyword party_id: (CiString(3))  The requested party ID
+        :keyword country_code: (CiString(2)) The requested Country code
+
+        :return: last_updated of the object and its version, or None if
+            the object is not found
+        :rtype: Optional[Tuple[Any, str]]
+        """
+        raise NotImplementedError
+
+    async def get_many(
+        cls, module: ModuleID, role: RoleEnum, ids: List[str], *args, **kwargs
+    ) -> List[Any]:
+        """Get several objects at once (optional)
+
+        Implement it with a single query to load the objects of a batch
+        push. When it is not implemented the objects are loaded with `get`
+        one by one.
+
+        :param module: The OCPI module
+        :param role: The role of the caller
+        :param ids: The IDs of the objects
+
+        :keyword auth_token: (str) The authentication token used by a third
+            party
+        :keyword version: (VersionNumber) The version number of the caller
+            OCPI module
+
+        :return: The objects data in the order of the IDs, None for the
+            objects which are not found
+        :rtype: List[Any]
+        """
+        raise NotImplementedError
+
+    async def get_results(
+        cls, module: ModuleID, role: RoleEnum, requests: List[dict]
+    ) -> List[Any]:
+        """Get the results of several pending operations at once (optional)
+
+        Implement it with a single query to poll the results of the
+        commands and charging profile requests waiting for the Charge
+        Point. When it is not implemented `get` is called for each of them
+        with id 0 and the keyword arguments of the request.
+
+        :param module: The OCPI module, `commands` or `hubclientinfo` for
+            charging profiles
+        :param role: The role of the caller
+        :param requests: The keyword arguments `get` would be called with,
+            e.g. `response_url`, `auth_token` and `version`
+
+        :return: The results in the order of the requests, None for the
+            operations which are still pending
+        :rtype: List[Any]
+        """
+        raise NotImplementedError
+
+    async def update_evse(
+        cls,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        location_id: Any,
+        evse_uid: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        """Add or update an EVSE of a location (optional)
+
+        Implement it to write the EVSE alone. When it is not implemented
+        the location is loaded, its EVSE replaced and the whole location
+        is written with `update`.
+
+        :param module: The OCPI module
+        :param role: The role of the caller
+        :param data: The EVSE details
+        :param location_id: The ID of the location
+        :param evse_uid: The UID of the EVSE
+
+        :keyword auth_token: (str) The authentication token used by a third
+            party
+        :keyword party_context: (PartyContext) The authenticated caller,
+            token and identity returned by the authenticator
+        :keyword version: (VersionNumber) The version number of the caller
+            OCPI module
+        :keyword party_id: (CiString(3))  The requested party ID
+        :keyword country_code: (CiString(2)) The requested Country code
+
+        :return: The EVSE data, None if the location is not found
+        :rtype: Any
+        """
+        raise NotImplementedError
+
+    async def update_connector(
+        cls,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        location_id: Any,
+        evse_uid: Any,
+        connector_id: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        """Add or update a connector of an EVSE (optional)
+
+        Implement it to write the connector alone, see `update_evse`.
+
+        :param module: The OCPI module
+        :param role: The role of the caller
+        :param data: The connector details
+        :param location_id: The ID of the location
+        :param evse_uid: The UID of the EVSE
+        :param connector_id: The ID of the connector
+
+        :keyword: The keywords of `update_evse`
+
+        :return: The connector data, None if the location or the EVSE is
+            not found
+        :rtype: Any
+        """
+        raise NotImplementedError
+
+    async def patch_evse(
+        cls,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        location_id: Any,
+        evse_uid: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        """Update some fields of an EVSE (optional)
+
+        Implement it to write the changed fields alone, see `update_evse`.
+
+        :param module: The OCPI module
+        :param role: The role of the caller
+        :param data: The changed fields of the EVSE
+        :param location_id: The ID of the location
+        :param evse_uid: The UID of the EVSE
+
+        :keyword: The keywords of `update_evse`
+
+        :return: The updated EVSE in the OCPI format of the version, None
+            if the location or the EVSE is not found
+        :rtype: Any
+        """
+        raise NotImplementedError
+
+    async def patch_connector(
+        cls,
+        module: ModuleID,
+        role: RoleEnum,
+        data: dict,
+        location_id: Any,
+        evse_uid: Any,
+        connector_id: Any,
+        *args,
+        **kwargs,
+    ) -> Any:
+        """Update some fields of a connector (optional)
+
+        Implement it to write the changed fields alone, see `update_evse`.
+
+        :param module: The OCPI module
+        :param role: The role of the caller
+        :param data: The changed fields of the connector
+        :param location_id: The ID of the location
+        :param evse_uid: The UID of the EVSE
+        :param connector_id: The ID of the connector
+
+        :keyword: The keywords of `update_evse`
+
+        :return: The updated connector in the OCPI format of the version,
+            None if the location, the EVSE or the connector is not found
+        :rtype: Any
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list(
         cls, module: ModuleID, role: RoleEnum, filters: dict, *args, **kwargs
@@ -46,10 +248,16 @@ class Crud(ABC):
 
         :param module: The OCPI module
         :param role: The role of the caller
-        :param filters: OCPI pagination filters
+        :param filters: OCPI pagination filters, with `cursor` holding
+            the `last_updated` and `id` of the last object of the previous
+            page when the partner follows a cursor Link (CURSOR_PAGINATION);
+            objects must then be ordered by (last_updated, id) and start
+            after the cursor, instead of skipping `offset` objects
 
         :keyword auth_token: (str) The authentication token used by a third
             party
+        :keyword party_context: (PartyContext) The authenticated caller,
+            token and identity returned by the authenticator
         :keyword version: (VersionNumber) The version number of the caller
             OCPI module
         :keyword party_id: (CiString(3))  The requested party ID
@@ -61,6 +269,37 @@ class Crud(ABC):
         """
         pass
 
+    async def iter_list(
+        cls, module: ModuleID, role: RoleEnum, filters: dict, *args, **kwargs
+    ) -> Tuple[AsyncIterator[Any], int, bool]:
+        """Get the list of objects as an async iterator (optional)
+
+        Implement it to stream list responses: objects are adapted and
+        written to the response one by one as the iterator yields them,
+        instead of loading the whole page. When it is not implemented
+        `list` is used.
+
+        :param module: The OCPI module
+        :param role: The role of the caller
+        :param filters: OCPI pagination filters, see `list`
+
+        :keyword auth_token: (str) The authentication token used by a third
+            party
+        :keyword party_context: (PartyContext) The authenticated caller,
+            token and identity returned by the authenticator
+        :keyword version: (VersionNumber) The version number of the caller
+            OCPI module
+        :keyword party_id: (CiString(3))  The requested party ID
+        :keyword country_code: (CiString(2)) The requested Country code
+
+        :return: Objects async iterator (e.g. an async generator), Total
+            number of objects, if it's the last page or not(for pagination)
+            and optionally (last_updated, id) of the last object of the page
+            to build the next cursor (CURSOR_PAGINATION)
+        :rtype: Tuple[AsyncIterator[Any], int, bool]
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def create(
         cls, module: ModuleID, role: RoleEnum, data: dict, *args, **kwargs
@@ -105,6 +344,8 @@ class Crud(ABC):
 
         :keyword auth_token: (str) The authentication token used by a third
             party
+        :keyword party_context: (PartyContext) The authenticated caller,
+            token and identity returned by the authenticator
         :keyword version: (VersionNumber) The version number of the caller
             OCPI module
         :keyword party_id: (CiString(3))  The requested party ID
@@ -129,6 +370,8 @@ class Crud(ABC):
 
         :keyword auth_token: (str) The authentication token used by a third
             party
+        :keyword party_context: (PartyContext) The authenticated caller,
+            token and identity returned by the authenticator
         :keyword version: (VersionNumber) The version number of the caller
             OCPI module
         """
@@ -153,6 +396,8 @@ class Crud(ABC):
 
         :keyword auth_token: (str) The authentication token used by a third
             party
+        :keyword party_context: (PartyContext) The authenticated caller,
+            token and identity returned by the authenticator
         :keyword version: (VersionNumber) The version number of the caller
             OCPI module
         :keyword response_url: (str) Response url for actions which require
@@ -1,14 +1,82 @@
 """
 OCPI data types based on https://github.com/ocpi/ocpi/blob/2.2.1/types.asciidoc
+
+The types are backed by native pydantic-core schemas, so valid values are
+checked without calling back into Python. Python validators are only reached
+on the error path, to keep the historical error messages.
 """
 
-from datetime import datetime, timezone
-from typing import Any, Type
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
 from .config import settings
 
+ASCII_PATTERN = r"^[\x00-\x7F]*$"
+
+# Parameterized string types, keyed by (base type, max_length)
+_STRING_TYPES: Dict[Tuple[type, int], type] = {}
+
+
+def _parameterized_string(name: str, base: type, max_length: int) -> type:
+    """Return the cached `base` subclass for the given max_length."""
+    key = (base, max_length)
+    string_type = _STRING_TYPES.get(key)
+    if string_type is None:
+        string_type = type(name, (base,), {"max_length": max_length})
+        _STRING_TYPES[key] = string_type
+    return string_type
+
+
+def _value_error_schema(
+    schema: core_schema.CoreSchema, message: str
+) -> core_schema.CoreSchema:
+    """Replace errors of the given schema with a `value_error`."""
+    return core_schema.custom_error_schema(
+        schema,
+        custom_error_type="value_error",
+        custom_error_context={"error": message},
+    )
+
+
+def _with_fallback_schema(
+    schema: core_schema.CoreSchema,
+    fallback: Callable[[Any], Any],
+    serialization: Optional[core_schema.SerSchema] = None,
+) -> core_schema.CoreSchema:
+    """
+    Validate with the native schema first and call the python fallback
+    only when it fails. The fallback is expected to either accept the value
+    or raise a TypeError, which is propagated as is.
+    """
+    return core_schema.union_schema(
+        [schema, core_schema.no_info_plain_validator_function(fallback)],
+        mode="left_to_right",
+        serialization=serialization,
+    )
+
+
+def _string_type_schema() -> core_schema.CoreSchema:
+    def raise_type_error(v: Any) -> None:
+        raise TypeError(f"excpected string but received {type(v)}")
+
+    return _with_fallback_schema(
+        core_schema.str_schema(strict=True), raise_type_error
+    )
+
+
+def _utf8_string_schema(max_length: int, message: str) -> list:
+    return [
+        _string_type_schema(),
+        _value_error_schema(
+            core_schema.str_schema(min_length=0), "invalid string format"
+        ),
+        _value_error_schema(
+            core_schema.str_schema(max_length=max_length), message
+        ),
+    ]
+
 
 class StringBase(str):
     """
@@ -23,17 +91,18 @@ class StringBase(str):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.with_info_plain_validator_function(
-            cls.validate_with_info,
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda x: str(x)
+        return core_schema.no_info_after_validator_function(
+            cls,
+            core_schema.chain_schema(
+                _utf8_string_schema(
+                    cls.max_length,
+                    "string length must be lower or equal to "
+                    f"{cls.max_length}",
+                )
             ),
+            serialization=core_schema.plain_serializer_function_ser_schema(str),
         )
 
-    @classmethod
-    def validate_with_info(cls, v: Any, _info: Any) -> "StringBase":
-        return cls.validate(v)
-
     @classmethod
     def validate(cls, v: str) -> "StringBase":
         if not isinstance(v, str):
@@ -54,7 +123,7 @@ class StringBase(str):
 
 class String:
     def __new__(cls, max_length: int = 255) -> Type[str]:  # type: ignore
-        return type("String", (StringBase,), {"max_length": max_length})
+        return _parameterized_string("String", StringBase, max_length)
 
 
 class CiStringBase(str):
@@ -70,17 +139,31 @@ class CiStringBase(str):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.with_info_plain_validator_function(
-            cls.validate_with_info,
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda x: str(x)
+        def normalize_case(v: str) -> "CiStringBase":
+            # the preference is read on every validation
+            if settings.CI_STRING_LOWERCASE_PREFERENCE:
+                return cls(v.lower())
+            return cls(v.upper())
+
+        return core_schema.no_info_after_validator_function(
+            normalize_case,
+            core_schema.chain_schema(
+                [
+                    _string_type_schema(),
+                    _value_error_schema(
+                        core_schema.str_schema(pattern=ASCII_PATTERN),
+                        "invalid cistring format",
+                    ),
+                    _value_error_schema(
+                        core_schema.str_schema(max_length=cls.max_length),
+                        "cistring length must be lower or equal to "
+                        f"{cls.max_length}",
+                    ),
+                ]
             ),
+            serialization=core_schema.plain_serializer_function_ser_schema(str),
         )
 
-    @classmethod
-    def validate_with_info(cls, v: Any, _info: Any) -> "CiStringBase":
-        return cls.validate(v)
-
     @classmethod
     def validate(cls, v: str) -> "CiStringBase":
         if not isinstance(v, str):
@@ -103,7 +186,7 @@ class CiStringBase(str):
 
 class CiString:
     def __new__(cls, max_length: int = 255) -> type:  # type: ignore
-        return type("CiString", (CiStringBase,), {"max_length": max_length})
+        return _parameterized_string("CiString", CiStringBase, max_length)
 
 
 class URL(str):
@@ -116,21 +199,18 @@ class URL(str):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.with_info_plain_validator_function(
-            cls.validate_with_info,
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda x: str(x)
+        return core_schema.no_info_after_validator_function(
+            cls,
+            core_schema.chain_schema(
+                _utf8_string_schema(
+                    255, "url length must be lower or equal to 255"
+                )
             ),
+            serialization=core_schema.plain_serializer_function_ser_schema(str),
         )
 
-    @classmethod
-    def validate_with_info(cls, v: Any, _info: Any) -> "URL":
-        return cls.validate(v)
-
     @classmethod
     def validate(cls, v: str) -> "URL":
-        # Use StringBase validation directly
-        StringType = String(255)
         if not isinstance(v, str):
             raise TypeError(f"excpected string but received {type(v)}")
         try:
@@ -158,17 +238,13 @@ class DateTime(str):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.with_info_plain_validator_function(
-            cls.validate_with_info,
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda x: str(x)
-            ),
+        # Normalization relies on `datetime.fromisoformat`,
+        # which has no native pydantic-core equivalent.
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(str),
         )
 
-    @classmethod
-    def validate_with_info(cls, v: Any, _info: Any) -> "DateTime":
-        return cls.validate(v)
-
     @classmethod
     def validate(cls, v: str) -> "DateTime":
         if v.endswith("Z"):
@@ -192,17 +268,28 @@ class DisplayText(dict):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.with_info_plain_validator_function(
-            cls.validate_with_info,
+        return _with_fallback_schema(
+            core_schema.no_info_after_validator_function(
+                cls,
+                core_schema.typed_dict_schema(
+                    {
+                        "language": core_schema.typed_dict_field(
+                            core_schema.any_schema()
+                        ),
+                        "text": core_schema.typed_dict_field(
+                            core_schema.str_schema(max_length=512, strict=True)
+                        ),
+                    },
+                    extra_behavior="allow",
+                    strict=True,
+                ),
+            ),
+            cls.validate,
             serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda x: dict(x)
+                dict
             ),
         )
 
-    @classmethod
-    def validate_with_info(cls, v: Any, _info: Any) -> "DisplayText":
-        return cls.validate(v)
-
     @classmethod
     def validate(cls, v: dict) -> "DisplayText":
         if not isinstance(v, dict):
@@ -224,17 +311,16 @@ class Number(float):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.with_info_plain_validator_function(
-            cls.validate_with_info,
+        return _with_fallback_schema(
+            core_schema.no_info_after_validator_function(
+                cls, core_schema.float_schema(strict=True)
+            ),
+            cls.validate,
             serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda x: float(x)
+                float
             ),
         )
 
-    @classmethod
-    def validate_with_info(cls, v: Any, _info: Any) -> "Number":
-        return cls.validate(v)
-
     @classmethod
     def validate(cls, v: float | int) -> "Number":
         if not any([isinstance(v, float), isinstance(v, int)]):
@@ -250,17 +336,25 @@ class Price(dict):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.with_info_plain_validator_function(
-            cls.validate_with_info,
+        return _with_fallback_schema(
+            core_schema.no_info_after_validator_function(
+                cls,
+                core_schema.typed_dict_schema(
+                    {
+                        "excl_vat": core_schema.typed_dict_field(
+                            core_schema.any_schema()
+                        ),
+                    },
+                    extra_behavior="allow",
+                    strict=True,
+                ),
+            ),
+            cls.validate,
             serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda x: dict(x)
+                dict
             ),
         )
 
-    @classmethod
-    def validate_with_info(cls, v: Any, _info: Any) -> "Price":
-        return cls.validate(v)
-
     @classmethod
     def validate(cls, v: dict) -> "Price":
         if not isinstance(v, dict):
@@ -1,12 +1,19 @@
 from datetime import datetime
+from typing import Optional
 
-from fastapi import Query
+import httpx
+from fastapi import HTTPException, Query, status as fastapistatus
+from fastapi.requests import HTTPConnection
 
 from py_ocpi.core.adapter import Adapter
 from py_ocpi.core.authentication.authenticator import Authenticator
+from py_ocpi.core.coalescing import PushCoalescer
 from py_ocpi.core.config import settings
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.data_types import URL
+from py_ocpi.core.http_client import get_app_http_client
+from py_ocpi.core.outbox import Outbox
+from py_ocpi.core.utils import decode_cursor
 from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.modules.versions.schemas import Version
 
@@ -23,6 +30,18 @@ def get_authenticator():
     return Authenticator
 
 
+def get_http_client(connection: HTTPConnection) -> httpx.AsyncClient:
+    return get_app_http_client(connection.app)
+
+
+def get_outbox(connection: HTTPConnection) -> Optional[Outbox]:
+    return getattr(connection.app.state, "outbox", None)
+
+
+def get_push_coalescer(connection: HTTPConnection) -> Optional[PushCoalescer]:
+    return getattr(connection.app.state, "push_coalescer", None)
+
+
 def get_versions():
     return [
         Version(
@@ -48,10 +67,19 @@ def pagination_filters(
     date_to: datetime = Query(default=None),
     offset: int = Query(default=0),
     limit: int = Query(default=50),
+    cursor: str = Query(default=None),
 ):
+    if cursor is not None:
+        try:
+            cursor = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                fastapistatus.HTTP_400_BAD_REQUEST, "Invalid cursor"
+            )
     return {
         "date_from": date_from,
         "date_to": date_to,
         "offset": offset,
         "limit": limit,
+        "cursor": cursor,
     }
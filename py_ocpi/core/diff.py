@@ -0,0 +1,238 @@
+"""
+Diff of the objects pushed to the receivers, to send OCPI PATCH requests
+of the changed fields instead of whole objects.
+"""
+
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from py_ocpi.core.config import settings
+from py_ocpi.core.enums import ModuleID
+
+PATCHABLE_MODULES = (ModuleID.locations, ModuleID.sessions)
+
+
+class ObjectPatch(NamedTuple):
+    """
+    :param path (str): Appended to the url of the object, e.g.
+      `/{evse_uid}/{connector_id}` to patch a connector of a location.
+    :param data (dict): The changed fields with `last_updated`.
+    """
+
+    path: str
+    data: dict
+
+
+def changed_fields(
+    previous: dict, current: dict, exclude: Iterable[str] = ()
+) -> Optional[dict]:
+    """
+    Return the fields of current different from previous, None if a
+    field was removed or unset as PATCH can't remove fields.
+    """
+    changed = {}
+    for key, value in current.items():
+        if key in exclude:
+            continue
+        previous_value = previous.get(key)
+        if previous_value == value:
+            continue
+        if value is None:
+            return None
+        changed[key] = value
+    if any(key not in current for key in previous if key not in exclude):
+        return None
+    return changed
+
+
+def changed_items(
+    previous: List[dict], current: List[dict], key: str
+) -> Optional[List[Tuple[dict, dict]]]:
+    """
+    Return the (previous, current) pairs of the changed items of a list,
+    None if items were added, removed or reordered.
+    """
+    if [item.get(key) for item in previous] != [
+        item.get(key) for item in current
+    ]:
+        return None
+    return [
+        (previous_item, item)
+        for previous_item, item in zip(previous, current)
+        if previous_item != item
+    ]
+
+
+def evse_patch(previous: dict, current: dict) -> Optional[ObjectPatch]:
+    fields = changed_fields(previous, current, exclude=("connectors",))
+    connectors = changed_items(
+        previous.get("connectors") or [], current.get("connectors") or [], "id"
+    )
+    if fields is None or connectors is None:
+        return None
+    fields.pop("last_updated", None)
+
+    if not fields and len(connectors) == 1:
+        previous_connector, connector = connectors[0]
+        connector_fields = changed_fields(previous_connector, connector)
+        if connector_fields is not None:
+            connector_fields["last_updated"] = connector["last_updated"]
+            return ObjectPatch(f"/{connector['id']}", connector_fields)
+
+    if connectors:
+        fields["connectors"] = current["connectors"]
+    fields["last_updated"] = current["last_updated"]
+    return ObjectPatch("", fields)
+
+
+def location_patch(previous: dict, current: dict) -> Optional[ObjectPatch]:
+    """
+    Return the PATCH of the narrowest target carrying all the changes:
+    a connector, an EVSE or the location.
+    """
+    fields = changed_fields(previous, current, exclude=("evses",))
+    evses = changed_items(
+        previous.get("evses") or [], current.get("evses") or [], "uid"
+    )
+    if fields is None or evses is None:
+        return None
+    fields.pop("last_updated", None)
+
+    if not fields and len(evses) == 1:
+        previous_evse, evse = evses[0]
+        patch = evse_patch(previous_evse, evse)
+        if patch is not None:
+            return ObjectPatch(f"/{evse['uid']}{patch.path}", patch.data)
+
+    if evses:
+        fields["evses"] = current["evses"]
+    fields["last_updated"] = current["last_updated"]
+    return ObjectPatch("", fields)
+
+
+def session_patch(previous: dict, current: dict) -> Optional[ObjectPatch]:
+    fields = changed_fields(previous, current, exclude=("charging_periods",))
+    if fields is None:
+        return None
+
+    # charging periods of a PATCH are appended to the ones of the receiver
+    previous_periods = previous.get("charging_periods") or []
+    periods = current.get("charging_periods") or []
+    if periods[: len(previous_periods)] != previous_periods:
+        return None
+    if len(periods) > len(previous_periods):
+        fields["charging_periods"] = periods[
+            len(previous_periods) :  # noqa: E203
+        ]
+
+    fields["last_updated"] = current["last_updated"]
+    return ObjectPatch("", fields)
+
+
+class SentObjects:
+    """
+    Last version of the locations and sessions accepted by each receiver,
+    the least recently pushed objects are evicted first. An object is
+    sent to a receiver one request at a time (`sending`), so the PATCH
+    is built from the version the receiver holds.
+
+    :param maxsize (int): Maximum amount of kept (receiver, object).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._objects: OrderedDict[Tuple[str, str, str], dict] = OrderedDict()
+        # (receiver, object) -> lock and amount of its users
+        self._locks: Dict[Tuple[str, str, str], list] = {}
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @asynccontextmanager
+    async def sending(
+        self, receiver_url: str, module_id: ModuleID, object_id: str
+    ) -> AsyncIterator[None]:
+        """Wait for the previous sends of the object to the receiver."""
+        key = (str(receiver_url), module_id.value, object_id)
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[key]
+
+    def patch(
+        self,
+        receiver_url: str,
+        module_id: ModuleID,
+        object_id: str,
+        data: dict,
+    ) -> Optional[ObjectPatch]:
+        """
+        Return the PATCH of the changes since the version the receiver
+        accepted last, None if the object has to be sent whole.
+        """
+        previous = self._objects.get(
+            (str(receiver_url), module_id.value, object_id)
+        )
+        if previous is None or previous == data:
+            return None
+        if module_id == ModuleID.locations:
+            return location_patch(previous, data)
+        return session_patch(previous, data)
+
+    def set(
+        self,
+        receiver_url: str,
+        module_id: ModuleID,
+        object_id: str,
+        data: dict,
+    ) -> None:
+        if module_id not in PATCHABLE_MODULES or self.maxsize <= 0:
+            return
+        key = (str(receiver_url), module_id.value, object_id)
+        self._objects[key] = data
+        self._objects.move_to_end(key)
+        while len(self._objects) > self.maxsize:
+            self._objects.popitem(last=False)
+
+    def invalidate(
+        self,
+        receiver_url: Optional[str] = None,
+        module_id: Optional[ModuleID] = None,
+        object_id: Optional[str] = None,
+    ) -> None:
+        """
+        Forget an object sent to a receiver, every object of the receiver
+        if only its url is given, or everything.
+        """
+        if receiver_url is None:
+            self._objects.clear()
+            return
+        if module_id is not None and object_id is not None:
+            self._objects.pop(
+                (str(receiver_url), module_id.value, object_id), None
+            )
+            return
+        for key in [
+            key for key in self._objects if key[0] == str(receiver_url)
+        ]:
+            del self._objects[key]
+
+
+sent_objects = SentObjects(maxsize=settings.PUSH_PATCH_MAX_OBJECTS)
@@ -0,0 +1,42 @@
+"""
+Application-scoped HTTP client used for the requests sent to other parties.
+"""
+
+import httpx
+from fastapi import FastAPI
+
+from py_ocpi.core.config import settings
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled client with the limits and timeouts of the settings.
+
+    HTTP/2 requires the `h2` package (`pip install httpx[http2]`).
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.HTTP_CLIENT_TIMEOUT,
+            connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT,
+        ),
+        http2=settings.HTTP_CLIENT_HTTP2,
+    )
+
+
+def get_app_http_client(app: FastAPI) -> httpx.AsyncClient:
+    """
+    Return the client of the application, created on first use
+    if the lifespan didn't run (e.g. TestClient without `with`).
+    """
+    client = getattr(app.state, "http_client", None)
+    if client is None or client.is_closed:
+        client = create_http_client()
+        app.state.http_client = client
+    return client
@@ -0,0 +1,203 @@
+"""
+Bounded executor of the background jobs, e.g. sending the results of the
+commands and charging profile requests to the partners.
+"""
+
+import asyncio
+from collections import Counter, defaultdict, deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from py_ocpi.core.config import settings, logger
+
+
+class Job(NamedTuple):
+    job_type: str
+    func: Callable[..., Awaitable[Any]]
+    args: tuple
+    kwargs: dict
+
+
+class JobStats(NamedTuple):
+    """
+    :param queued (int): Jobs waiting for a worker.
+    :param running (int): Jobs being run.
+    :param succeeded (int): Jobs run since the start.
+    :param failed (int): Jobs which raised an exception since the start.
+    :param rejected (int): Jobs refused as the queue was full.
+    """
+
+    queued: int
+    running: int
+    succeeded: int
+    failed: int
+    rejected: int
+
+
+class JobExecutor:
+    """
+    Runs the background jobs with `workers` tasks. At most `max_queued`
+    jobs wait for a worker, newer jobs are rejected. The jobs of a type
+    running at once are capped by `type_limits`, the workers run the jobs
+    of the other types meanwhile.
+
+    :param workers (int): Amount of workers.
+    :param max_queued (int): Maximum amount of jobs waiting for a worker.
+    :param type_limits (Dict[str, int]): Maximum amount of running jobs
+      by type, e.g. `{"commands": 5}`.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.JOB_WORKERS,
+        max_queued: int = settings.JOB_MAX_QUEUED,
+        type_limits: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.workers = workers
+        self.max_queued = max_queued
+        self.type_limits = dict(
+            settings.JOB_TYPE_LIMITS if type_limits is None else type_limits
+        )
+        self._queues: Dict[str, Deque[Job]] = {}
+        self._queued = 0
+        self._running: Counter = Counter()
+        self._counts: Dict[str, Counter] = defaultdict(Counter)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def submit(
+        self,
+        job_type: str,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> bool:
+        """
+        Queue `func(*args, **kwargs)`, the workers are started if needed.
+
+        :param job_type (str): The type of the job, e.g. `commands`.
+
+        :return: False if the job was rejected as the queue is full.
+        """
+        self.start()
+        if self._queued >= self.max_queued or self._stopping:
+            self._counts[job_type]["rejected"] += 1
+            logger.warning("Job queue is full, `%s` job rejected.", job_type)
+            return False
+        queue = self._queues.setdefault(job_type, deque())
+        queue.append(Job(job_type, func, args, kwargs))
+        self._queued += 1
+        self._wakeup.set()
+        return True
+
+    def start(self) -> None:
+        """Start the workers."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # tasks of another event loop can't be awaited
+            self._loop = loop
+            self._tasks = []
+            self._queues.clear()
+            self._queued = 0
+            self._running.clear()
+            self._wakeup = asyncio.Event()
+        if self.running:
+            return
+        self._stopping = False
+        self._tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self, timeout: float = settings.JOB_DRAIN_TIMEOUT) -> None:
+        """
+        Reject new jobs and give the queued and running ones `timeout`
+        seconds to finish, the remaining ones are cancelled.
+        """
+        if not self.running or self._loop is not asyncio.get_running_loop():
+            return
+        self._stopping = True
+        self._wakeup.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if pending:
+            logger.warning(
+                "%s jobs were cancelled and %s queued jobs dropped on "
+                "shutdown.",
+                len(pending),
+                self._queued,
+            )
+        self._queues.clear()
+        self._queued = 0
+        self._tasks = []
+        self._stopping = False
+
+    def stats(self, job_type: Optional[str] = None) -> JobStats:
+        """Return the stats of the jobs of a type, or of all the jobs."""
+        job_types = [job_type] if job_type is not None else self._job_types()
+        return JobStats(
+            queued=sum(len(self._queues.get(t, ())) for t in job_types),
+            running=sum(self._running[t] for t in job_types),
+            succeeded=sum(self._counts[t]["succeeded"] for t in job_types),
+            failed=sum(self._counts[t]["failed"] for t in job_types),
+            rejected=sum(self._counts[t]["rejected"] for t in job_types),
+        )
+
+    def _job_types(self) -> List[str]:
+        return list({*self._queues, *self._running, *self._counts})
+
+    def _next_job(self) -> Optional[Job]:
+        for job_type, queue in self._queues.items():
+            limit = self.type_limits.get(job_type)
+            if queue and (limit is None or self._running[job_type] < limit):
+                # the types take turns
+                del self._queues[job_type]
+                self._queues[job_type] = queue
+                self._queued -= 1
+                return queue.popleft()
+        return None
+
+    async def _work(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                if self._stopping and not self._queued:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            self._running[job.job_type] += 1
+            try:
+                await job.func(*job.args, **job.kwargs)
+                self._counts[job.job_type]["succeeded"] += 1
+            except Exception as e:
+                self._counts[job.job_type]["failed"] += 1
+                logger.error(
+                    "`%s` job failed with %s - %s",
+                    job.job_type,
+                    type(e).__name__,
+                    e,
+                )
+            finally:
+                self._running[job.job_type] -= 1
+                # a job of a capped type may run now
+                self._wakeup.set()
+
+
+job_executor = JobExecutor()
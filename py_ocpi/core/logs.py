@@ -1,5 +1,10 @@
 """Logging configuration."""
+import atexit
+import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 from py_ocpi.core.enums import EnvironmentType
 
@@ -21,17 +26,66 @@ class CustomFormatter(logging.Formatter):
         logging.DEBUG: f"{blue}{form}{reset}",
     }
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.formatters = {
+            level: logging.Formatter(log_fmt)
+            for level, log_fmt in self.FORMATS.items()
+        }
+        self.default_formatter = logging.Formatter()
+
     def format(self, record):
         """Return formatted logging message."""
-        log_fmt = self.FORMATS.get(record.levelno)  # noqa
-        formatter = logging.Formatter(log_fmt)
+        formatter = self.formatters.get(record.levelno, self.default_formatter)
         return formatter.format(record)
 
 
+class JSONFormatter(logging.Formatter):
+    """Logging formatter writing a JSON object per record."""
+
+    def format(self, record):
+        """Return the record as a JSON line."""
+        content = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "filename": record.filename,
+            "lineno": record.lineno,
+        }
+        if record.exc_info:
+            content["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(content, default=str)
+
+
+class LazyDump:
+    """
+    Log argument dumping a pydantic model only when the record
+    is formatted, i.e. if the level of the record is enabled.
+    """
+
+    __slots__ = ("model",)
+
+    def __init__(self, model: Any) -> None:
+        self.model = model
+
+    def __str__(self) -> str:
+        return str(self.model.model_dump())
+
+
 class LoggingConfig:
-    def __init__(self, environment: str, logger) -> None:
+    def __init__(
+        self,
+        environment: str,
+        logger,
+        json_format: bool = False,
+        use_queue: bool = False,
+    ) -> None:
         self.environment = environment
         self.logger = logger
+        self.json_format = json_format
+        self.use_queue = use_queue
+        self.listener: Optional[QueueListener] = None
 
     def configure_logger(self):
         if self.environment == EnvironmentType.production.value:
@@ -43,6 +97,25 @@ class LoggingConfig:
         else:
             raise ValueError("Invalid environment")
 
+        if self.json_format:
+            handler.setFormatter(JSONFormatter())
+
+        if self.use_queue and self.listener is None:
+            # the stream is written by the listener thread,
+            # the event loop only puts the records in the queue
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            self.logger.removeHandler(handler)
+            self.logger.addHandler(QueueHandler(log_queue))
+            self.listener = QueueListener(log_queue, handler)
+            self.listener.start()
+            atexit.register(self.stop_listener)
+
+    def stop_listener(self):
+        """Write the queued records and stop the listener thread."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
 
 logger = logging.getLogger("OCPI-Logger")
 
@@ -0,0 +1,610 @@
+"""
+Durable outbox of the pushes to the partners.
+
+Push jobs are stored before being sent and are removed only once the
+receiver accepted them, failed attempts are retried with exponential
+backoff and moved to the dead letters after OUTBOX_MAX_ATTEMPTS.
+"""
+
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import httpx
+
+from py_ocpi.core.config import settings, logger
+
+
+class OutboxJob(NamedTuple):
+    """An object to send to a receiver."""
+
+    version: str
+    module_id: str
+    object_id: str
+    endpoints_url: str
+    auth_token: str
+    data: dict
+    id: Optional[int] = None
+    attempts: int = 0
+    next_attempt_at: float = 0
+    created_at: float = 0
+    last_error: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        """The receiver and the object, sent one job at a time."""
+        return self.endpoints_url, self.module_id, self.object_id
+
+
+class OutboxStats(NamedTuple):
+    pending: int
+    dead_letters: int
+    oldest_due_at: Optional[float]
+
+
+class OutboxMetrics(NamedTuple):
+    """
+    :param depth (int): Jobs waiting to be sent, retries included.
+    :param in_flight (int): Jobs being sent.
+    :param dead_letters (int): Jobs which won't be retried.
+    :param lag (float): Seconds the oldest due job has been waiting.
+    :param sent (int): Jobs sent since the outbox started.
+    :param retried (int): Failed attempts rescheduled since the start.
+    :param dead_lettered (int): Jobs given up since the start.
+    """
+
+    depth: int
+    in_flight: int
+    dead_letters: int
+    lag: float
+    sent: int
+    retried: int
+    dead_lettered: int
+
+
+class OutboxStore(ABC):
+    """
+    Storage of the outbox jobs, implement it to keep the jobs
+    in the database of the application.
+    """
+
+    @abstractmethod
+    async def add(self, jobs: List[OutboxJob]) -> List[int]:
+        """
+        Store new pending jobs and return their ids. A job replaces the
+        pending job of the same key, which holds an older version of
+        the object.
+        """
+
+    @abstractmethod
+    async def due(
+        self, now: float, limit: int, exclude: Iterable[int] = ()
+    ) -> List[OutboxJob]:
+        """Return pending jobs to send at `now`, the oldest first."""
+
+    @abstractmethod
+    async def reschedule(self, job: OutboxJob) -> None:
+        """Update attempts, next_attempt_at and last_error of a job."""
+
+    @abstractmethod
+    async def remove(self, job_id: int) -> None:
+        """Remove a sent job."""
+
+    @abstractmethod
+    async def bury(self, job: OutboxJob) -> None:
+        """Move a job to the dead letters."""
+
+    @abstractmethod
+    async def dead_letters(self, limit: int = 100) -> List[OutboxJob]:
+        """Return the dead letters, the oldest first."""
+
+    @abstractmethod
+    async def requeue_dead_letters(self, now: float) -> int:
+        """
+        Make the dead letters pending again and return their count, the
+        dead letters of the keys having a pending job are dropped.
+        """
+
+    @abstractmethod
+    async def stats(self, now: float) -> OutboxStats:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryOutboxStore(OutboxStore):
+    """Not durable store, the jobs are lost with the process."""
+
+    def __init__(self) -> None:
+        self._pending: Dict[int, OutboxJob] = {}
+        self._dead: Dict[int, OutboxJob] = {}
+        # key -> id of the pending job
+        self._keys: Dict[Tuple[str, str, str], int] = {}
+        self._next_id = 1
+
+    async def add(self, jobs: List[OutboxJob]) -> List[int]:
+        ids = []
+        for job in jobs:
+            job = job._replace(id=self._next_id)
+            self._pending.pop(self._keys.get(job.key), None)
+            self._pending[job.id] = job
+            self._keys[job.key] = job.id
+            ids.append(job.id)
+            self._next_id += 1
+        return ids
+
+    def _pop(self, job_id: int) -> Optional[OutboxJob]:
+        job = self._pending.pop(job_id, None)
+        if job is not None:
+            del self._keys[job.key]
+        return job
+
+    async def due(
+        self, now: float, limit: int, exclude: Iterable[int] = ()
+    ) -> List[OutboxJob]:
+        exclude = set(exclude)
+        jobs = [
+            job
+            for job in self._pending.values()
+            if job.next_attempt_at <= now and job.id not in exclude
+        ]
+        jobs.sort(key=lambda job: (job.next_attempt_at, job.id))
+        return jobs[:limit]
+
+    async def reschedule(self, job: OutboxJob) -> None:
+        if job.id in self._pending:
+            self._pending[job.id] = job
+
+    async def remove(self, job_id: int) -> None:
+        self._pop(job_id)
+
+    async def bury(self, job: OutboxJob) -> None:
+        # a replaced job is dropped
+        if self._pop(job.id) is not None:
+            self._dead[job.id] = job
+
+    async def dead_letters(self, limit: int = 100) -> List[OutboxJob]:
+        return list(self._dead.values())[:limit]
+
+    async def requeue_dead_letters(self, now: float) -> int:
+        count = 0
+        for job in self._dead.values():
+            if job.key in self._keys:
+                continue
+            self._pending[job.id] = job._replace(
+                attempts=0, next_attempt_at=now
+            )
+            self._keys[job.key] = job.id
+            count += 1
+        self._dead.clear()
+        return count
+
+    async def stats(self, now: float) -> OutboxStats:
+        due_at = [job.next_attempt_at for job in self._pending.values()]
+        return OutboxStats(
+            pending=len(self._pending),
+            dead_letters=len(self._dead),
+            oldest_due_at=min(due_at) if due_at else None,
+        )
+
+
+class SQLiteOutboxStore(OutboxStore):
+    """
+    Store keeping the jobs in a SQLite database file, the queries
+    run in a thread not to block the event loop.
+
+    The jobs hold the auth tokens of the receivers, a missing database
+    file is created readable by its owner only.
+
+    :param path (str): The database file, created if missing.
+    """
+
+    columns = (
+        "id, version, module_id, object_id, endpoints_url, auth_token, "
+        "data, attempts, next_attempt_at, created_at, last_error"
+    )
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        if path != ":memory:" and not os.path.exists(path):
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS outbox ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "version TEXT NOT NULL, "
+                "module_id TEXT NOT NULL, "
+                "object_id TEXT NOT NULL, "
+                "endpoints_url TEXT NOT NULL, "
+                "auth_token TEXT NOT NULL, "
+                "data TEXT NOT NULL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, "
+                "next_attempt_at REAL NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "last_error TEXT, "
+                "dead INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS outbox_due "
+                "ON outbox (dead, next_attempt_at)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS outbox_key "
+                "ON outbox (endpoints_url, module_id, object_id, dead)"
+            )
+
+    async def _execute(self, function: Callable[[sqlite3.Connection], Any]):
+        def run():
+            with self._lock, self._connection:
+                return function(self._connection)
+
+        return await asyncio.to_thread(run)
+
+    @staticmethod
+    def _job(row: tuple) -> OutboxJob:
+        (
+            id,
+            version,
+            module_id,
+            object_id,
+            endpoints_url,
+            auth_token,
+            data,
+            attempts,
+            next_attempt_at,
+            created_at,
+            last_error,
+        ) = row
+        return OutboxJob(
+            version=version,
+            module_id=module_id,
+            object_id=object_id,
+            endpoints_url=endpoints_url,
+            auth_token=auth_token,
+            data=json.loads(data),
+            id=id,
+            attempts=attempts,
+            next_attempt_at=next_attempt_at,
+            created_at=created_at,
+            last_error=last_error,
+        )
+
+    async def add(self, jobs: List[OutboxJob]) -> List[int]:
+        def add(connection: sqlite3.Connection) -> List[int]:
+            ids = []
+            for job in jobs:
+                connection.execute(
+                    "DELETE FROM outbox WHERE endpoints_url = ? "
+                    "AND module_id = ? AND object_id = ? AND dead = 0",
+                    job.key,
+                )
+                cursor = connection.execute(
+                    "INSERT INTO outbox (version, module_id, object_id, "
+                    "endpoints_url, auth_token, data, attempts, "
+                    "next_attempt_at, created_at, last_error) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        job.version,
+                        job.module_id,
+                        job.object_id,
+                        job.endpoints_url,
+                        job.auth_token,
+                        json.dumps(job.data, default=str),
+                        job.attempts,
+                        job.next_attempt_at,
+                        job.created_at,
+                        job.last_error,
+                    ),
+                )
+                ids.append(cursor.lastrowid)
+            return ids
+
+        return await self._execute(add)
+
+    async def due(
+        self, now: float, limit: int, exclude: Iterable[int] = ()
+    ) -> List[OutboxJob]:
+        exclude = list(exclude)
+
+        def due(connection: sqlite3.Connection) -> List[OutboxJob]:
+            query = (
+                f"SELECT {self.columns} FROM outbox "
+                "WHERE dead = 0 AND next_attempt_at <= ?"
+            )
+            if exclude:
+                query += f" AND id NOT IN ({', '.join('?' * len(exclude))})"
+            query += " ORDER BY next_attempt_at, id LIMIT ?"
+            rows = connection.execute(query, (now, *exclude, limit))
+            return [self._job(row) for row in rows]
+
+        return await self._execute(due)
+
+    async def reschedule(self, job: OutboxJob) -> None:
+        await self._execute(
+            lambda connection: connection.execute(
+                "UPDATE outbox SET attempts = ?, next_attempt_at = ?, "
+                "last_error = ? WHERE id = ?",
+                (job.attempts, job.next_attempt_at, job.last_error, job.id),
+            )
+        )
+
+    async def remove(self, job_id: int) -> None:
+        await self._execute(
+            lambda connection: connection.execute(
+                "DELETE FROM outbox WHERE id = ?", (job_id,)
+            )
+        )
+
+    async def bury(self, job: OutboxJob) -> None:
+        await self._execute(
+            lambda connection: connection.execute(
+                "UPDATE outbox SET dead = 1, attempts = ?, last_error = ? "
+                "WHERE id = ?",
+                (job.attempts, job.last_error, job.id),
+            )
+        )
+
+    async def dead_letters(self, limit: int = 100) -> List[OutboxJob]:
+        def dead_letters(connection: sqlite3.Connection) -> List[OutboxJob]:
+            rows = connection.execute(
+                f"SELECT {self.columns} FROM outbox WHERE dead = 1 "
+                "ORDER BY id LIMIT ?",
+                (limit,),
+            )
+            return [self._job(row) for row in rows]
+
+        return await self._execute(dead_letters)
+
+    async def requeue_dead_letters(self, now: float) -> int:
+        def requeue(connection: sqlite3.Connection) -> int:
+            connection.execute(
+                "DELETE FROM outbox AS dead_letter WHERE dead = 1 "
+                "AND EXISTS (SELECT 1 FROM outbox WHERE dead = 0 "
+                "AND endpoints_url = dead_letter.endpoints_url "
+                "AND module_id = dead_letter.module_id "
+                "AND object_id = dead_letter.object_id)"
+            )
+            return connection.execute(
+                "UPDATE outbox SET dead = 0, attempts = 0, "
+                "next_attempt_at = ? WHERE dead = 1",
+                (now,),
+            ).rowcount
+
+        return await self._execute(requeue)
+
+    async def stats(self, now: float) -> OutboxStats:
+        def stats(connection: sqlite3.Connection) -> OutboxStats:
+            pending, oldest_due_at = connection.execute(
+                "SELECT COUNT(*), MIN(next_attempt_at) FROM outbox "
+                "WHERE dead = 0"
+            ).fetchone()
+            (dead_letters,) = connection.execute(
+                "SELECT COUNT(*) FROM outbox WHERE dead = 1"
+            ).fetchone()
+            return OutboxStats(pending, dead_letters, oldest_due_at)
+
+        return await self._execute(stats)
+
+    async def close(self) -> None:
+        await self._execute(lambda connection: None)
+        self._connection.close()
+
+
+# sends a job and returns the status code of the receiver
+Sender = Callable[[OutboxJob, httpx.AsyncClient], Awaitable[int]]
+
+
+class Outbox:
+    """
+    Outbox drained by async workers.
+
+    A job is removed once the receiver answers with a 2xx status code.
+    Connection errors, timeouts, 408, 429 and 5xx responses are retried
+    after `backoff_base * 2 ** (attempts - 1)` seconds, at most
+    `backoff_max`, with jitter. Other responses and jobs failing
+    `max_attempts` times are moved to the dead letters.
+
+    Jobs are sent at least once: jobs being sent when the outbox
+    stops are sent again after the next start. The jobs of a key are
+    sent one at a time, a job enqueued while the previous one of its
+    key is retried replaces it, so an older version of an object is
+    never sent after a newer one.
+
+    :param store (OutboxStore): The storage of the jobs.
+    :param sender (Sender): Sends a job, returns the status code.
+    """
+
+    def __init__(
+        self,
+        store: OutboxStore,
+        sender: Sender,
+        workers: int = settings.OUTBOX_WORKERS,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+        backoff_base: float = settings.OUTBOX_BACKOFF_BASE,
+        backoff_max: float = settings.OUTBOX_BACKOFF_MAX,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL,
+    ) -> None:
+        self.store = store
+        self.sender = sender
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.poll_interval = poll_interval
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self.sent = 0
+        self.retried = 0
+        self.dead_lettered = 0
+        self._in_flight: Set[int] = set()
+        self._in_flight_keys: Set[Tuple[str, str, str]] = set()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def backoff(self, attempts: int) -> float:
+        """Return the delay before the next attempt, with equal jitter."""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def enqueue(self, jobs: List[OutboxJob]) -> List[int]:
+        """Store the jobs and wake the workers up, return the job ids."""
+        now = time.time()
+        ids = await self.store.add(
+            [
+                job._replace(
+                    next_attempt_at=job.next_attempt_at or now,
+                    created_at=job.created_at or now,
+                )
+                for job in jobs
+            ]
+        )
+        self._wakeup.set()
+        return ids
+
+    def start(self, http_client: httpx.AsyncClient) -> None:
+        """Start the dispatcher and the workers."""
+        if self.running:
+            return
+        self.http_client = http_client
+        self._queue = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._in_flight.clear()
+        self._in_flight_keys.clear()
+        self._tasks = [asyncio.create_task(self._dispatch())]
+        self._tasks += [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers, unsent jobs stay in the store."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def metrics(self) -> OutboxMetrics:
+        now = time.time()
+        stats = await self.store.stats(now)
+        lag = 0.0
+        if stats.oldest_due_at is not None:
+            lag = max(0.0, now - stats.oldest_due_at)
+        return OutboxMetrics(
+            depth=stats.pending,
+            in_flight=len(self._in_flight),
+            dead_letters=stats.dead_letters,
+            lag=lag,
+            sent=self.sent,
+            retried=self.retried,
+            dead_lettered=self.dead_lettered,
+        )
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._wakeup.clear()
+            free = self.workers * 2 - len(self._in_flight)
+            jobs = []
+            if free > 0:
+                try:
+                    # the jobs of the keys in flight are skipped below
+                    jobs = await self.store.due(
+                        time.time(),
+                        free + len(self._in_flight_keys),
+                        exclude=self._in_flight,
+                    )
+                except Exception as e:
+                    logger.error("Reading the outbox failed: %s", e)
+            claimed = 0
+            for job in jobs:
+                if claimed == free or job.key in self._in_flight_keys:
+                    continue
+                self._in_flight.add(job.id)
+                self._in_flight_keys.add(job.key)
+                self._queue.put_nowait(job)
+                claimed += 1
+            if claimed < free:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                # let the workers take the jobs before reading again
+                await asyncio.sleep(0)
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            except Exception as e:
+                logger.error("Outbox job `%s` failed: %s", job.id, e)
+            finally:
+                self._in_flight.discard(job.id)
+                self._in_flight_keys.discard(job.key)
+                self._wakeup.set()
+
+    async def _process(self, job: OutboxJob) -> None:
+        try:
+            status_code = await self.sender(job, self.http_client)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            retryable = True
+        else:
+            if 200 <= status_code < 300:
+                await self.store.remove(job.id)
+                self.sent += 1
+                return
+            error = f"Receiver responded with status code {status_code}."
+            retryable = status_code >= 500 or status_code in (408, 429)
+
+        attempts = job.attempts + 1
+        job = job._replace(attempts=attempts, last_error=error)
+        if not retryable or attempts >= self.max_attempts:
+            logger.warning(
+                "Outbox job `%s` to `%s` dead lettered after %s attempts: %s",
+                job.id,
+                job.endpoints_url,
+                attempts,
+                error,
+            )
+            await self.store.bury(job)
+            self.dead_lettered += 1
+            return
+
+        logger.info(
+            "Outbox job `%s` to `%s` failed, attempt %s: %s",
+            job.id,
+            job.endpoints_url,
+            attempts,
+            error,
+        )
+        await self.store.reschedule(
+            job._replace(next_attempt_at=time.time() + self.backoff(attempts))
+        )
+        self.retried += 1
@@ -0,0 +1,106 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from fastapi import status as fastapistatus
+
+from py_ocpi.core.config import settings, logger
+from py_ocpi.modules.versions.enums import VersionNumber
+
+
+class PartnerEndpointsError(Exception):
+    """The version details of a partner couldn't be read."""
+
+
+class PartnerRegistry:
+    """
+    Endpoints of the partners per (version details url, version).
+
+    The registry is filled in by the credentials handshake and by
+    the version details requests of the push, afterwards the module
+    urls of a partner are resolved without any network call.
+
+    :param ttl (float): Seconds the endpoints of a partner are used
+      before they are requested again, 0 disables the registry.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._endpoints: Dict[Tuple[str, str], Tuple[float, List[dict]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    def get(self, url: str, version: VersionNumber) -> Optional[List[dict]]:
+        """Return the endpoints of a partner, None if unknown or expired."""
+        key = (str(url), version.value)
+        entry = self._endpoints.get(key)
+        if entry is None:
+            return None
+        expires_at, endpoints = entry
+        if expires_at <= time.monotonic():
+            del self._endpoints[key]
+            return None
+        return endpoints
+
+    def set(
+        self, url: str, version: VersionNumber, endpoints: List[dict]
+    ) -> None:
+        """Store the endpoints of the partner's version details."""
+        if self.ttl <= 0 or not endpoints:
+            return
+        self._endpoints[(str(url), version.value)] = (
+            time.monotonic() + self.ttl,
+            endpoints,
+        )
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        Evict the endpoints of a partner for all versions, or of every
+        partner if no url is given.
+        """
+        if url is None:
+            self._endpoints.clear()
+            return
+        for key in [key for key in self._endpoints if key[0] == str(url)]:
+            del self._endpoints[key]
+
+    async def fetch(
+        self,
+        url: str,
+        version: VersionNumber,
+        auth_token: str,
+        http_client: httpx.AsyncClient,
+    ) -> List[dict]:
+        """
+        Request the version details of the partner and store its endpoints.
+
+        :param url (str): The version details url of the partner.
+        :param auth_token (str): The Authorization header value.
+
+        :raises PartnerEndpointsError: If the partner doesn't answer with
+          its version details.
+        """
+        logger.info("Send request to get version details: %s", url)
+        response = await http_client.get(
+            url,
+            headers={"authorization": auth_token},
+        )
+        logger.info("Response status_code - `%s`", response.status_code)
+        if response.status_code != fastapistatus.HTTP_200_OK:
+            raise PartnerEndpointsError(
+                f"Version details request to `{url}` failed with status "
+                f"code {response.status_code}."
+            )
+        try:
+            endpoints = response.json()["data"]["endpoints"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise PartnerEndpointsError(
+                f"Invalid version details response from `{url}`."
+            ) from e
+        logger.debug("Endpoints response data - `%s`", endpoints)
+        self.set(url, version, endpoints)
+        return endpoints
+
+
+partner_registry = PartnerRegistry(ttl=settings.PARTNER_ENDPOINTS_TTL)
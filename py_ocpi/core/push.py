@@ -1,7 +1,16 @@
-from typing import Union
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import httpx
-from fastapi import APIRouter, Request, WebSocket, Depends
+from fastapi import (
+    APIRouter,
+    FastAPI,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    Depends,
+    status as fastapistatus,
+)
 
 from py_ocpi.core.adapter import Adapter
 from py_ocpi.core.authentication.verifier import (
@@ -9,11 +18,36 @@ from py_ocpi.core.authentication.verifier import (
     WSPushVerifier,
 )
 from py_ocpi.core.crud import Crud
-from py_ocpi.core.schemas import Push, PushResponse, ReceiverResponse
-from py_ocpi.core.utils import encode_string_base64, get_auth_token
-from py_ocpi.core.dependencies import get_crud, get_adapter
+from py_ocpi.core.schemas import (
+    BatchPush,
+    BatchPushResponse,
+    BatchReceiverResponse,
+    Push,
+    PushResponse,
+    Receiver,
+    ReceiverResponse,
+)
+from py_ocpi.core.utils import (
+    crud_implements,
+    encode_string_base64,
+    get_auth_token,
+)
+from py_ocpi.core.dependencies import (
+    get_crud,
+    get_adapter,
+    get_http_client,
+    get_outbox,
+    get_push_coalescer,
+)
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.config import settings, logger
+from py_ocpi.core.coalescing import PushCoalescer
+from py_ocpi.core.diff import ObjectPatch, sent_objects
+from py_ocpi.core.http_client import get_app_http_client
+from py_ocpi.core.jobs import job_executor
+from py_ocpi.core.logs import LazyDump
+from py_ocpi.core.outbox import Outbox, OutboxJob
+from py_ocpi.core.partners import partner_registry
 from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.modules.versions.v_2_2_1.enums import InterfaceRole
 
@@ -50,17 +84,10 @@ def request_data(
     return data
 
 
-async def send_push_request(
-    object_id: str,
-    object_data: dict,
-    module_id: ModuleID,
-    adapter: Adapter,
-    client_auth_token: str,
-    endpoints: list,
-    version: VersionNumber,
-):
-    data = request_data(module_id, object_data, adapter, version)
-
+def module_url(
+    endpoints: list, module_id: ModuleID, version: VersionNumber
+) -> str:
+    """Return the url of the module endpoint of the receiver."""
     base_url = ""
     for endpoint in endpoints:
         if (
@@ -72,17 +99,278 @@ async def send_push_request(
             and endpoint["identifier"] == module_id
         ):
             base_url = endpoint["url"]
+    return base_url
+
+
+async def send_push_request(
+    object_id: str,
+    data: dict,
+    module_id: ModuleID,
+    client_auth_token: str,
+    endpoints: list,
+    version: VersionNumber,
+    http_client: httpx.AsyncClient,
+    patch: Optional[ObjectPatch] = None,
+):
+    base_url = module_url(endpoints, module_id, version)
 
     # push object to client
-    async with httpx.AsyncClient() as client:
-        request = client.build_request(
+    if patch is not None:
+        request = http_client.build_request(
+            "PATCH",
+            f"{client_url(module_id, object_id, base_url)}{patch.path}",
+            headers={"Authorization": client_auth_token},
+            json=patch.data,
+        )
+    else:
+        request = http_client.build_request(
             client_method(module_id),
             client_url(module_id, object_id, base_url),
             headers={"Authorization": client_auth_token},
             json=data,
         )
-        response = await client.send(request)
+    return await http_client.send(request)
+
+
+def receiver_auth_token(version: VersionNumber, receiver: Receiver) -> str:
+    """Return the Authorization header value of the receiver."""
+    if version.value.startswith("2.1") or version.value.startswith("2.0"):
+        token = receiver.auth_token
+    else:
+        token = encode_string_base64(receiver.auth_token)
+    return f"Token {token}"
+
+
+def object_role(module_id: ModuleID) -> RoleEnum:
+    if module_id == ModuleID.tokens:
+        logger.debug("Requested module with push is token.")
+        return RoleEnum.emsp
+    logger.debug("Requested module with push is `%s`.", module_id)
+    return RoleEnum.cpo
+
+
+def failure_status(endpoints_url: str, exc: Exception) -> Tuple[int, str]:
+    """Return the status code and detail of a failed push to a receiver."""
+    if isinstance(exc, asyncio.TimeoutError):
+        logger.warning("Push to `%s` timed out.", endpoints_url)
+        return fastapistatus.HTTP_504_GATEWAY_TIMEOUT, "Receiver timed out."
+    logger.warning("Push to `%s` failed: %s", endpoints_url, exc)
+    return fastapistatus.HTTP_502_BAD_GATEWAY, str(exc)
+
+
+async def send_to_endpoints(
+    version: VersionNumber,
+    module_id: ModuleID,
+    object_id: str,
+    data: dict,
+    receiver: Receiver,
+    client_auth_token: str,
+    http_client: httpx.AsyncClient,
+    patch: Optional[ObjectPatch] = None,
+) -> httpx.Response:
+    """
+    Send the object data to the module endpoint of the receiver.
+
+    The endpoints are taken from the partner registry, requested if
+    unknown, and refreshed once if the registered ones look stale: the
+    receiver can't be reached or answers 404 or 410. The object is sent
+    again only if its module endpoint moved, a request which may have
+    reached the receiver, e.g. timed out, is never sent twice.
+    """
+    endpoints = partner_registry.get(receiver.endpoints_url, version)
+    registered = endpoints is not None
+    if not registered:
+        endpoints = await partner_registry.fetch(
+            receiver.endpoints_url, version, client_auth_token, http_client
+        )
+
+    error: Optional[httpx.HTTPError] = None
+    try:
+        response = await send_push_request(
+            object_id,
+            data,
+            module_id,
+            client_auth_token,
+            endpoints,
+            version,
+            http_client,
+            patch,
+        )
+        if not registered or response.status_code not in (
+            fastapistatus.HTTP_404_NOT_FOUND,
+            fastapistatus.HTTP_410_GONE,
+        ):
+            return response
+    except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+        # nothing reached the receiver
+        if not registered:
+            raise
+        error = e
+
+    # the partner may have moved its endpoints since they were stored
+    logger.info(
+        "Refresh endpoints of `%s` after failed push.",
+        receiver.endpoints_url,
+    )
+    partner_registry.invalidate(receiver.endpoints_url)
+    new_endpoints = await partner_registry.fetch(
+        receiver.endpoints_url, version, client_auth_token, http_client
+    )
+    if module_url(new_endpoints, module_id, version) == module_url(
+        endpoints, module_id, version
+    ):
+        if error is not None:
+            raise error
         return response
+    return await send_push_request(
+        object_id,
+        data,
+        module_id,
+        client_auth_token,
+        new_endpoints,
+        version,
+        http_client,
+        patch,
+    )
+
+
+def is_accepted(response: httpx.Response) -> bool:
+    """
+    Return True if the receiver accepted the object, with a 2xx HTTP
+    status code and a 1xxx OCPI status code.
+    """
+    if not response.is_success:
+        return False
+    try:
+        status_code = int(response.json()["status_code"])
+    except (ValueError, KeyError, TypeError):
+        return False
+    return 1000 <= status_code < 2000
+
+
+async def send_to_receiver(
+    version: VersionNumber,
+    module_id: ModuleID,
+    object_id: str,
+    data: dict,
+    receiver: Receiver,
+    client_auth_token: str,
+    http_client: httpx.AsyncClient,
+) -> httpx.Response:
+    """
+    Send the object to the receiver.
+
+    With PUSH_PATCH, locations and sessions are sent as a PATCH of their
+    changes since the version the receiver accepted last. They are sent
+    whole the first time, after an error and if the PATCH is refused,
+    by its HTTP or OCPI status code.
+    Concurrent sends of an object to a receiver then wait for each other.
+    """
+    if not settings.PUSH_PATCH:
+        return await send_to_endpoints(
+            version,
+            module_id,
+            object_id,
+            data,
+            receiver,
+            client_auth_token,
+            http_client,
+        )
+
+    async with sent_objects.sending(
+        receiver.endpoints_url, module_id, object_id
+    ):
+        patch = sent_objects.patch(
+            receiver.endpoints_url, module_id, object_id, data
+        )
+        try:
+            response = await send_to_endpoints(
+                version,
+                module_id,
+                object_id,
+                data,
+                receiver,
+                client_auth_token,
+                http_client,
+                patch,
+            )
+            if patch is not None and not is_accepted(response):
+                logger.info(
+                    "PATCH to `%s` was refused with status_code `%s`, "
+                    "send it whole.",
+                    receiver.endpoints_url,
+                    response.status_code,
+                )
+                response = await send_to_endpoints(
+                    version,
+                    module_id,
+                    object_id,
+                    data,
+                    receiver,
+                    client_auth_token,
+                    http_client,
+                )
+        except Exception:
+            sent_objects.invalidate(
+                receiver.endpoints_url, module_id, object_id
+            )
+            raise
+
+        if is_accepted(response):
+            sent_objects.set(receiver.endpoints_url, module_id, object_id, data)
+        else:
+            sent_objects.invalidate(
+                receiver.endpoints_url, module_id, object_id
+            )
+    return response
+
+
+async def push_to_receiver(
+    version: VersionNumber,
+    push: Push,
+    receiver: Receiver,
+    data: dict,
+    http_client: httpx.AsyncClient,
+) -> ReceiverResponse:
+    response = await send_to_receiver(
+        version,
+        push.module_id,
+        push.object_id,
+        data,
+        receiver,
+        receiver_auth_token(version, receiver),
+        http_client,
+    )
+    if push.module_id == ModuleID.cdrs:
+        logger.debug("Add headers for CDR module into response.")
+        return ReceiverResponse(
+            endpoints_url=receiver.endpoints_url,
+            status_code=response.status_code,
+            response=response.headers,
+        )
+    return ReceiverResponse(
+        endpoints_url=receiver.endpoints_url,
+        status_code=response.status_code,
+        response=response.json(),
+    )
+
+
+async def get_object_data(
+    version: VersionNumber,
+    push: Push,
+    crud: Crud,
+    adapter: Adapter,
+    auth_token: Union[str, None] = None,
+) -> dict:
+    """Load the object of the push and return the data to send."""
+    object_data = await crud.get(
+        push.module_id,
+        object_role(push.module_id),
+        push.object_id,
+        auth_token=auth_token,
+        version=version,
+    )
+    return request_data(push.module_id, object_data, adapter, version)
 
 
 async def push_object(
@@ -91,78 +379,394 @@ async def push_object(
     crud: Crud,
     adapter: Adapter,
     auth_token: Union[str, None] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> PushResponse:
-    receiver_responses = []
-    for receiver in push.receivers:
-        # get client endpoints
-        if version.value.startswith("2.1") or version.value.startswith("2.0"):
-            token = receiver.auth_token
-        else:
-            token = encode_string_base64(receiver.auth_token)
-
-        client_auth_token = f"Token {token}"
+    """
+    Send the object to every receiver of the push.
 
-        async with httpx.AsyncClient() as client:
-            logger.info(
-                "Send request to get version details: %s"
-                % receiver.endpoints_url
-            )
-            response = await client.get(
-                receiver.endpoints_url,
-                headers={"authorization": client_auth_token},
+    The object is loaded and adapted once, receivers are then pushed
+    concurrently, at most PUSH_CONCURRENCY at a time. A receiver failing
+    or not answering within PUSH_RECEIVER_TIMEOUT seconds gets a 502
+    or 504 status code in its response, others are not affected.
+    """
+    if http_client is None:
+        # called outside of a request of the application
+        async with httpx.AsyncClient() as http_client:
+            return await push_object(
+                version, push, crud, adapter, auth_token, http_client
             )
-            logger.info("Response status_code - `%s`" % response.status_code)
-            endpoints = response.json()["data"]["endpoints"]
-            logger.debug("Endpoints response data - `%s`" % endpoints)
-
-        # get object data
-        if push.module_id == ModuleID.tokens:
-            logger.debug("Requested module with push is token.")
-            data = await crud.get(
-                push.module_id,
-                RoleEnum.emsp,
-                push.object_id,
+
+    data = await get_object_data(version, push, crud, adapter, auth_token)
+
+    semaphore = asyncio.Semaphore(settings.PUSH_CONCURRENCY)
+
+    async def push_isolated(receiver: Receiver) -> ReceiverResponse:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    push_to_receiver(
+                        version, push, receiver, data, http_client
+                    ),
+                    settings.PUSH_RECEIVER_TIMEOUT,
+                )
+            except Exception as e:
+                status_code, detail = failure_status(receiver.endpoints_url, e)
+                return ReceiverResponse(
+                    endpoints_url=receiver.endpoints_url,
+                    status_code=status_code,
+                    response={"detail": detail},
+                )
+
+    receiver_responses = await asyncio.gather(
+        *(push_isolated(receiver) for receiver in push.receivers)
+    )
+    result = PushResponse(receiver_responses=receiver_responses)
+    logger.debug("Result of push operation - %s", LazyDump(result))
+    return result
+
+
+async def get_objects(
+    version: VersionNumber,
+    module_id: ModuleID,
+    object_ids: List[str],
+    crud: Crud,
+    auth_token: Union[str, None] = None,
+) -> List[Any]:
+    """
+    Load the objects of a batch push with `crud.get_many` if the crud
+    implements it, otherwise with `crud.get` per object.
+    """
+    role = object_role(module_id)
+    if crud_implements(crud, "get_many"):
+        return list(
+            await crud.get_many(
+                module_id,
+                role,
+                object_ids,
                 auth_token=auth_token,
                 version=version,
             )
-        else:
-            logger.debug("Requested module with push is `%s`." % push.module_id)
-            data = await crud.get(
-                push.module_id,
-                RoleEnum.cpo,
-                push.object_id,
+        )
+
+    semaphore = asyncio.Semaphore(settings.PUSH_CONCURRENCY)
+
+    async def get_object(object_id: str) -> Any:
+        async with semaphore:
+            return await crud.get(
+                module_id,
+                role,
+                object_id,
                 auth_token=auth_token,
                 version=version,
             )
 
-        response = await send_push_request(
-            push.object_id,
-            data,
-            push.module_id,
-            adapter,
-            client_auth_token,
-            endpoints,
-            version,
+    return await asyncio.gather(
+        *(get_object(object_id) for object_id in object_ids)
+    )
+
+
+async def get_objects_data(
+    version: VersionNumber,
+    batch_push: BatchPush,
+    crud: Crud,
+    adapter: Adapter,
+    auth_token: Union[str, None] = None,
+) -> Dict[str, dict]:
+    """
+    Load the objects of the batch push and return the data to send
+    by object id, objects which are not found are left out.
+    """
+    objects = await get_objects(
+        version, batch_push.module_id, batch_push.object_ids, crud, auth_token
+    )
+    return {
+        object_id: request_data(
+            batch_push.module_id, object_data, adapter, version
         )
-        if push.module_id == ModuleID.cdrs:
-            logger.debug("Add headers for CDR module into response.")
-            receiver_responses.append(
-                ReceiverResponse(
+        for object_id, object_data in zip(batch_push.object_ids, objects)
+        if object_data is not None
+    }
+
+
+async def push_objects(
+    version: VersionNumber,
+    batch_push: BatchPush,
+    crud: Crud,
+    adapter: Adapter,
+    auth_token: Union[str, None] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+) -> BatchPushResponse:
+    """
+    Send many objects of a module to every receiver of the batch push.
+
+    The objects are loaded with one bulk read and adapted once, then sent
+    to all the receivers concurrently, at most PUSH_CONCURRENCY requests
+    at a time. The endpoints of a receiver are requested once per batch.
+    Objects which are not found get a 404 status code without being sent.
+    """
+    if http_client is None:
+        # called outside of a request of the application
+        async with httpx.AsyncClient() as http_client:
+            return await push_objects(
+                version, batch_push, crud, adapter, auth_token, http_client
+            )
+
+    module_id = batch_push.module_id
+    objects_data = await get_objects_data(
+        version, batch_push, crud, adapter, auth_token
+    )
+
+    semaphore = asyncio.Semaphore(settings.PUSH_CONCURRENCY)
+
+    async def send_isolated(
+        receiver: Receiver, client_auth_token: str, object_id: str
+    ) -> Tuple[int, Optional[str]]:
+        data = objects_data.get(object_id)
+        if data is None:
+            return fastapistatus.HTTP_404_NOT_FOUND, "Object not found."
+        async with semaphore:
+            try:
+                response = await asyncio.wait_for(
+                    send_to_receiver(
+                        version,
+                        module_id,
+                        object_id,
+                        data,
+                        receiver,
+                        client_auth_token,
+                        http_client,
+                    ),
+                    settings.PUSH_RECEIVER_TIMEOUT,
+                )
+            except Exception as e:
+                return failure_status(receiver.endpoints_url, e)
+        return response.status_code, None
+
+    async def push_receiver(receiver: Receiver) -> BatchReceiverResponse:
+        client_auth_token = receiver_auth_token(version, receiver)
+        if partner_registry.get(receiver.endpoints_url, version) is None:
+            try:
+                async with semaphore:
+                    await asyncio.wait_for(
+                        partner_registry.fetch(
+                            receiver.endpoints_url,
+                            version,
+                            client_auth_token,
+                            http_client,
+                        ),
+                        settings.PUSH_RECEIVER_TIMEOUT,
+                    )
+            except Exception as e:
+                status_code, detail = failure_status(receiver.endpoints_url, e)
+                return BatchReceiverResponse(
                     endpoints_url=receiver.endpoints_url,
-                    status_code=response.status_code,
-                    response=response.headers,
+                    status_codes=[status_code] * len(batch_push.object_ids),
+                    detail=detail,
                 )
+
+        results = await asyncio.gather(
+            *(
+                send_isolated(receiver, client_auth_token, object_id)
+                for object_id in batch_push.object_ids
             )
-        else:
-            receiver_responses.append(
-                ReceiverResponse(
-                    endpoints_url=receiver.endpoints_url,
-                    status_code=response.status_code,
-                    response=response.json(),
+        )
+        return BatchReceiverResponse(
+            endpoints_url=receiver.endpoints_url,
+            status_codes=[status_code for status_code, _ in results],
+            errors={
+                object_id: error
+                for object_id, (_, error) in zip(batch_push.object_ids, results)
+                if error is not None
+            },
+        )
+
+    receiver_responses = await asyncio.gather(
+        *(push_receiver(receiver) for receiver in batch_push.receivers)
+    )
+    result = BatchPushResponse(
+        object_ids=batch_push.object_ids,
+        receiver_responses=receiver_responses,
+    )
+    logger.debug("Result of batch push operation - %s", LazyDump(result))
+    return result
+
+
+async def send_outbox_job(
+    job: OutboxJob, http_client: httpx.AsyncClient
+) -> int:
+    """Send a job of the outbox, return the status code of the receiver."""
+    version = VersionNumber(job.version)
+    receiver = Receiver(
+        endpoints_url=job.endpoints_url, auth_token=job.auth_token
+    )
+    response = await asyncio.wait_for(
+        send_to_receiver(
+            version,
+            ModuleID(job.module_id),
+            job.object_id,
+            job.data,
+            receiver,
+            receiver_auth_token(version, receiver),
+            http_client,
+        ),
+        settings.PUSH_RECEIVER_TIMEOUT,
+    )
+    return response.status_code
+
+
+async def send_outbox_jobs(
+    jobs: List[OutboxJob], http_client: httpx.AsyncClient
+) -> None:
+    """Send jobs once, at most PUSH_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(settings.PUSH_CONCURRENCY)
+
+    async def send_isolated(job: OutboxJob) -> None:
+        async with semaphore:
+            try:
+                status_code = await send_outbox_job(job, http_client)
+                logger.debug(
+                    "Push to `%s` status_code - `%s`",
+                    job.endpoints_url,
+                    status_code,
                 )
+            except Exception as e:
+                failure_status(job.endpoints_url, e)
+
+    await asyncio.gather(*(send_isolated(job) for job in jobs))
+
+
+async def submit_outbox_jobs(app: FastAPI, jobs: List[OutboxJob]) -> None:
+    """
+    Send jobs once in a background job with the HTTP client of the
+    application, e.g. the coalesced pushes.
+    """
+    job_executor.submit(
+        "push", send_outbox_jobs, jobs, get_app_http_client(app)
+    )
+
+
+def outbox_job(
+    version: VersionNumber,
+    module_id: ModuleID,
+    object_id: str,
+    data: dict,
+    receiver: Receiver,
+) -> OutboxJob:
+    return OutboxJob(
+        version=version.value,
+        module_id=module_id.value,
+        object_id=object_id,
+        endpoints_url=str(receiver.endpoints_url),
+        auth_token=receiver.auth_token,
+        data=data,
+    )
+
+
+async def schedule_jobs(
+    jobs: List[OutboxJob],
+    outbox: Optional[Outbox],
+    coalescer: Optional[PushCoalescer] = None,
+) -> List[dict]:
+    """
+    Hand the jobs over to the coalescer if any, otherwise to the outbox.
+
+    :return: The response of each job, whether it replaced a held push
+      or the id of its outbox job.
+    """
+    if coalescer is not None:
+        return [{"coalesced": coalescer.submit(job)} for job in jobs]
+    job_ids = await outbox.enqueue(jobs)  # type: ignore
+    return [{"outbox_id": job_id} for job_id in job_ids]
+
+
+async def enqueue_push(
+    version: VersionNumber,
+    push: Push,
+    crud: Crud,
+    adapter: Adapter,
+    outbox: Optional[Outbox],
+    auth_token: Union[str, None] = None,
+    coalescer: Optional[PushCoalescer] = None,
+) -> PushResponse:
+    """
+    Store the push in the outbox or hold it in the coalescer, a job per
+    receiver, without waiting for the receivers. Receivers get a 202
+    status code.
+    """
+    data = await get_object_data(version, push, crud, adapter, auth_token)
+    responses = await schedule_jobs(
+        [
+            outbox_job(version, push.module_id, push.object_id, data, receiver)
+            for receiver in push.receivers
+        ],
+        outbox,
+        coalescer,
+    )
+    result = PushResponse(
+        receiver_responses=[
+            ReceiverResponse(
+                endpoints_url=receiver.endpoints_url,
+                status_code=fastapistatus.HTTP_202_ACCEPTED,
+                response=response,
             )
-    result = PushResponse(receiver_responses=receiver_responses)
-    logger.debug("Result of push operation - %s" % result.model_dump())
+            for receiver, response in zip(push.receivers, responses)
+        ]
+    )
+    logger.debug("Result of push enqueuing - %s", LazyDump(result))
+    return result
+
+
+async def enqueue_batch_push(
+    version: VersionNumber,
+    batch_push: BatchPush,
+    crud: Crud,
+    adapter: Adapter,
+    outbox: Optional[Outbox],
+    auth_token: Union[str, None] = None,
+    coalescer: Optional[PushCoalescer] = None,
+) -> BatchPushResponse:
+    """
+    Store the batch push in the outbox or hold it in the coalescer, a job
+    per receiver and found object. Those get a 202 status code, objects
+    not found a 404.
+    """
+    objects_data = await get_objects_data(
+        version, batch_push, crud, adapter, auth_token
+    )
+    await schedule_jobs(
+        [
+            outbox_job(version, batch_push.module_id, object_id, data, receiver)
+            for receiver in batch_push.receivers
+            for object_id, data in objects_data.items()
+        ],
+        outbox,
+        coalescer,
+    )
+    status_codes = [
+        (
+            fastapistatus.HTTP_202_ACCEPTED
+            if object_id in objects_data
+            else fastapistatus.HTTP_404_NOT_FOUND
+        )
+        for object_id in batch_push.object_ids
+    ]
+    errors = {
+        object_id: "Object not found."
+        for object_id in batch_push.object_ids
+        if object_id not in objects_data
+    }
+    result = BatchPushResponse(
+        object_ids=batch_push.object_ids,
+        receiver_responses=[
+            BatchReceiverResponse(
+                endpoints_url=receiver.endpoints_url,
+                status_codes=status_codes,
+                errors=errors,
+            )
+            for receiver in batch_push.receivers
+        ],
+    )
+    logger.debug("Result of batch push enqueuing - %s", LazyDump(result))
     return result
 
 
@@ -184,12 +788,93 @@ async def http_push_to_client(
     push: Push,
     crud: Crud = Depends(get_crud),
     adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
+    outbox: Optional[Outbox] = Depends(get_outbox),
+    coalescer: Optional[PushCoalescer] = Depends(get_push_coalescer),
 ):
     logger.info("Received push http request.")
-    logger.debug("Received push data - `%s`" % push.model_dump())
+    logger.debug("Received push data - `%s`", LazyDump(push))
+    auth_token = get_auth_token(request, version)
+
+    if outbox is not None or coalescer is not None:
+        return await enqueue_push(
+            version, push, crud, adapter, outbox, auth_token, coalescer
+        )
+
+    return await push_object(
+        version, push, crud, adapter, auth_token, http_client
+    )
+
+
+# WARNING it's advised not to expose this endpoint
+@http_router.post(
+    "/{version}/batch",
+    status_code=200,
+    include_in_schema=False,
+    response_model=BatchPushResponse,
+)
+async def http_batch_push_to_client(
+    request: Request,
+    version: VersionNumber,
+    batch_push: BatchPush,
+    crud: Crud = Depends(get_crud),
+    adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
+    outbox: Optional[Outbox] = Depends(get_outbox),
+    coalescer: Optional[PushCoalescer] = Depends(get_push_coalescer),
+):
+    logger.info(
+        "Received batch push http request of %s objects.",
+        len(batch_push.object_ids),
+    )
+    logger.debug("Received batch push data - `%s`", LazyDump(batch_push))
     auth_token = get_auth_token(request, version)
 
-    return await push_object(version, push, crud, adapter, auth_token)
+    if outbox is not None or coalescer is not None:
+        return await enqueue_batch_push(
+            version, batch_push, crud, adapter, outbox, auth_token, coalescer
+        )
+    return await push_objects(
+        version, batch_push, crud, adapter, auth_token, http_client
+    )
+
+
+async def websocket_push(
+    version: VersionNumber,
+    data: dict,
+    crud: Crud,
+    adapter: Adapter,
+    auth_token: Union[str, None],
+    http_client: httpx.AsyncClient,
+    outbox: Optional[Outbox] = None,
+    coalescer: Optional[PushCoalescer] = None,
+) -> Union[PushResponse, BatchPushResponse]:
+    """Handle a push or a batch push received through the websocket."""
+    scheduled = outbox is not None or coalescer is not None
+    if "object_ids" in data:
+        batch_push = BatchPush(**data)
+        if scheduled:
+            return await enqueue_batch_push(
+                version,
+                batch_push,
+                crud,
+                adapter,
+                outbox,
+                auth_token,
+                coalescer,
+            )
+        return await push_objects(
+            version, batch_push, crud, adapter, auth_token, http_client
+        )
+
+    push = Push(**data)
+    if scheduled:
+        return await enqueue_push(
+            version, push, crud, adapter, outbox, auth_token, coalescer
+        )
+    return await push_object(
+        version, push, crud, adapter, auth_token, http_client
+    )
 
 
 websocket_router = APIRouter(
@@ -204,16 +889,63 @@ async def websocket_push_to_client(
     version: VersionNumber,
     crud: Crud = Depends(get_crud),
     adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
+    outbox: Optional[Outbox] = Depends(get_outbox),
+    coalescer: Optional[PushCoalescer] = Depends(get_push_coalescer),
 ):
     auth_token = get_auth_token(websocket, version)
     await websocket.accept()
+    # pushes are handled concurrently, answered in the order they complete
+    in_flight: Set[asyncio.Task] = set()
+    slots = asyncio.Semaphore(settings.PUSH_WS_MAX_IN_FLIGHT)
+    send_lock = asyncio.Lock()
 
-    while True:
-        data = await websocket.receive_json()
-        logger.debug("Received data through ws - `%s`" % data)
-        push = Push(**data)
-        push_response = await push_object(
-            version, push, crud, adapter, auth_token
-        )
-        logger.debug("Sending push response - `%s`" % push_response.model_dump())
-        await websocket.send_json(push_response.model_dump())
+    async def respond(data: Any) -> None:
+        correlation_id = None
+        try:
+            if not isinstance(data, dict):
+                raise TypeError("The push must be a JSON object.")
+            correlation_id = data.pop("correlation_id", None)
+            push_response = (
+                await websocket_push(
+                    version,
+                    data,
+                    crud,
+                    adapter,
+                    auth_token,
+                    http_client,
+                    outbox,
+                    coalescer,
+                )
+            ).model_dump()
+        except Exception as e:
+            logger.error(
+                "Websocket push `%s` failed with %s - %s",
+                correlation_id,
+                type(e).__name__,
+                e,
+            )
+            push_response = {"detail": str(e)}
+        if correlation_id is not None:
+            push_response["correlation_id"] = correlation_id
+        logger.debug("Sending push response - `%s`", push_response)
+        async with send_lock:
+            await websocket.send_json(push_response)
+
+    def release(task: asyncio.Task) -> None:
+        in_flight.discard(task)
+        slots.release()
+
+    try:
+        while True:
+            data = await websocket.receive_json()
+            logger.debug("Received data through ws - `%s`", data)
+            # stop reading while PUSH_WS_MAX_IN_FLIGHT pushes are pending
+            await slots.acquire()
+            task = asyncio.create_task(respond(data))
+            in_flight.add(task)
+            task.add_done_callback(release)
+    except WebSocketDisconnect:
+        logger.debug("Websocket push client disconnected.")
+    finally:
+        await asyncio.gather(*in_flight, return_exceptions=True)
@@ -0,0 +1,75 @@
+from typing import Any, Dict, List, Tuple
+
+from py_ocpi.core.utils import get_module_model
+from py_ocpi.modules.versions.enums import VersionNumber
+
+# (class name, module name) of the models used by BaseAdapter
+ADAPTER_MODELS = [
+    ("Location", "locations"),
+    ("Session", "sessions"),
+    ("ChargingPreferences", "sessions"),
+    ("Credentials", "credentials"),
+    ("Cdr", "cdrs"),
+    ("Tariff", "tariffs"),
+    ("CommandResponse", "commands"),
+    ("CommandResult", "commands"),
+    ("Token", "tokens"),
+    ("AuthorizationInfo", "tokens"),
+    ("ClientInfo", "hubclientinfo"),
+    ("ChargingProfileResponse", "chargingprofiles"),
+    ("ActiveChargingProfileResult", "chargingprofiles"),
+    ("ClearProfileResult", "chargingprofiles"),
+]
+
+
+class ModelRegistry:
+    """
+    Registry of OCPI schemas keyed by (module name, version name, class name).
+
+    Models are loaded once and afterwards resolved with a dict lookup
+    instead of importing the schemas module on every call.
+    """
+
+    def __init__(self) -> None:
+        self._models: Dict[Tuple[str, str, str], Any] = {}
+
+    def register(
+        self,
+        class_name: str,
+        module_name: str,
+        version_name: str,
+        model: Any,
+    ) -> None:
+        """Register (or replace) the model of the given module and version."""
+        key = (module_name, version_name, class_name)
+        self._models[key] = model
+
+    def get(self, class_name: str, module_name: str, version_name: str) -> Any:
+        """
+        Return the registered model, loading it from
+        `py_ocpi.modules.<module_name>.<version_name>.schemas` if missing.
+
+        :raises NotImplementedError: If the schema is not found.
+        """
+        key = (module_name, version_name, class_name)
+        try:
+            return self._models[key]
+        except KeyError:
+            model = get_module_model(class_name, module_name, version_name)
+            self._models[key] = model
+            return model
+
+    def load(self, version_numbers: List[VersionNumber]) -> None:
+        """Load the models used by BaseAdapter for the given versions."""
+        for version in version_numbers:
+            for class_name, module_name in ADAPTER_MODELS:
+                key = (module_name, version.name, class_name)
+                if key in self._models:
+                    continue
+                try:
+                    self.get(class_name, module_name, version.name)
+                except (NotImplementedError, AttributeError):
+                    continue
+
+
+model_registry = ModelRegistry()
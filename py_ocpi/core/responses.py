@@ -0,0 +1,165 @@
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Mapping,
+    Optional,
+)
+
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic_core import to_json
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class OCPIJSONResponse(JSONResponse):
+    """
+    JSON response of the OCPI envelope.
+
+    The content may hold adapted pydantic models, they are serialized
+    straight to JSON bytes by pydantic-core, without being dumped
+    and validated again against OCPIResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def get_timestamp() -> str:
+    return (
+        datetime.now(tz=timezone.utc)
+        .isoformat(timespec="seconds")
+        .replace("+00:00", "Z")
+    )
+
+
+def ocpi_response(
+    data: Any,
+    status_code: int,
+    status_message: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    http_status_code: int = 200,
+) -> OCPIJSONResponse:
+    """
+    Build the OCPI envelope response.
+
+    :param data: Adapted object(s), list or dict of the response.
+    :param status_code: OCPI status code.
+    :param status_message: OCPI status message.
+    :param headers: Headers to send, e.g. pagination headers
+      set on the endpoint response.
+    :param http_status_code: HTTP status code of the response.
+
+    :return: JSON response with the OCPIResponse content.
+    """
+    return OCPIJSONResponse(
+        {
+            "data": data,
+            "status_code": status_code,
+            "status_message": status_message,
+            "timestamp": get_timestamp(),
+        },
+        status_code=http_status_code,
+        headers=headers,
+    )
+
+
+def _render_envelope_tail(envelope_tail: dict) -> bytes:
+    # `{"status_code":...}` -> `,"status_code":...}`
+    return b"," + to_json(envelope_tail)[1:]
+
+
+def ocpi_raw_response(
+    data: bytes,
+    status_code: int,
+    status_message: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Build the OCPI envelope response around already serialized data.
+
+    :param data: JSON bytes of the response data.
+    :param status_code: OCPI status code.
+    :param status_message: OCPI status message.
+    :param headers: Headers to send.
+
+    :return: JSON response with the OCPIResponse content.
+    """
+    envelope_tail = {
+        "status_code": status_code,
+        "status_message": status_message,
+        "timestamp": get_timestamp(),
+    }
+    return Response(
+        b'{"data":' + data + _render_envelope_tail(envelope_tail),
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+class OCPIStreamingResponse(StreamingResponse):
+    """
+    Streamed JSON response of the OCPI envelope.
+
+    Writes `{"data":[`, then every item as soon as it is available,
+    then the tail of the envelope, so the page is never held in memory.
+    """
+
+    media_type = "application/json"
+
+
+async def _stream_envelope(
+    items: AsyncIterable[Any],
+    adapt: Callable[[Any], Any],
+    envelope_tail: dict,
+) -> AsyncIterator[bytes]:
+    # the head is sent at once, items are then sent in chunks
+    # of STREAM_CHUNK_SIZE bytes
+    yield b'{"data":['
+    chunk = bytearray()
+    separator = b""
+    async for item in items:
+        chunk += separator + to_json(adapt(item))
+        separator = b","
+        if len(chunk) >= STREAM_CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+    chunk += b"]" + _render_envelope_tail(envelope_tail)
+    yield bytes(chunk)
+
+
+def ocpi_stream_response(
+    items: AsyncIterable[Any],
+    adapt: Callable[[Any], Any],
+    status_code: int,
+    status_message: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> OCPIStreamingResponse:
+    """
+    Build the OCPI envelope response streaming a list of objects.
+
+    The rendered body is the same as the one of `ocpi_response`.
+
+    :param items: Async iterable of the objects data.
+    :param adapt: Adapter function applied to every object.
+    :param status_code: OCPI status code.
+    :param status_message: OCPI status message.
+    :param headers: Headers to send, e.g. pagination headers
+      set on the endpoint response.
+
+    :return: Streaming response with the OCPIResponse content.
+    """
+    return OCPIStreamingResponse(
+        _stream_envelope(
+            items,
+            adapt,
+            {
+                "status_code": status_code,
+                "status_message": status_message,
+                "timestamp": get_timestamp(),
+            },
+        ),
+        headers=headers,
+    )
@@ -0,0 +1,297 @@
+"""
+Scheduler of the operations waiting for a result from the Charge Point,
+e.g. commands and charging profile requests, which is then sent to the
+`response_url` of the partner.
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections import defaultdict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from py_ocpi.core.config import logger
+from py_ocpi.core.crud import Crud
+from py_ocpi.core.enums import ModuleID, RoleEnum
+from py_ocpi.core.jobs import job_executor
+from py_ocpi.core.utils import crud_implements
+
+# seconds between the polls of the pending operations
+POLL_INTERVAL = 2
+
+Finish = Callable[[Any], Awaitable[None]]
+
+
+def truthy_result(result: Any) -> Optional[Any]:
+    return result or None
+
+
+class Poll(NamedTuple):
+    """
+    :param crud (Crud): The crud polled for the result.
+    :param module (ModuleID): The module of `crud.get`.
+    :param role (RoleEnum): The role of `crud.get`.
+    :param kwargs (dict): The keyword arguments of `crud.get`.
+    :param result (Callable): Maps the polled data to the result, None
+      while the operation is pending. Truthy data is the result by default.
+    """
+
+    crud: Crud
+    module: ModuleID
+    role: RoleEnum
+    kwargs: dict
+    result: Callable[[Any], Optional[Any]] = truthy_result
+
+
+_UNRESOLVED = object()
+
+
+class PendingOperation:
+    __slots__ = ("key", "deadline", "finish", "poll", "job_type", "result")
+
+    def __init__(
+        self,
+        key: str,
+        deadline: float,
+        finish: Optional[Finish] = None,
+        poll: Optional[Poll] = None,
+        job_type: str = "",
+    ) -> None:
+        self.key = key
+        self.deadline = deadline
+        self.finish = finish
+        self.poll = poll
+        self.job_type = job_type
+        # resolved before the operation was scheduled
+        self.result: Any = _UNRESOLVED
+
+
+class DeadlineScheduler:
+    """
+    Pending operations by their key, the `response_url` of the partner
+    which is unique per operation. A single task polls the results of all
+    the pending operations every `interval` seconds, a call per crud,
+    module and role, and finishes the operations whose deadline passed
+    with None. The results are sent by the jobs of `job_executor`.
+
+    :param interval (float): Seconds between the polls.
+    """
+
+    def __init__(self, interval: float = POLL_INTERVAL) -> None:
+        self.interval = interval
+        self._pending: Dict[str, PendingOperation] = {}
+        self._deadlines: List[Tuple[float, int, PendingOperation]] = []
+        self._counter = itertools.count()
+        self._fresh: List[PendingOperation] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def reserve(self, key: str, timeout: float) -> None:
+        """
+        Keep the result of an operation resolved before it's scheduled,
+        e.g. while the request is sent to the Charge Point.
+        """
+        if key not in self._pending:
+            self._add(PendingOperation(key, self._time() + timeout))
+
+    def schedule(
+        self,
+        key: str,
+        timeout: float,
+        finish: Finish,
+        poll: Optional[Poll] = None,
+        job_type: str = "results",
+    ) -> None:
+        """
+        Wait for the result of an operation.
+
+        :param key (str): The response_url of the operation.
+        :param timeout (float): Seconds to wait for the result.
+        :param finish (Finish): Sends the result, None if it didn't arrive
+          in time.
+        :param poll (Poll): Polls the crud for the result, right away and
+          then every `interval` seconds, until it's resolved otherwise.
+        :param job_type (str): The type of the job sending the result.
+        """
+        reserved = self._pending.get(key)
+        if reserved is not None and reserved.finish is None:
+            if reserved.result is not _UNRESOLVED:
+                del self._pending[key]
+                self._finish(job_type, finish, reserved.result)
+                return
+        operation = PendingOperation(
+            key, self._time() + timeout, finish, poll, job_type
+        )
+        self._add(operation)
+        if poll is not None:
+            self._fresh.append(operation)
+            self._wakeup.set()
+
+    def resolve(self, key: str, result: Any) -> bool:
+        """
+        Finish an operation with its result, e.g. from the callback of the
+        backend receiving it from the Charge Point. Must be called from the
+        event loop of the application.
+
+        :param key (str): The response_url of the operation.
+        :param result (Any): The result, as `Crud.get` returns it.
+
+        :return: False if no operation waits for this result, e.g. it timed
+          out already.
+        """
+        operation = self._pending.get(key)
+        if operation is None:
+            return False
+        if operation.finish is None:
+            operation.result = result
+            return True
+        del self._pending[key]
+        self._finish(operation.job_type, operation.finish, result)
+        return True
+
+    def discard(self, key: str) -> None:
+        """Stop waiting for the result of an operation."""
+        self._pending.pop(key, None)
+
+    async def stop(self) -> None:
+        """Stop polling, the results being sent are left to the jobs."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._pending:
+            logger.warning(
+                "%s operations stopped waiting for their result.",
+                len(self._pending),
+            )
+        self._pending.clear()
+        self._deadlines.clear()
+        self._fresh.clear()
+
+    def _time(self) -> float:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # tasks and timers of another event loop can't be awaited
+            self._loop = loop
+            self._task = None
+            self._pending.clear()
+            self._deadlines.clear()
+            self._fresh.clear()
+            self._wakeup = asyncio.Event()
+        return loop.time()
+
+    def _add(self, operation: PendingOperation) -> None:
+        self._pending[operation.key] = operation
+        heapq.heappush(
+            self._deadlines,
+            (operation.deadline, next(self._counter), operation),
+        )
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        elif self._deadlines[0][2] is operation:
+            self._wakeup.set()
+
+    def _is_pending(self, operation: PendingOperation) -> bool:
+        return self._pending.get(operation.key) is operation
+
+    def _finish(self, job_type: str, finish: Finish, result: Any) -> None:
+        job_executor.submit(job_type, finish, result)
+
+    def _expire(self, now: float) -> None:
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, operation = heapq.heappop(self._deadlines)
+            if not self._is_pending(operation):
+                continue
+            del self._pending[operation.key]
+            if operation.finish is not None:
+                self._finish(operation.job_type, operation.finish, None)
+
+    async def _poll(self, operations: List[PendingOperation]) -> None:
+        groups: Dict[Tuple[Any, ModuleID, RoleEnum], list] = defaultdict(list)
+        for operation in operations:
+            poll: Poll = operation.poll  # type: ignore
+            groups[(poll.crud, poll.module, poll.role)].append(operation)
+
+        async def poll_group(crud, module, role, group) -> None:
+            kwargs = [operation.poll.kwargs for operation in group]
+            try:
+                if crud_implements(crud, "get_results"):
+                    results = await crud.get_results(module, role, kwargs)
+                else:
+                    # since operations have no id, 0 is used for crud.get
+                    results = await asyncio.gather(
+                        *(crud.get(module, role, 0, **kw) for kw in kwargs)
+                    )
+            except Exception as e:
+                logger.error(
+                    "Polling %s results of `%s` failed with %s - %s",
+                    len(group),
+                    module,
+                    type(e).__name__,
+                    e,
+                )
+                return
+            for operation, data in zip(group, results):
+                result = operation.poll.result(data)
+                if result is not None and self._is_pending(operation):
+                    del self._pending[operation.key]
+                    self._finish(operation.job_type, operation.finish, result)
+
+        await asyncio.gather(
+            *(
+                poll_group(crud, module, role, group)
+                for (crud, module, role), group in groups.items()
+            )
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + self.interval
+        while self._pending:
+            self._wakeup.clear()
+            now = loop.time()
+            if now >= next_tick:
+                next_tick = now + self.interval
+                self._fresh.clear()
+                due = [
+                    operation
+                    for operation in self._pending.values()
+                    if operation.poll is not None
+                ]
+            else:
+                due = [op for op in self._fresh if self._is_pending(op)]
+                self._fresh.clear()
+            if due:
+                await self._poll(due)
+
+            now = loop.time()
+            self._expire(now)
+            wakeup_at = next_tick
+            if self._deadlines:
+                wakeup_at = min(wakeup_at, self._deadlines[0][0])
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), max(wakeup_at - now, 0)
+                )
+            except asyncio.TimeoutError:
+                pass
+        # deadlines of the operations resolved in time
+        self._deadlines.clear()
+
+
+scheduler = DeadlineScheduler()
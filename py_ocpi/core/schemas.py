@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Union
 
 from pydantic import BaseModel, Field
 
@@ -43,3 +43,26 @@ class ReceiverResponse(BaseModel):
 
 class PushResponse(BaseModel):
     receiver_responses: List[ReceiverResponse]
+
+
+class BatchPush(BaseModel):
+    module_id: ModuleID
+    object_ids: List[str]
+    receivers: List[Receiver]
+
+
+class BatchReceiverResponse(BaseModel):
+    """
+    Status codes of the objects pushed to a receiver, in the order of
+    `object_ids`, with the error details of the failed ones.
+    """
+
+    endpoints_url: URL
+    status_codes: List[int]
+    errors: Dict[str, str] = {}
+    detail: Optional[str] = None
+
+
+class BatchPushResponse(BaseModel):
+    object_ids: List[str]
+    receiver_responses: List[BatchReceiverResponse]
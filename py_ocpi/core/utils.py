@@ -1,14 +1,19 @@
 import importlib
+import json
 import urllib
 import base64
-from typing import Union, Any
+from datetime import datetime
+from typing import AsyncIterator, Callable, Optional, Tuple, Union, Any
 
 from fastapi import Response, Request
 from pydantic import BaseModel
 
+from py_ocpi.core import status
 from py_ocpi.core.config import logger
+from py_ocpi.core.crud import Crud
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.config import settings
+from py_ocpi.core.responses import ocpi_response, ocpi_stream_response
 from py_ocpi.modules.versions.enums import VersionNumber
 
 
@@ -25,6 +30,9 @@ def get_auth_token(
     request: Request,
     version: VersionNumber = VersionNumber.v_2_2_1,
 ) -> Union[str, None]:
+    party_context = getattr(request.state, "party_context", None)
+    if party_context is not None:
+        return party_context.token
     headers = request.headers
     headers_token = headers.get("authorization", "Token Null")
     token = headers_token.split()[1]
@@ -35,23 +43,62 @@ def get_auth_token(
     return decode_string_base64(token)
 
 
-async def get_list(
+# field identifying the objects of a module in pagination cursors
+CURSOR_ID_FIELDS = {ModuleID.tokens: "uid"}
+
+
+def encode_cursor(last_updated: Union[datetime, str], id: str) -> str:
+    if isinstance(last_updated, datetime):
+        last_updated = last_updated.isoformat()
+    payload = json.dumps([str(last_updated), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Decode a pagination cursor.
+
+    :param cursor: Cursor sent in the `cursor` query parameter.
+
+    :return: `last_updated` and `id` of the last object of the previous page.
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_updated, id = json.loads(payload)
+        return {
+            "last_updated": datetime.fromisoformat(last_updated),
+            "id": str(id),
+        }
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor.") from exc
+
+
+def get_cursor_key(module: ModuleID, data: Any) -> Tuple[Any, Any]:
+    """Return (last_updated, id) of an object data, dict or model."""
+    id_field = CURSOR_ID_FIELDS.get(module, "id")
+    if isinstance(data, dict):
+        return data["last_updated"], data[id_field]
+    return data.last_updated, getattr(data, id_field)
+
+
+def set_list_pagination_headers(
     response: Response,
     filters: dict,
     module: ModuleID,
-    role: RoleEnum,
     version: VersionNumber,
-    crud,
-    *args,
-    **kwargs,
+    total: int,
+    is_last_page: bool,
+    next_cursor_key: Optional[Tuple[Any, Any]] = None,
 ):
-    data_list, total, is_last_page = await crud.list(
-        module, role, filters, *args, version=version, **kwargs
-    )
-
     link = ""
     params = dict(**filters)
-    params["offset"] = filters["offset"] + filters["limit"]
+    params.pop("cursor", None)
+    if next_cursor_key is not None:
+        params.pop("offset")
+        params["cursor"] = encode_cursor(*next_cursor_key)
+    else:
+        params["offset"] = filters["offset"] + filters["limit"]
     if not is_last_page:
         link = (
             f"<https://{settings.OCPI_HOST}/{settings.OCPI_PREFIX}/cpo"
@@ -59,14 +106,126 @@ async def get_list(
             f'?{urllib.parse.urlencode(params)}>; rel="next"'  # type: ignore
         )
 
-    set_pagination_headers(response, link, total, filters["limit"])
+    return set_pagination_headers(response, link, total, filters["limit"])
+
+
+async def get_list(
+    response: Response,
+    filters: dict,
+    module: ModuleID,
+    role: RoleEnum,
+    version: VersionNumber,
+    crud,
+    *args,
+    **kwargs,
+):
+    data_list, total, is_last_page = await crud.list(
+        module, role, filters, *args, version=version, **kwargs
+    )
+
+    next_cursor_key = None
+    if settings.CURSOR_PAGINATION and data_list:
+        next_cursor_key = get_cursor_key(module, data_list[-1])
+    set_list_pagination_headers(
+        response, filters, module, version, total, is_last_page, next_cursor_key
+    )
     logger.debug(
-        f"List / total / is_last_page -> "
-        f"{len(data_list)} / {total} / {is_last_page}."
+        "List / total / is_last_page -> %s / %s / %s.",
+        len(data_list),
+        total,
+        is_last_page,
     )
     return data_list
 
 
+def crud_implements(crud, method_name: str) -> bool:
+    """Return True if the crud class defines an optional Crud method."""
+    crud = getattr(crud, "__wrapped__", crud)
+    crud_class = crud if isinstance(crud, type) else type(crud)
+    for base in crud_class.__mro__:
+        if method_name in vars(base):
+            return base is not Crud
+    return False
+
+
+async def iter_list(
+    response: Response,
+    filters: dict,
+    module: ModuleID,
+    role: RoleEnum,
+    version: VersionNumber,
+    crud,
+    *args,
+    **kwargs,
+) -> AsyncIterator[Any]:
+    items, total, is_last_page, *next_cursor_key = await crud.iter_list(
+        module, role, filters, *args, version=version, **kwargs
+    )
+
+    # streamed objects are unknown yet, the crud may return
+    # (last_updated, id) of the last object of the page for the cursor
+    set_list_pagination_headers(
+        response,
+        filters,
+        module,
+        version,
+        total,
+        is_last_page,
+        (
+            next_cursor_key[0]
+            if settings.CURSOR_PAGINATION and next_cursor_key
+            else None
+        ),
+    )
+    logger.debug(
+        "Streamed list total / is_last_page -> %s / %s.", total, is_last_page
+    )
+    return items
+
+
+async def get_list_response(
+    response: Response,
+    filters: dict,
+    module: ModuleID,
+    role: RoleEnum,
+    version: VersionNumber,
+    crud,
+    adapt: Callable[[Any], Any],
+    *args,
+    **kwargs,
+) -> Response:
+    """
+    Build the response of a list endpoint.
+
+    The list is streamed if crud implements `iter_list`, otherwise
+    the whole page is read with `list` and sent at once.
+
+    :param adapt: Adapter function applied to every object.
+
+    :return: Response with the adapted objects and pagination headers.
+    """
+    if crud_implements(crud, "iter_list"):
+        items = await iter_list(
+            response, filters, module, role, version, crud, *args, **kwargs
+        )
+        return ocpi_stream_response(
+            items,
+            adapt,
+            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+            headers=response.headers,
+        )
+
+    data_list = await get_list(
+        response, filters, module, role, version, crud, *args, **kwargs
+    )
+    logger.debug("Amount of objects in response: %s", len(data_list))
+    return ocpi_response(
+        data=[adapt(data) for data in data_list],
+        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        headers=response.headers,
+    )
+
+
 def partially_update_attributes(instance: BaseModel, attributes: dict):
     for key, value in attributes.items():
         setattr(instance, key, value)
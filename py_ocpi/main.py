@@ -1,13 +1,16 @@
-from typing import Any, List
+import asyncio
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from fastapi import FastAPI, Request, status as fastapistatus
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
 from py_ocpi.core.endpoints import ENDPOINTS
 
 from py_ocpi.modules.versions import router as versions_router
@@ -23,60 +26,135 @@ from py_ocpi.core.dependencies import (
 )
 from py_ocpi.core import status
 from py_ocpi.core.adapter import BaseAdapter
+from py_ocpi.core.cache import CachedCrud
+from py_ocpi.core.coalescing import PushCoalescer
+from py_ocpi.core.compression import ModulesGZipMiddleware
 from py_ocpi.core.enums import RoleEnum, ModuleID
 from py_ocpi.core.config import settings, logger
 from py_ocpi.core.data_types import URL
-from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.http_client import create_http_client
+from py_ocpi.core.jobs import job_executor
+from py_ocpi.core.outbox import Outbox, OutboxStore, SQLiteOutboxStore
+from py_ocpi.core.registry import model_registry
+from py_ocpi.core.responses import ocpi_response
+from py_ocpi.core.scheduler import scheduler
 from py_ocpi.core.exceptions import AuthorizationOCPIError, NotFoundOCPIError
 from py_ocpi.core.push import (
     http_router as http_push_router,
     websocket_router as websocket_push_router,
+    send_outbox_job,
+    submit_outbox_jobs,
 )
 from py_ocpi.core.routers import ROUTERS
 
+# running applications by event loop, they share the scheduler and
+# the job executor
+_running_apps: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Create the shared HTTP client and run the push outbox
+    and coalescer, if any. Stop the scheduler of the pending
+    operations and drain the background jobs on shutdown of
+    the last running application.
+    """
+    loop = asyncio.get_running_loop()
+    _running_apps[loop] = _running_apps.get(loop, 0) + 1
+    http_client = create_http_client()
+    app.state.http_client = http_client
+    outbox = getattr(app.state, "outbox", None)
+    if outbox is not None:
+        outbox.start(http_client)
+    coalescer = getattr(app.state, "push_coalescer", None)
+    if coalescer is not None:
+        coalescer.start()
+    try:
+        yield
+    finally:
+        # the held pushes are sent before the outbox stops
+        if coalescer is not None:
+            await coalescer.stop()
+        if outbox is not None:
+            await outbox.stop()
+        _running_apps[loop] -= 1
+        if not _running_apps[loop]:
+            del _running_apps[loop]
+            await scheduler.stop()
+            await job_executor.stop()
+        await http_client.aclose()
+
+
+def exception_response(exc: Exception) -> JSONResponse:
+    """Map an exception raised while handling a request to its response."""
+    if isinstance(exc, AuthorizationOCPIError):
+        logger.warning("OCPI middleware AuthorizationOCPIError exception.")
+        return JSONResponse(
+            content={"detail": str(exc)},
+            status_code=fastapistatus.HTTP_403_FORBIDDEN,
+        )
+    if isinstance(exc, NotFoundOCPIError):
+        logger.warning("OCPI middleware NotFoundOCPIError exception.")
+        return JSONResponse(
+            content={"detail": str(exc)},
+            status_code=fastapistatus.HTTP_404_NOT_FOUND,
+        )
+    if isinstance(exc, ValidationError):
+        logger.warning("OCPI middleware ValidationError exception: %s", exc)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ValidationError details: %s", exc.errors())
+        return ocpi_response(
+            data=[],
+            **status.OCPI_3000_GENERIC_SERVER_ERROR,
+            http_status_code=fastapistatus.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+    logger.warning("Unknown exception: %s.", exc)
+    return ocpi_response(data=[], **status.OCPI_3000_GENERIC_SERVER_ERROR)
+
+
+class ExceptionHandlerMiddleware:
+    """
+    ASGI middleware turning the exceptions raised by the application
+    into OCPI error responses.
+
+    Responses are passed through untouched, an exception raised once
+    the response has started can't be answered and is re-raised.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            request = Request(scope)
+            logger.debug("%s: %s", request.method, request.url)
+            logger.debug("Request headers - %s", request.headers)
+
+        status_code = None
 
-class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ):
-        logger.debug("%s: %s" % (request.method, request.url))
-        logger.debug("Request headers - %s" % request.headers)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response = await call_next(request)
-        except AuthorizationOCPIError as e:
-            logger.warning("OCPI middleware AuthorizationOCPIError exception.")
-            response = JSONResponse(
-                content={"detail": str(e)},
-                status_code=fastapistatus.HTTP_403_FORBIDDEN,
-            )
-        except NotFoundOCPIError as e:
-            logger.warning("OCPI middleware NotFoundOCPIError exception.")
-            response = JSONResponse(
-                content={"detail": str(e)},
-                status_code=fastapistatus.HTTP_404_NOT_FOUND,
-            )
-        except ValidationError as e:
-            logger.warning(f"OCPI middleware ValidationError exception: {e}")
-            logger.debug(f"ValidationError details: {e.errors()}")
-            response = JSONResponse(
-                OCPIResponse(
-                    data=[],
-                    **status.OCPI_3000_GENERIC_SERVER_ERROR,
-                ).model_dump(),
-                status_code=fastapistatus.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.warning(f"Unknown exception: {str(e)}.")
-            response = JSONResponse(
-                OCPIResponse(
-                    data=[],
-                    **status.OCPI_3000_GENERIC_SERVER_ERROR,
-                ).model_dump()
-            )
+            if status_code is not None:
+                raise
+            response = exception_response(e)
+            status_code = response.status_code
+            await response(scope, receive, send)
 
-        logger.debug(f"Response status_code -> {response.status_code}.")
-        return response
+        if debug:
+            logger.debug("Response status_code -> %s.", status_code)
 
 
 def get_application(
@@ -88,6 +166,8 @@ def get_application(
     adapter: Any = BaseAdapter,
     http_push: bool = False,
     websocket_push: bool = False,
+    crud_cache_ttl: Optional[Dict[ModuleID, float]] = None,
+    push_outbox: Union[bool, OutboxStore] = False,
 ) -> FastAPI:
     """
     OCPI application initializer.
@@ -105,6 +185,14 @@ def get_application(
       corresponding client data update could be made.
     :param websocket_push: If True, add websocket endpoint where data updates
       will be shared.
+    :param crud_cache_ttl: Seconds `crud.get` results of a module are
+      cached, by module. If given, crud is wrapped in CachedCrud, which
+      is available as `app.state.crud`.
+    :param push_outbox: If set, the push endpoints store the pushes in
+      an outbox which sends and retries them in the background, and
+      answer right away. `True` stores them in the SQLite database
+      OUTBOX_DB_PATH, which must be set, otherwise give an OutboxStore.
+      The outbox is available as `app.state.outbox`.
 
     :return: FastApi application.
     """
@@ -113,8 +201,17 @@ def get_application(
         docs_url=f"/{settings.OCPI_PREFIX}/docs",
         redoc_url=f"/{settings.OCPI_PREFIX}/redoc",
         openapi_url=f"/{settings.OCPI_PREFIX}/openapi.json",
+        lifespan=lifespan,
     )
 
+    # innermost middleware, it must see the body as sent by the endpoints
+    if settings.GZIP_MODULES:
+        _app.add_middleware(
+            ModulesGZipMiddleware,
+            modules=settings.GZIP_MODULES,
+            minimum_size=settings.GZIP_MINIMUM_SIZE,
+            compresslevel=settings.GZIP_COMPRESS_LEVEL,
+        )
     _app.add_middleware(
         CORSMiddleware,
         allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
@@ -141,6 +238,28 @@ def get_application(
             prefix=f"/{settings.PUSH_PREFIX}",
         )
 
+    if push_outbox:
+        if push_outbox is True:
+            if not settings.OUTBOX_DB_PATH:
+                raise ValueError("OUTBOX_DB_PATH must be set for the outbox.")
+            push_outbox = SQLiteOutboxStore(settings.OUTBOX_DB_PATH)
+        _app.state.outbox = Outbox(push_outbox, send_outbox_job)
+
+    if (http_push or websocket_push) and settings.PUSH_COALESCE_DEBOUNCE > 0:
+        # the timer is started by the first push if the lifespan
+        # doesn't run, e.g. in a mounted application
+        _app.state.push_coalescer = PushCoalescer(
+            settings.PUSH_COALESCE_DEBOUNCE,
+            settings.PUSH_COALESCE_MAX_DELAY,
+            (
+                _app.state.outbox.enqueue
+                if push_outbox
+                else partial(submit_outbox_jobs, _app)
+            ),
+        )
+
+    model_registry.load(version_numbers)
+
     versions = []
     version_endpoints: dict[str, list] = {}
 
@@ -192,6 +311,15 @@ def get_application(
                     if endpoint:
                         version_endpoints[version].append(endpoint)
 
+    if crud_cache_ttl:
+        crud = CachedCrud(
+            crud,
+            ttl=crud_cache_ttl,
+            maxsize=settings.CRUD_CACHE_MAX_SIZE,
+            negative_ttl=settings.CRUD_CACHE_NEGATIVE_TTL,
+        )
+    _app.state.crud = crud
+
     def override_get_crud():
         return crud
 
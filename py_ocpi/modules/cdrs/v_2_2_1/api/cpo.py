@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, Response, Request
 
 from py_ocpi.modules.versions.enums import VersionNumber
-from py_ocpi.core.utils import get_auth_token, get_list
-from py_ocpi.core import status
+from py_ocpi.core.utils import get_auth_token, get_list_response
 from py_ocpi.core.schemas import OCPIResponse
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core.enums import ModuleID, RoleEnum
@@ -44,22 +46,16 @@ async def get_cdrs(
     """
     logger.info("Received request to get cdrs.")
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
-    data_list = await get_list(
+    return await get_list_response(
         response,
         filters,
         ModuleID.cdrs,
         RoleEnum.cpo,
         VersionNumber.v_2_2_1,
         crud,
+        adapter.cdr_adapter,
         auth_token=auth_token,
-    )
-
-    cdrs = []
-    for data in data_list:
-        cdrs.append(adapter.cdr_adapter(data).model_dump())
-    logger.debug(f"Amount of cdrs in response: {len(cdrs)}")
-    return OCPIResponse(
-        data=cdrs,
-        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        party_context=party_context,
     )
@@ -5,10 +5,15 @@ from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.core.utils import get_auth_token
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.data_types import CiString
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.exceptions import NotFoundOCPIError
@@ -42,22 +47,24 @@ async def get_cdr(
     **Raises:**
         NotFoundOCPIError: If the CDR is not found.
     """
-    logger.info("Received request to get cdr with id - `%s`." % cdr_id)
+    logger.info("Received request to get cdr with id - `%s`.", cdr_id)
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.cdrs,
         RoleEnum.emsp,
         cdr_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
     if data:
-        return OCPIResponse(
-            data=[adapter.cdr_adapter(data).model_dump()],
+        return ocpi_response(
+            data=[adapter.cdr_adapter(data)],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("CDR with id `%s` was not found." % cdr_id)
+    logger.debug("CDR with id `%s` was not found.", cdr_id)
     raise NotFoundOCPIError
 
 
@@ -81,14 +88,16 @@ async def add_cdr(
         The OCPIResponse containing the created CDR data.
     """
     logger.info("Received request to create cdr.")
-    logger.debug("CDR data to create - %s" % cdr.model_dump())
+    logger.debug("CDR data to create - %s", LazyDump(cdr))
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.create(
         ModuleID.cdrs,
         RoleEnum.emsp,
         cdr.model_dump(),
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
 
@@ -99,7 +108,8 @@ async def add_cdr(
     )
     response.headers.append("Location", cdr_url)
 
-    return OCPIResponse(
-        data=[cdr_data.model_dump()],
+    return ocpi_response(
+        data=[cdr_data],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        headers=response.headers,
     )
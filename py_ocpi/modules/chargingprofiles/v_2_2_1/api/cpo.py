@@ -1,21 +1,27 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, Request
+import httpx
+from fastapi import APIRouter, Depends, Request
 
 from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.core.utils import get_auth_token
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.data_types import CiString, URL
 from py_ocpi.core.enums import ModuleID, RoleEnum, Action
-from py_ocpi.core.dependencies import get_crud, get_adapter
+from py_ocpi.core.dependencies import get_crud, get_adapter, get_http_client
 
 from py_ocpi.modules.chargingprofiles.v_2_2_1.background_tasks import (
-    send_get_chargingprofile,
-    send_delete_chargingprofile,
-    send_update_chargingprofile,
+    schedule_get_chargingprofile,
+    schedule_delete_chargingprofile,
+    schedule_update_chargingprofile,
 )
 from py_ocpi.modules.chargingprofiles.v_2_2_1.schemas import (
     ChargingProfileResponse,
@@ -35,9 +41,9 @@ async def get_chargingprofile(
     session_id: CiString(36),  # type: ignore
     duration: int,
     response_url: URL,
-    background_tasks: BackgroundTasks,
     crud: Crud = Depends(get_crud),
     adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """
     Get Charging Profile.
@@ -58,16 +64,18 @@ async def get_chargingprofile(
         - NotFoundOCPIError: If the specified charging session is not found.
     """
     logger.info(
-        "Received request to get charging profile with session_id - `%s`."
-        % session_id
+        "Received request to get charging profile with session_id - `%s`.",
+        session_id,
     )
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     session = await crud.get(
         ModuleID.sessions,
         RoleEnum.cpo,
         session_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
 
@@ -80,6 +88,7 @@ async def get_chargingprofile(
             duration=duration,
             response_url=response_url,
             auth_token=auth_token,
+            party_context=party_context,
             version=VersionNumber.v_2_2_1,
         )
 
@@ -88,20 +97,20 @@ async def get_chargingprofile(
                 charging_profile_response["result"]
                 == ChargingProfileResponseType.accepted
             ):
-                background_tasks.add_task(
-                    send_get_chargingprofile,
+                schedule_get_chargingprofile(
                     session_id=session_id,
                     duration=duration,
                     response_url=response_url,
                     auth_token=auth_token,
                     crud=crud,
                     adapter=adapter,
+                    http_client=http_client,
                 )
-            return OCPIResponse(
+            return ocpi_response(
                 data=[
                     adapter.charging_profile_response_adapter(
                         charging_profile_response
-                    ).model_dump()
+                    )
                 ],
                 **status.OCPI_1000_GENERIC_SUCESS_CODE,
             )
@@ -112,17 +121,17 @@ async def get_chargingprofile(
         charging_profile_response = ChargingProfileResponse(
             result=ChargingProfileResponseType.rejected, timeout=0
         )
-        return OCPIResponse(
-            data=[charging_profile_response.model_dump()],
+        return ocpi_response(
+            data=[charging_profile_response],
             **status.OCPI_3000_GENERIC_SERVER_ERROR,
         )
 
-    logger.info("Session with id `%s` was not found." % session_id)
+    logger.info("Session with id `%s` was not found.", session_id)
     charging_profile_response = ChargingProfileResponse(
         result=ChargingProfileResponseType.rejected, timeout=0
     )
-    return OCPIResponse(
-        data=[charging_profile_response.model_dump()],
+    return ocpi_response(
+        data=[charging_profile_response],
         **status.OCPI_2000_GENERIC_CLIENT_ERROR,
     )
 
@@ -132,9 +141,9 @@ async def add_or_update_chargingprofile(
     request: Request,
     session_id: CiString(36),  # type: ignore
     charging_profile: SetChargingProfile,
-    background_tasks: BackgroundTasks,
     crud: Crud = Depends(get_crud),
     adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """
     Add or Update Charging Profile.
@@ -154,17 +163,19 @@ async def add_or_update_chargingprofile(
         - NotFoundOCPIError: If the specified charging session is not found.
     """
     logger.info(
-        "Received request to get charging profile with session_id - `%s`."
-        % session_id
+        "Received request to get charging profile with session_id - `%s`.",
+        session_id,
     )
-    logger.debug("Set charging profile data - `%s`" % charging_profile.model_dump())
+    logger.debug("Set charging profile data - `%s`", LazyDump(charging_profile))
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     session = await crud.get(
         ModuleID.sessions,
         RoleEnum.cpo,
         session_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
 
@@ -177,6 +188,7 @@ async def add_or_update_chargingprofile(
             session=session,
             response_url=charging_profile.response_url,
             auth_token=auth_token,
+            party_context=party_context,
             version=VersionNumber.v_2_2_1,
         )
 
@@ -185,20 +197,20 @@ async def add_or_update_chargingprofile(
                 charging_profile_response["result"]
                 == ChargingProfileResponseType.accepted
             ):
-                background_tasks.add_task(
-                    send_update_chargingprofile,
+                schedule_update_chargingprofile(
                     charging_profile=charging_profile,
                     session_id=session_id,
                     response_url=charging_profile.response_url,
                     auth_token=auth_token,
                     crud=crud,
                     adapter=adapter,
+                    http_client=http_client,
                 )
-            return OCPIResponse(
+            return ocpi_response(
                 data=[
                     adapter.charging_profile_response_adapter(
                         charging_profile_response
-                    ).model_dump()
+                    )
                 ],
                 **status.OCPI_1000_GENERIC_SUCESS_CODE,
             )
@@ -209,17 +221,17 @@ async def add_or_update_chargingprofile(
         charging_profile_response = ChargingProfileResponse(
             result=ChargingProfileResponseType.rejected, timeout=0
         )
-        return OCPIResponse(
-            data=[charging_profile_response.model_dump()],
+        return ocpi_response(
+            data=[charging_profile_response],
             **status.OCPI_3000_GENERIC_SERVER_ERROR,
         )
 
-    logger.info("Session with id `%s` was not found." % session_id)
+    logger.info("Session with id `%s` was not found.", session_id)
     charging_profile_response = ChargingProfileResponse(
         result=ChargingProfileResponseType.rejected, timeout=0
     )
-    return OCPIResponse(
-        data=[charging_profile_response.model_dump()],
+    return ocpi_response(
+        data=[charging_profile_response],
         **status.OCPI_2000_GENERIC_CLIENT_ERROR,
     )
 
@@ -229,9 +241,9 @@ async def delete_chargingprofile(
     request: Request,
     session_id: CiString(36),  # type: ignore
     response_url: URL,
-    background_tasks: BackgroundTasks,
     crud: Crud = Depends(get_crud),
     adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """
     Delete Charging Profile.
@@ -251,16 +263,18 @@ async def delete_chargingprofile(
         - NotFoundOCPIError: If the specified charging session is not found.
     """
     logger.info(
-        "Received request to get charging profile with session_id - `%s`."
-        % session_id
+        "Received request to get charging profile with session_id - `%s`.",
+        session_id,
     )
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     session = await crud.get(
         ModuleID.sessions,
         RoleEnum.cpo,
         session_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
 
@@ -272,6 +286,7 @@ async def delete_chargingprofile(
             session=session,
             response_url=response_url,
             auth_token=auth_token,
+            party_context=party_context,
             version=VersionNumber.v_2_2_1,
         )
 
@@ -280,19 +295,19 @@ async def delete_chargingprofile(
                 charging_profile_response["result"]
                 == ChargingProfileResponseType.accepted
             ):
-                background_tasks.add_task(
-                    send_delete_chargingprofile,
+                schedule_delete_chargingprofile(
                     session_id=session_id,
                     response_url=response_url,
                     auth_token=auth_token,
                     crud=crud,
                     adapter=adapter,
+                    http_client=http_client,
                 )
-            return OCPIResponse(
+            return ocpi_response(
                 data=[
                     adapter.charging_profile_response_adapter(
                         charging_profile_response
-                    ).model_dump()
+                    )
                 ],
                 **status.OCPI_1000_GENERIC_SUCESS_CODE,
             )
@@ -303,16 +318,16 @@ async def delete_chargingprofile(
         charging_profile_response = ChargingProfileResponse(
             result=ChargingProfileResponseType.rejected, timeout=0
         )
-        return OCPIResponse(
-            data=[charging_profile_response.model_dump()],
+        return ocpi_response(
+            data=[charging_profile_response],
             **status.OCPI_3000_GENERIC_SERVER_ERROR,
         )
 
-    logger.info("Session with id `%s` was not found." % session_id)
+    logger.info("Session with id `%s` was not found.", session_id)
     charging_profile_response = ChargingProfileResponse(
         result=ChargingProfileResponseType.rejected, timeout=0
     )
-    return OCPIResponse(
-        data=[charging_profile_response.model_dump()],
+    return ocpi_response(
+        data=[charging_profile_response],
         **status.OCPI_2000_GENERIC_CLIENT_ERROR,
     )
@@ -4,10 +4,15 @@ from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.core.utils import get_auth_token
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.dependencies import get_crud, get_adapter
 
@@ -40,10 +45,11 @@ async def receive_chargingprofile_command(
         The OCPIResponse indicating the success of the operation.
     """
     logger.info("Received charging profile result.")
-    logger.debug("Chargingprofile result data - %s" % data)
+    logger.debug("Chargingprofile result data - %s", data)
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
     query_params = request.query_params
-    logger.debug("Request query_params - %s" % query_params)
+    logger.debug("Request query_params - %s", query_params)
 
     await crud.create(
         ModuleID.charging_profile,
@@ -51,10 +57,11 @@ async def receive_chargingprofile_command(
         data,
         query_params=query_params,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
 
-    return OCPIResponse(
+    return ocpi_response(
         data=[],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
@@ -85,13 +92,15 @@ async def add_or_update_chargingprofile(
     """
     logger.info(
         "Received request to add or update charging profile "
-        "with session_id - `%s`." % session_id
+        "with session_id - `%s`.",
+        session_id,
     )
     logger.debug(
-        "Active chargingprofile result data - %s"
-        % active_charging_profile.model_dump()
+        "Active chargingprofile result data - %s",
+        LazyDump(active_charging_profile),
     )
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     await crud.update(
         ModuleID.charging_profile,
@@ -100,10 +109,11 @@ async def add_or_update_chargingprofile(
         0,
         session_id=session_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
 
-    return OCPIResponse(
+    return ocpi_response(
         data=[],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
@@ -1,6 +1,7 @@
-import httpx
+from functools import partial
+from typing import Any, Optional
 
-from asyncio import sleep
+import httpx
 
 from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.core.utils import encode_string_base64
@@ -10,6 +11,7 @@ from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core.data_types import CiString, URL
 from py_ocpi.core.enums import ModuleID, RoleEnum, Action
+from py_ocpi.core.scheduler import POLL_INTERVAL, Poll, scheduler
 
 from py_ocpi.modules.chargingprofiles.v_2_2_1.schemas import (
     ChargingProfileResult,
@@ -18,15 +20,62 @@ from py_ocpi.modules.chargingprofiles.v_2_2_1.schemas import (
 )
 
 
-async def send_get_chargingprofile(
+def chargingprofile_timeout() -> float:
+    # as long as the 30 * GET_ACTIVE_PROFILE_AWAIT_TIME polls of the
+    # Charge Point
+    return 30 * settings.GET_ACTIVE_PROFILE_AWAIT_TIME * POLL_INTERVAL
+
+
+def cleared_result(clear_profile_result: Any) -> Optional[bool]:
+    # the charging profile is cleared once the Charge Point has none
+    return None if clear_profile_result else True
+
+
+def schedule_get_chargingprofile(
     session_id: CiString(36),  # type: ignore
     duration: int,
     response_url: URL,
     auth_token: str,
     crud: Crud,
     adapter: Adapter,
+    http_client: httpx.AsyncClient,
 ):
     logger.info("Received command to send get chargingprofile request.")
+    scheduler.schedule(
+        str(response_url),
+        chargingprofile_timeout(),
+        partial(
+            send_get_chargingprofile,
+            response_url=response_url,
+            auth_token=auth_token,
+            crud=crud,
+            adapter=adapter,
+            http_client=http_client,
+        ),
+        Poll(
+            crud,
+            ModuleID.hub_client_info,
+            RoleEnum.cpo,
+            dict(
+                session_id=session_id,
+                duration=duration,
+                response_url=response_url,
+                auth_token=auth_token,
+                version=VersionNumber.v_2_2_1,
+            ),
+        ),
+        job_type=ModuleID.charging_profile.value,
+    )
+
+
+async def send_get_chargingprofile(
+    active_charging_profile_result: Any,
+    response_url: URL,
+    auth_token: str,
+    crud: Crud,
+    adapter: Adapter,
+    http_client: httpx.AsyncClient,
+):
     client_auth_token = await crud.do(
         ModuleID.charging_profile,
         RoleEnum.cpo,
@@ -35,27 +84,6 @@ async def send_get_chargingprofile(
         version=VersionNumber.v_2_2_1,
     )
 
-    active_charging_profile_result = None
-    for _ in range(30 * settings.GET_ACTIVE_PROFILE_AWAIT_TIME):
-        # since charging profile has no id, 0 is used for id parameter of crud.get
-        active_charging_profile_result = await crud.get(
-            ModuleID.hub_client_info,
-            RoleEnum.cpo,
-            0,
-            session_id=session_id,
-            duration=duration,
-            response_url=response_url,
-            auth_token=auth_token,
-            version=VersionNumber.v_2_2_1,
-        )
-        if active_charging_profile_result:
-            logger.debug(
-                "Active charging profile result from Charge Point - %s"
-                % active_charging_profile_result
-            )
-            break
-        await sleep(2)
-
     if not active_charging_profile_result:
         logger.debug(
             "Active charging profile result from Charge Point "
@@ -65,38 +93,77 @@ async def send_get_chargingprofile(
             result=ChargingProfileResultType.rejected
         )
     else:
+        logger.debug(
+            "Active charging profile result from Charge Point - %s",
+            active_charging_profile_result,
+        )
         active_charging_profile_result = (
             adapter.active_charging_profile_result_adapter(
                 active_charging_profile_result, VersionNumber.v_2_2_1
             )
         )
 
-    async with httpx.AsyncClient() as client:
-        authorization_token = f"Token {encode_string_base64(client_auth_token)}"
-        logger.info(
-            "Send request with active charging profile result: %s"
-            % response_url
-        )
-        res = await client.post(
-            response_url,
-            json=active_charging_profile_result.model_dump(),
-            headers={"authorization": authorization_token},
-        )
-        logger.info(
-            "POST active chargingprofile result data after receiving result "
-            "from Charge Point status_code: %s" % res.status_code
-        )
+    authorization_token = f"Token {encode_string_base64(client_auth_token)}"
+    logger.info(
+        "Send request with active charging profile result: %s", response_url
+    )
+    res = await http_client.post(
+        response_url,
+        json=active_charging_profile_result.model_dump(),
+        headers={"authorization": authorization_token},
+    )
+    logger.info(
+        "POST active chargingprofile result data after receiving result "
+        "from Charge Point status_code: %s",
+        res.status_code,
+    )
 
 
-async def send_update_chargingprofile(
+def schedule_update_chargingprofile(
     charging_profile: SetChargingProfile,
     session_id: CiString(36),  # type: ignore
     response_url: URL,
     auth_token: str,
     crud: Crud,
     adapter: Adapter,
+    http_client: httpx.AsyncClient,
 ):
     logger.info("Received command to send update chargingprofile request.")
+    scheduler.schedule(
+        str(response_url),
+        chargingprofile_timeout(),
+        partial(
+            send_update_chargingprofile,
+            response_url=response_url,
+            auth_token=auth_token,
+            crud=crud,
+            adapter=adapter,
+            http_client=http_client,
+        ),
+        Poll(
+            crud,
+            ModuleID.hub_client_info,
+            RoleEnum.cpo,
+            dict(
+                session_id=session_id,
+                response_url=response_url,
+                charging_profile=charging_profile,
+                auth_token=auth_token,
+                version=VersionNumber.v_2_2_1,
+            ),
+        ),
+        job_type=ModuleID.charging_profile.value,
+    )
+
+
+async def send_update_chargingprofile(
+    charging_profile_result: Any,
+    response_url: URL,
+    auth_token: str,
+    crud: Crud,
+    adapter: Adapter,
+    http_client: httpx.AsyncClient,
+):
     client_auth_token = await crud.do(
         ModuleID.charging_profile,
         RoleEnum.cpo,
@@ -105,27 +172,6 @@ async def send_update_chargingprofile(
         version=VersionNumber.v_2_2_1,
     )
 
-    charging_profile_result = None
-    for _ in range(30 * settings.GET_ACTIVE_PROFILE_AWAIT_TIME):
-        # since charging profile has no id, 0 is used for id parameter of crud.get
-        charging_profile_result = await crud.get(
-            ModuleID.hub_client_info,
-            RoleEnum.cpo,
-            0,
-            session_id=session_id,
-            response_url=response_url,
-            charging_profile=charging_profile,
-            auth_token=auth_token,
-            version=VersionNumber.v_2_2_1,
-        )
-        if not charging_profile_result:
-            logger.debug(
-                "Charging profile result from Charge Point - %s"
-                % charging_profile_result
-            )
-            break
-        await sleep(2)
-
     if not charging_profile_result:
         logger.debug(
             "Charging profile result from Charge Point "
@@ -135,36 +181,72 @@ async def send_update_chargingprofile(
             result=ChargingProfileResultType.rejected
         )
     else:
+        logger.debug(
+            "Charging profile result from Charge Point - %s",
+            charging_profile_result,
+        )
         charging_profile_result = (
             adapter.active_charging_profile_result_adapter(
                 charging_profile_result, VersionNumber.v_2_2_1
             )
         )
 
-    async with httpx.AsyncClient() as client:
-        authorization_token = f"Token {encode_string_base64(client_auth_token)}"
-        logger.info(
-            "Send request with charging profile result: %s" % response_url
-        )
-        res = await client.post(
-            response_url,
-            json=charging_profile_result.model_dump(),
-            headers={"authorization": authorization_token},
-        )
-        logger.info(
-            "POST charging profile result data after receiving result "
-            "from Charge Point status_code: %s" % res.status_code
-        )
+    authorization_token = f"Token {encode_string_base64(client_auth_token)}"
+    logger.info("Send request with charging profile result: %s", response_url)
+    res = await http_client.post(
+        response_url,
+        json=charging_profile_result.model_dump(),
+        headers={"authorization": authorization_token},
+    )
+    logger.info(
+        "POST charging profile result data after receiving result "
+        "from Charge Point status_code: %s",
+        res.status_code,
+    )
 
 
-async def send_delete_chargingprofile(
+def schedule_delete_chargingprofile(
     session_id: CiString(36),  # type: ignore
     response_url: URL,
     auth_token: str,
     crud: Crud,
     adapter: Adapter,
+    http_client: httpx.AsyncClient,
 ):
     logger.info("Received command to send delete chargingprofile request.")
+    scheduler.schedule(
+        str(response_url),
+        chargingprofile_timeout(),
+        partial(
+            send_delete_chargingprofile,
+            response_url=response_url,
+            auth_token=auth_token,
+            crud=crud,
+            http_client=http_client,
+        ),
+        Poll(
+            crud,
+            ModuleID.hub_client_info,
+            RoleEnum.cpo,
+            dict(
+                session_id=session_id,
+                response_url=response_url,
+                auth_token=auth_token,
+                version=VersionNumber.v_2_2_1,
+            ),
+            cleared_result,
+        ),
+        job_type=ModuleID.charging_profile.value,
+    )
+
+
+async def send_delete_chargingprofile(
+    cleared: Optional[bool],
+    response_url: URL,
+    auth_token: str,
+    crud: Crud,
+    http_client: httpx.AsyncClient,
+):
     client_auth_token = await crud.do(
         ModuleID.charging_profile,
         RoleEnum.cpo,
@@ -173,29 +255,9 @@ async def send_delete_chargingprofile(
         version=VersionNumber.v_2_2_1,
     )
 
-    clear_profile_result = None
-    for _ in range(30 * settings.GET_ACTIVE_PROFILE_AWAIT_TIME):
-        # since charging profile has no id, 0 is used for id parameter of crud.get
-        clear_profile_result = await crud.get(
-            ModuleID.hub_client_info,
-            RoleEnum.cpo,
-            0,
-            session_id=session_id,
-            response_url=response_url,
-            auth_token=auth_token,
-            version=VersionNumber.v_2_2_1,
-        )
-        if not clear_profile_result:
-            logger.debug(
-                "Clear profile result from Charge Point - %s"
-                % clear_profile_result
-            )
-            break
-        await sleep(2)
-
-    if clear_profile_result:
+    if not cleared:
         logger.debug(
-            "Clear profile result from Charge Point " "didn't arrive in time."
+            "Clear profile result from Charge Point didn't arrive in time."
         )
         clear_profile_result = ChargingProfileResult(
             result=ChargingProfileResultType.rejected
@@ -205,15 +267,15 @@ async def send_delete_chargingprofile(
             result=ChargingProfileResultType.accepted
         )
 
-    async with httpx.AsyncClient() as client:
-        authorization_token = f"Token {encode_string_base64(client_auth_token)}"
-        logger.info("Send request with clear profile result: %s" % response_url)
-        res = await client.post(
-            response_url,
-            json=clear_profile_result.model_dump(),
-            headers={"authorization": authorization_token},
-        )
-        logger.info(
-            "POST clear profile result data after receiving result "
-            "from Charge Point status_code: %s" % res.status_code
-        )
+    authorization_token = f"Token {encode_string_base64(client_auth_token)}"
+    logger.info("Send request with clear profile result: %s", response_url)
+    res = await http_client.post(
+        response_url,
+        json=clear_profile_result.model_dump(),
+        headers={"authorization": authorization_token},
+    )
+    logger.info(
+        "POST clear profile result data after receiving result "
+        "from Charge Point status_code: %s",
+        res.status_code,
+    )
@@ -1,8 +1,8 @@
-from asyncio import sleep
+from functools import partial
+from typing import Any
 
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     Request,
     status as fastapistatus,
@@ -12,16 +12,21 @@ from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 import httpx
 
-from py_ocpi.core.dependencies import get_crud, get_adapter
+from py_ocpi.core.dependencies import get_crud, get_adapter, get_http_client
 from py_ocpi.core.enums import ModuleID, RoleEnum, Action
 from py_ocpi.core.exceptions import NotFoundOCPIError
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core import status
 from py_ocpi.core.config import settings
+from py_ocpi.core.scheduler import POLL_INTERVAL, Poll, scheduler
 from py_ocpi.core.utils import get_auth_token
 from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.modules.commands.v_2_1_1.enums import CommandType
@@ -55,11 +60,13 @@ async def apply_pydantic_schema(command: str, data: dict):
 
 
 async def send_command_result(
+    command_result: Any,
     command_data: StartSession | StopSession | ReserveNow | UnlockConnector,
     command: CommandType,
     auth_token: str,
     crud: Crud,
     adapter: Adapter,
+    http_client: httpx.AsyncClient,
 ):
     client_auth_token = await crud.do(
         ModuleID.commands,
@@ -69,47 +76,72 @@ async def send_command_result(
         version=VersionNumber.v_2_1_1,
     )
 
-    command_result = None
-    for _ in range(30 * settings.COMMAND_AWAIT_TIME):
-        # since command has no id, 0 is used for id parameter of crud.get
-        command_result = await crud.get(
-            ModuleID.commands,
-            RoleEnum.cpo,
-            0,
-            command_data=command_data,
-            auth_token=auth_token,
-            version=VersionNumber.v_2_1_1,
-            command=command,
-        )
-        if command_result:
-            logger.info(
-                "Command result from Charge Point - %s" % command_result
-            )
-            break
-        await sleep(2)
-
     if not command_result:
         logger.info("Command result from Charge Point didn't arrive in time.")
         command_response = CommandResponse(result=CommandResponseType.timeout)
     else:
+        logger.info("Command result from Charge Point - %s", command_result)
         command_response = adapter.command_response_adapter(
             command_result, VersionNumber.v_2_1_1
         )
 
-    async with httpx.AsyncClient() as client:
-        authorization_token = f"Token {client_auth_token}"
-        logger.info(
-            "Send request with command result: %s" % command_data.response_url
-        )
-        res = await client.post(
-            command_data.response_url,
-            json=command_response.model_dump(),
-            headers={"authorization": authorization_token},
-        )
-        logger.info(
-            "POST command data after receiving result from Charge Point"
-            " status_code: %s" % res.status_code
+    authorization_token = f"Token {client_auth_token}"
+    logger.info(
+        "Send request with command result: %s", command_data.response_url
+    )
+    res = await http_client.post(
+        command_data.response_url,
+        json=command_response.model_dump(),
+        headers={"authorization": authorization_token},
+    )
+    logger.info(
+        "POST command data after receiving result from Charge Point"
+        " status_code: %s",
+        res.status_code,
+    )
+
+
+def command_timeout() -> float:
+    # as long as the 30 * COMMAND_AWAIT_TIME polls of the Charge Point
+    return 30 * settings.COMMAND_AWAIT_TIME * POLL_INTERVAL
+
+
+def schedule_command_result(
+    command_data: StartSession | StopSession | ReserveNow | UnlockConnector,
+    command: CommandType,
+    auth_token: str,
+    crud: Crud,
+    adapter: Adapter,
+    http_client: httpx.AsyncClient,
+):
+    poll = None
+    if settings.COMMAND_RESULT_POLLING:
+        poll = Poll(
+            crud,
+            ModuleID.commands,
+            RoleEnum.cpo,
+            dict(
+                command_data=command_data,
+                auth_token=auth_token,
+                version=VersionNumber.v_2_1_1,
+                command=command,
+            ),
         )
+    scheduler.schedule(
+        command_data.response_url,
+        command_timeout(),
+        partial(
+            send_command_result,
+            command_data=command_data,
+            command=command,
+            auth_token=auth_token,
+            crud=crud,
+            adapter=adapter,
+            http_client=http_client,
+        ),
+        poll,
+        job_type=ModuleID.commands.value,
+    )
 
 
 @router.post("/{command}", response_model=OCPIResponse)
@@ -117,9 +149,9 @@ async def receive_command(
     request: Request,
     command: CommandType,
     data: dict,
-    background_tasks: BackgroundTasks,
     crud: Crud = Depends(get_crud),
     adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """
     Receive Command.
@@ -140,9 +172,10 @@ async def receive_command(
             if the command action returns without a result.
         - NotFoundOCPIError: If the associated location is not found.
     """
-    logger.info("Received command - `%s`." % command)
-    logger.debug("Command data - %s" % data)
+    logger.info("Received command - `%s`.", command)
+    logger.debug("Command data - %s", data)
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     try:
         command_data = await apply_pydantic_schema(command, data)
@@ -168,11 +201,14 @@ async def receive_command(
                 RoleEnum.cpo,
                 command_data.location_id,
                 auth_token=auth_token,
+                party_context=party_context,
                 version=VersionNumber.v_2_1_1,
             )
             if not location:
                 raise NotFoundOCPIError
 
+        # the result may be resolved before send_command returns
+        scheduler.reserve(command_data.response_url, command_timeout())
         command_response = await crud.do(
             ModuleID.commands,
             RoleEnum.cpo,
@@ -180,41 +216,45 @@ async def receive_command(
             command_data.model_dump(),
             command=command,
             auth_token=auth_token,
+            party_context=party_context,
             version=VersionNumber.v_2_1_1,
         )
         if command_response:
             if command_response["result"] == CommandResponseType.accepted:
-                background_tasks.add_task(
-                    send_command_result,
+                schedule_command_result(
                     command_data=command_data,
                     command=command,
                     auth_token=auth_token,
                     crud=crud,
                     adapter=adapter,
+                    http_client=http_client,
                 )
-            return OCPIResponse(
+            else:
+                scheduler.discard(command_data.response_url)
+            return ocpi_response(
                 data=[
                     adapter.command_response_adapter(
                         command_response, VersionNumber.v_2_1_1
-                    ).model_dump()
+                    )
                 ],
                 **status.OCPI_1000_GENERIC_SUCESS_CODE,
             )
 
         logger.debug("Send command action returned without result.")
+        scheduler.discard(command_data.response_url)
         command_response = CommandResponse(result=CommandResponseType.rejected)
-        return OCPIResponse(
-            data=[command_response.model_dump()],
+        return ocpi_response(
+            data=[command_response],
             **status.OCPI_3000_GENERIC_SERVER_ERROR,
         )
 
     # when the location is not found
     except NotFoundOCPIError:
         logger.info(
-            "Location with id `%s` was not found." % command_data.location_id
+            "Location with id `%s` was not found.", command_data.location_id
         )
         command_response = CommandResponse(result=CommandResponseType.rejected)
-        return OCPIResponse(
-            data=[command_response.model_dump()],
+        return ocpi_response(
+            data=[command_response],
             **status.OCPI_2003_UNKNOWN_LOCATION,
         )
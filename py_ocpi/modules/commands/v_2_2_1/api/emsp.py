@@ -2,11 +2,16 @@ from fastapi import APIRouter, Depends, Request
 
 from py_ocpi.core.dependencies import get_crud, get_adapter
 from py_ocpi.core.enums import ModuleID, RoleEnum
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core import status
 from py_ocpi.core.utils import get_auth_token
 from py_ocpi.modules.versions.enums import VersionNumber
@@ -42,9 +47,10 @@ async def receive_command_result(
         The OCPIResponse indicating the success or failure of
             processing the command result.
     """
-    logger.info("Received command result with uid - `%s`." % uid)
-    logger.debug("Command result data - %s" % command_result.model_dump())
+    logger.info("Received command result with uid - `%s`.", uid)
+    logger.debug("Command result data - %s", LazyDump(command_result))
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     await crud.update(
         ModuleID.commands,
@@ -52,10 +58,11 @@ async def receive_command_result(
         command_result.model_dump(),
         uid,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
 
-    return OCPIResponse(
+    return ocpi_response(
         data=[],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
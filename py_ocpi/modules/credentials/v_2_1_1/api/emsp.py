@@ -11,14 +11,18 @@ from fastapi import (
 from py_ocpi.core import status
 from py_ocpi.core.adapter import Adapter
 from py_ocpi.core.authentication.verifier import (
+    get_party_context,
     AuthorizationVerifier,
     CredentialsAuthorizationVerifier,
+    invalidate_auth_token,
 )
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
-from py_ocpi.core.dependencies import get_crud, get_adapter
+from py_ocpi.core.partners import partner_registry
+from py_ocpi.core.dependencies import get_crud, get_adapter, get_http_client
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.utils import get_auth_token
 
 from py_ocpi.modules.versions.enums import VersionNumber
@@ -50,16 +54,18 @@ async def get_credentials(
     """
     logger.info("Received request to get credentials")
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.credentials_and_registration,
         RoleEnum.emsp,
         auth_token,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_1_1,
     )
-    return OCPIResponse(
-        data=adapter.credentials_adapter(data, VersionNumber.v_2_1_1).model_dump(),
+    return ocpi_response(
+        data=adapter.credentials_adapter(data, VersionNumber.v_2_1_1),
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
 
@@ -70,6 +76,7 @@ async def post_credentials(
     credentials: Credentials,
     crud: Crud = Depends(get_crud),
     adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
     server_cred: str | dict | None = Depends(cred_dependency),
 ):
     """
@@ -89,9 +96,10 @@ async def post_credentials(
                        or if the token is not valid (HTTP 401 Unauthorized).
     """
     logger.info("Received request to create credentials.")
-    logger.debug("POST credentials body: %s" % credentials)
+    logger.debug("POST credentials body: %s", credentials)
 
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     # Check if the client is already registered
     if server_cred:
@@ -110,75 +118,77 @@ async def post_credentials(
         )
 
     # Retrieve the versions and endpoints from the client
-    async with httpx.AsyncClient() as client:
-        credentials_client_token = credentials.token
-        authorization_token = f"Token {credentials_client_token}"
+    credentials_client_token = credentials.token
+    authorization_token = f"Token {credentials_client_token}"
 
-        logger.info("Send request to get versions: %s" % credentials.url)
+    logger.info("Send request to get versions: %s", credentials.url)
 
-        response_versions = await client.get(
-            credentials.url, headers={"authorization": authorization_token}
-        )
+    response_versions = await http_client.get(
+        credentials.url, headers={"authorization": authorization_token}
+    )
 
-        logger.info(
-            "GET versions status_code: %s" % response_versions.status_code
-        )
+    logger.info("GET versions status_code: %s", response_versions.status_code)
 
-        if response_versions.status_code == fastapistatus.HTTP_200_OK:
-            version_url = None
-            versions = response_versions.json()["data"]
+    if response_versions.status_code == fastapistatus.HTTP_200_OK:
+        version_url = None
+        versions = response_versions.json()["data"]
 
-            logger.debug("GET versions response data: %s" % versions)
+        logger.debug("GET versions response data: %s", versions)
 
-            for version in versions:
-                if version["version"] == VersionNumber.v_2_1_1:
-                    version_url = version["url"]
+        for version in versions:
+            if version["version"] == VersionNumber.v_2_1_1:
+                version_url = version["url"]
 
-            if not version_url:
-                logger.debug(
-                    "Version %s is not supported" % VersionNumber.v_2_1_1
-                )
+        if not version_url:
+            logger.debug("Version %s is not supported", VersionNumber.v_2_1_1)
 
-                return OCPIResponse(
-                    data=[],
-                    **status.OCPI_3002_UNSUPPORTED_VERSION,
-                )
+            return ocpi_response(
+                data=[],
+                **status.OCPI_3002_UNSUPPORTED_VERSION,
+            )
 
-            logger.info("Send request to get version details: %s" % version_url)
+        logger.info("Send request to get version details: %s", version_url)
 
-            response_endpoints = await client.get(
-                version_url, headers={"authorization": authorization_token}
+        response_endpoints = await http_client.get(
+            version_url, headers={"authorization": authorization_token}
+        )
+
+        logger.info(
+            "GET version details status_code: %s",
+            response_endpoints.status_code,
+        )
+
+        if response_endpoints.status_code == fastapistatus.HTTP_200_OK:
+            # Store client credentials and generate new credentials for sender
+            endpoints = response_endpoints.json()["data"]
+
+            logger.debug("GET version details response data: %s", endpoints)
+
+            new_credentials = await crud.create(
+                ModuleID.credentials_and_registration,
+                RoleEnum.emsp,
+                {
+                    "credentials": credentials.model_dump(),
+                    "endpoints": endpoints,
+                },
+                auth_token=auth_token,
+                party_context=party_context,
+                version=VersionNumber.v_2_1_1,
+            )
+            partner_registry.set(
+                version_url,
+                VersionNumber.v_2_1_1,
+                endpoints.get("endpoints", []),
             )
 
-            logger.info(
-                "GET version details status_code: %s"
-                % response_endpoints.status_code
+            return ocpi_response(
+                data=adapter.credentials_adapter(
+                    new_credentials, VersionNumber.v_2_1_1
+                ),
+                **status.OCPI_1000_GENERIC_SUCESS_CODE,
             )
 
-            if response_endpoints.status_code == fastapistatus.HTTP_200_OK:
-                # Store client credentials and generate new credentials for sender
-                endpoints = response_endpoints.json()["data"]
-
-                logger.debug(
-                    "GET version details response data: %s" % endpoints
-                )
-
-                new_credentials = await crud.create(
-                    ModuleID.credentials_and_registration,
-                    RoleEnum.emsp,
-                    {"credentials": credentials.model_dump(), "endpoints": endpoints},
-                    auth_token=auth_token,
-                    version=VersionNumber.v_2_1_1,
-                )
-
-                return OCPIResponse(
-                    data=adapter.credentials_adapter(
-                        new_credentials, VersionNumber.v_2_1_1
-                    ).model_dump(),
-                    **status.OCPI_1000_GENERIC_SUCESS_CODE,
-                )
-
-    return OCPIResponse(
+    return ocpi_response(
         data=[],
         **status.OCPI_3001_UNABLE_TO_USE_CLIENTS_API,
     )
@@ -190,6 +200,7 @@ async def update_credentials(
     credentials: Credentials,
     crud: Crud = Depends(get_crud),
     adapter: Adapter = Depends(get_adapter),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
     server_cred: str | dict | None = Depends(cred_dependency),
 ):
     """
@@ -208,8 +219,9 @@ async def update_credentials(
             (HTTP 405 Method Not Allowed).
     """
     logger.info("Received request to update credentials.")
-    logger.debug("PUT credentials body: %s" % credentials)
+    logger.debug("PUT credentials body: %s", credentials)
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     # Check if the client is already registered
     if not server_cred:
@@ -221,77 +233,80 @@ async def update_credentials(
         )
 
     # Retrieve the versions and endpoints from the client
-    async with httpx.AsyncClient() as client:
-        credentials_client_token = credentials.token
-        authorization_token = f"Token {credentials_client_token}"
+    credentials_client_token = credentials.token
+    authorization_token = f"Token {credentials_client_token}"
 
-        logger.info("Send request to get versions: %s" % credentials.url)
+    logger.info("Send request to get versions: %s", credentials.url)
 
-        response_versions = await client.get(
-            credentials.url, headers={"authorization": authorization_token}
-        )
+    response_versions = await http_client.get(
+        credentials.url, headers={"authorization": authorization_token}
+    )
 
-        logger.info(
-            "GET versions status_code: %s" % response_versions.status_code
-        )
+    logger.info("GET versions status_code: %s", response_versions.status_code)
 
-        if response_versions.status_code == fastapistatus.HTTP_200_OK:
-            version_url = None
-            versions = response_versions.json()["data"]
+    if response_versions.status_code == fastapistatus.HTTP_200_OK:
+        version_url = None
+        versions = response_versions.json()["data"]
 
-            logger.debug("GET versions response data: %s" % versions)
+        logger.debug("GET versions response data: %s", versions)
 
-            for version in versions:
-                if version["version"] == VersionNumber.v_2_1_1:
-                    version_url = version["url"]
+        for version in versions:
+            if version["version"] == VersionNumber.v_2_1_1:
+                version_url = version["url"]
 
-            if not version_url:
-                logger.debug(
-                    "Version %s is not supported" % VersionNumber.v_2_1_1
-                )
+        if not version_url:
+            logger.debug("Version %s is not supported", VersionNumber.v_2_1_1)
 
-                return OCPIResponse(
-                    data=[],
-                    **status.OCPI_3002_UNSUPPORTED_VERSION,
-                )
+            return ocpi_response(
+                data=[],
+                **status.OCPI_3002_UNSUPPORTED_VERSION,
+            )
 
-            logger.info("Send request to get version details: %s" % version_url)
+        logger.info("Send request to get version details: %s", version_url)
 
-            response_endpoints = await client.get(
-                version_url, headers={"authorization": authorization_token}
+        response_endpoints = await http_client.get(
+            version_url, headers={"authorization": authorization_token}
+        )
+
+        logger.info(
+            "GET version details status_code: %s",
+            response_endpoints.status_code,
+        )
+
+        if response_endpoints.status_code == fastapistatus.HTTP_200_OK:
+            # Update server credentials to access client's
+            # system and generate new credentials token
+            endpoints = response_endpoints.json()["data"]
+
+            logger.debug("GET version details response data: %s", endpoints)
+
+            new_credentials = await crud.update(
+                ModuleID.credentials_and_registration,
+                RoleEnum.emsp,
+                {
+                    "credentials": credentials.model_dump(),
+                    "endpoints": endpoints,
+                },
+                None,
+                auth_token=auth_token,
+                party_context=party_context,
+                version=VersionNumber.v_2_1_1,
+            )
+            invalidate_auth_token(auth_token)
+            partner_registry.set(
+                version_url,
+                VersionNumber.v_2_1_1,
+                endpoints.get("endpoints", []),
             )
 
-            logger.info(
-                "GET version details status_code: %s"
-                % response_endpoints.status_code
+            return ocpi_response(
+                data=adapter.credentials_adapter(
+                    new_credentials, VersionNumber.v_2_1_1
+                ),
+                **status.OCPI_1000_GENERIC_SUCESS_CODE,
             )
 
-            if response_endpoints.status_code == fastapistatus.HTTP_200_OK:
-                # Update server credentials to access client's
-                # system and generate new credentials token
-                endpoints = response_endpoints.json()["data"]
-
-                logger.debug(
-                    "GET version details response data: %s" % endpoints
-                )
-
-                new_credentials = await crud.update(
-                    ModuleID.credentials_and_registration,
-                    RoleEnum.emsp,
-                    {"credentials": credentials.model_dump(), "endpoints": endpoints},
-                    None,
-                    auth_token=auth_token,
-                    version=VersionNumber.v_2_1_1,
-                )
-
-                return OCPIResponse(
-                    data=adapter.credentials_adapter(
-                        new_credentials, VersionNumber.v_2_1_1
-                    ).model_dump(),
-                    **status.OCPI_1000_GENERIC_SUCESS_CODE,
-                )
-
-    return OCPIResponse(
+    return ocpi_response(
         data=[],
         **status.OCPI_3001_UNABLE_TO_USE_CLIENTS_API,
     )
@@ -322,12 +337,14 @@ async def remove_credentials(
     logger.info("Received request to delete credentials")
 
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.credentials_and_registration,
         RoleEnum.emsp,
         auth_token,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_1_1,
     )
     if not data:
@@ -343,10 +360,12 @@ async def remove_credentials(
         RoleEnum.emsp,
         auth_token,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_1_1,
     )
+    invalidate_auth_token(auth_token)
 
-    return OCPIResponse(
+    return ocpi_response(
         data=[],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
@@ -3,10 +3,15 @@ from fastapi import APIRouter, Depends, Request
 from py_ocpi.core.utils import get_auth_token
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.data_types import CiString
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.exceptions import NotFoundOCPIError
@@ -46,22 +51,26 @@ async def get_hubclientinfo(
     """
     logger.info(
         "Received request to get hub client info with country code - `%s` "
-        "and party id - `%s`." % (country_code, party_id)
+        "and party id - `%s`.",
+        country_code,
+        party_id,
     )
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.hub_client_info,
         RoleEnum.emsp,
         None,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
     )
     if data:
-        return OCPIResponse(
-            data=[adapter.hubclientinfo_adapter(data).model_dump()],
+        return ocpi_response(
+            data=[adapter.hubclientinfo_adapter(data)],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
     logger.info("Hub client info was not found.")
@@ -97,17 +106,22 @@ async def add_or_update_clienthubinfo(
     """
     logger.info(
         "Received request to add or update hub client info "
-        "with country code - `%s` and party id - `%s`."
-        % (country_code, party_id)
+        "with country code - `%s` and party id - `%s`.",
+        country_code,
+        party_id,
+    )
+    logger.debug(
+        "Client hub info data to update - %s", LazyDump(client_hub_info)
     )
-    logger.debug("Client hub info data to update - %s" % client_hub_info.model_dump())
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.hub_client_info,
         RoleEnum.emsp,
         None,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
@@ -120,6 +134,7 @@ async def add_or_update_clienthubinfo(
             client_hub_info.model_dump(),
             None,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
@@ -136,7 +151,7 @@ async def add_or_update_clienthubinfo(
             version=VersionNumber.v_2_2_1,
         )
 
-    return OCPIResponse(
-        data=[adapter.hubclientinfo_adapter(data).model_dump()],
+    return ocpi_response(
+        data=[adapter.hubclientinfo_adapter(data)],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
@@ -1,11 +1,19 @@
 from fastapi import APIRouter, Depends, Response, Request
 
 from py_ocpi.modules.versions.enums import VersionNumber
-from py_ocpi.core.utils import get_list, get_auth_token
-from py_ocpi.core import status
+from py_ocpi.core.utils import get_list_response, get_auth_token
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.conditional import (
+    conditional_response,
+    get_object_version,
+    is_not_modified,
+    not_modified_response,
+)
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core.data_types import String
@@ -45,26 +53,18 @@ async def get_locations(
     """
     logger.info("Received request to get locations.")
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
-    data_list = await get_list(
+    return await get_list_response(
         response,
         filters,
         ModuleID.locations,
         RoleEnum.cpo,
         VersionNumber.v_2_1_1,
         crud,
+        lambda data: adapter.location_adapter(data, VersionNumber.v_2_1_1),
         auth_token=auth_token,
-    )
-
-    locations = []
-    for data in data_list:
-        locations.append(
-            adapter.location_adapter(data, VersionNumber.v_2_1_1).model_dump()
-        )
-    logger.debug(f"Amount of locations in response: {len(locations)}")
-    return OCPIResponse(
-        data=locations,
-        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        party_context=party_context,
     )
 
 
@@ -89,22 +89,37 @@ async def get_location(
     **Raises:**
         NotFoundOCPIError: If the location with the specified ID is not found.
     """
-    logger.info("Received request to get location by id - `%s`." % location_id)
+    logger.info("Received request to get location by id - `%s`.", location_id)
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    object_version = await get_object_version(
+        crud,
+        ModuleID.locations,
+        RoleEnum.cpo,
+        location_id,
+        auth_token=auth_token,
+        party_context=party_context,
+        version=VersionNumber.v_2_1_1,
+    )
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
 
     data = await crud.get(
         ModuleID.locations,
         RoleEnum.cpo,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_1_1,
     )
     if data:
-        return OCPIResponse(
-            data=[adapter.location_adapter(data, VersionNumber.v_2_1_1).model_dump()],
-            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        return conditional_response(
+            request,
+            adapter.location_adapter(data, VersionNumber.v_2_1_1),
+            object_version,
         )
-    logger.debug("Location with id `%s` was not found." % location_id)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -135,28 +150,40 @@ async def get_evse(
             or EVSE with the specified UID is not found.
     """
     logger.info(
-        "Received request to get evse by id - `%s` (location id - `%s`)"
-        % (location_id, evse_uid)
+        "Received request to get evse by id - `%s` (location id - `%s`)",
+        location_id,
+        evse_uid,
     )
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    object_version = await get_object_version(
+        crud,
+        ModuleID.locations,
+        RoleEnum.cpo,
+        location_id,
+        auth_token=auth_token,
+        party_context=party_context,
+        version=VersionNumber.v_2_1_1,
+    )
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
 
     data = await crud.get(
         ModuleID.locations,
         RoleEnum.cpo,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_1_1,
     )
     if data:
         location = adapter.location_adapter(data, VersionNumber.v_2_1_1)
         for evse in location.evses:
             if evse.uid == evse_uid:
-                return OCPIResponse(
-                    data=[evse.model_dump()],
-                    **status.OCPI_1000_GENERIC_SUCESS_CODE,
-                )
-        logger.debug("Evse with id `%s` was not found." % evse_uid)
-    logger.debug("Location with id `%s` was not found." % location_id)
+                return conditional_response(request, evse, object_version)
+        logger.debug("Evse with id `%s` was not found.", evse_uid)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -193,16 +220,32 @@ async def get_connector(
     """
     logger.info(
         "Received request to get connector by id - `%s` "
-        "(location id - `%s`, evse id - `%s`)"
-        % (connector_id, location_id, evse_uid)
+        "(location id - `%s`, evse id - `%s`)",
+        connector_id,
+        location_id,
+        evse_uid,
     )
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    object_version = await get_object_version(
+        crud,
+        ModuleID.locations,
+        RoleEnum.cpo,
+        location_id,
+        auth_token=auth_token,
+        party_context=party_context,
+        version=VersionNumber.v_2_1_1,
+    )
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
 
     data = await crud.get(
         ModuleID.locations,
         RoleEnum.cpo,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_1_1,
     )
     if data:
@@ -211,13 +254,12 @@ async def get_connector(
             if evse.uid == evse_uid:
                 for connector in evse.connectors:
                     if connector.id == connector_id:
-                        return OCPIResponse(
-                            data=[connector.model_dump()],
-                            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+                        return conditional_response(
+                            request, connector, object_version
                         )
                 logger.debug(
-                    "Connector with id `%s` was not found." % connector_id
+                    "Connector with id `%s` was not found.", connector_id
                 )
-        logger.debug("Evse with id `%s` was not found." % evse_uid)
-    logger.debug("Location with id `%s` was not found." % location_id)
+        logger.debug("Evse with id `%s` was not found.", evse_uid)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
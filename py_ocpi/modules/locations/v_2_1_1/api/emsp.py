@@ -3,15 +3,27 @@ import copy
 from fastapi import APIRouter, Depends, Request
 
 from py_ocpi.core.utils import (
+    crud_implements,
     get_auth_token,
     partially_update_attributes,
 )
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
+from py_ocpi.core.conditional import (
+    conditional_response,
+    get_object_version,
+    is_not_modified,
+    not_modified_response,
+)
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.data_types import String
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.exceptions import NotFoundOCPIError
@@ -59,26 +71,41 @@ async def get_location(
     **Raises:**
         NotFoundOCPIError: NotFoundOCPIError: If the location is not found.
     """
-    logger.info(
-        "Received request to get location with id - `%s`." % location_id
-    )
+    logger.info("Received request to get location with id - `%s`.", location_id)
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    object_version = await get_object_version(
+        crud,
+        ModuleID.locations,
+        RoleEnum.emsp,
+        location_id,
+        auth_token=auth_token,
+        party_context=party_context,
+        country_code=country_code,
+        party_id=party_id,
+        version=VersionNumber.v_2_1_1,
+    )
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
 
     data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
     )
     if data:
-        return OCPIResponse(
-            data=[adapter.location_adapter(data, VersionNumber.v_2_1_1).model_dump()],
-            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        return conditional_response(
+            request,
+            adapter.location_adapter(data, VersionNumber.v_2_1_1),
+            object_version,
         )
-    logger.debug("Location with id `%s` was not found." % location_id)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -115,16 +142,33 @@ async def get_evse(
          or EVSE with the specified UID is not found.
     """
     logger.info(
-        "Received request to get evse by id - `%s` (location id - `%s`)"
-        % (location_id, evse_uid)
+        "Received request to get evse by id - `%s` (location id - `%s`)",
+        location_id,
+        evse_uid,
     )
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    object_version = await get_object_version(
+        crud,
+        ModuleID.locations,
+        RoleEnum.emsp,
+        location_id,
+        auth_token=auth_token,
+        party_context=party_context,
+        country_code=country_code,
+        party_id=party_id,
+        version=VersionNumber.v_2_1_1,
+    )
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
 
     data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -133,12 +177,9 @@ async def get_evse(
         location = adapter.location_adapter(data, VersionNumber.v_2_1_1)
         for evse in location.evses:
             if evse.uid == evse_uid:
-                return OCPIResponse(
-                    data=[evse.model_dump()],
-                    **status.OCPI_1000_GENERIC_SUCESS_CODE,
-                )
-        logger.debug("Evse with id `%s` was not found." % evse_uid)
-    logger.debug("Location with id `%s` was not found." % location_id)
+                return conditional_response(request, evse, object_version)
+        logger.debug("Evse with id `%s` was not found.", evse_uid)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -180,16 +221,34 @@ async def get_connector(
     """
     logger.info(
         "Received request to get connector by id - `%s` "
-        "(location id - `%s`, evse id - `%s`)"
-        % (connector_id, location_id, evse_uid)
+        "(location id - `%s`, evse id - `%s`)",
+        connector_id,
+        location_id,
+        evse_uid,
     )
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    object_version = await get_object_version(
+        crud,
+        ModuleID.locations,
+        RoleEnum.emsp,
+        location_id,
+        auth_token=auth_token,
+        party_context=party_context,
+        country_code=country_code,
+        party_id=party_id,
+        version=VersionNumber.v_2_1_1,
+    )
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
 
     data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -200,15 +259,14 @@ async def get_connector(
             if evse.uid == evse_uid:
                 for connector in evse.connectors:
                     if connector.id == connector_id:
-                        return OCPIResponse(
-                            data=[connector.model_dump()],
-                            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+                        return conditional_response(
+                            request, connector, object_version
                         )
                 logger.debug(
-                    "Connector with id `%s` was not found." % connector_id
+                    "Connector with id `%s` was not found.", connector_id
                 )
-        logger.debug("Evse with id `%s` was not found." % evse_uid)
-    logger.debug("Location with id `%s` was not found." % location_id)
+        logger.debug("Evse with id `%s` was not found.", evse_uid)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -245,47 +303,51 @@ async def add_or_update_location(
         NotFoundOCPIError: If the location is not found.
     """
     logger.info(
-        "Received request to add or update location with id - `%s`."
-        % location_id
+        "Received request to add or update location with id - `%s`.",
+        location_id,
     )
-    logger.debug("Location data to update - %s" % location.model_dump())
+    logger.debug("Location data to update - %s", LazyDump(location))
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
     )
     if data:
-        logger.debug("Update location with id - `%s`." % location_id)
+        logger.debug("Update location with id - `%s`.", location_id)
         data = await crud.update(
             ModuleID.locations,
             RoleEnum.emsp,
             location.model_dump(),
             location_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_1_1,
         )
     else:
-        logger.debug("Create location with id - `%s`." % location_id)
+        logger.debug("Create location with id - `%s`.", location_id)
         data = await crud.create(
             ModuleID.locations,
             RoleEnum.emsp,
             location.model_dump(),
             auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_1_1,
         )
 
-    return OCPIResponse(
-        data=[adapter.location_adapter(data, VersionNumber.v_2_1_1).model_dump()],
+    return ocpi_response(
+        data=[adapter.location_adapter(data, VersionNumber.v_2_1_1)],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
 
@@ -326,16 +388,41 @@ async def add_or_update_evse(
     """
     logger.info(
         "Received request to add or update evse by id - `%s` "
-        "(location id - `%s`)" % (location_id, evse_uid)
+        "(location id - `%s`)",
+        location_id,
+        evse_uid,
     )
-    logger.debug("Evse data to update - %s" % evse.model_dump())
+    logger.debug("Evse data to update - %s", LazyDump(evse))
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    if crud_implements(crud, "update_evse"):
+        data = await crud.update_evse(
+            ModuleID.locations,
+            RoleEnum.emsp,
+            evse.model_dump(),
+            location_id,
+            evse_uid,
+            auth_token=auth_token,
+            party_context=party_context,
+            country_code=country_code,
+            party_id=party_id,
+            version=VersionNumber.v_2_1_1,
+        )
+        if data is None:
+            logger.debug("Location with id `%s` was not found.", location_id)
+            raise NotFoundOCPIError
+        return ocpi_response(
+            data=[evse],
+            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        )
 
     old_data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -346,7 +433,7 @@ async def add_or_update_evse(
 
         for old_evse in old_location.evses:
             if old_evse.uid == evse_uid:
-                logger.debug("Update evse with id - %s" % evse_uid)
+                logger.debug("Update evse with id - %s", evse_uid)
                 new_location.evses.remove(old_evse)
                 break
 
@@ -358,16 +445,17 @@ async def add_or_update_evse(
             new_location.model_dump(),
             location_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_1_1,
         )
 
-        return OCPIResponse(
-            data=[evse.model_dump()],
+        return ocpi_response(
+            data=[evse],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("Location with id `%s` was not found." % location_id)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -411,17 +499,47 @@ async def add_or_update_connector(
     """
     logger.info(
         "Received request to get connector by id - `%s` "
-        "(location id - `%s`, evse id - `%s`)"
-        % (connector_id, location_id, evse_uid)
+        "(location id - `%s`, evse id - `%s`)",
+        connector_id,
+        location_id,
+        evse_uid,
     )
-    logger.debug("Connector data to update - %s" % connector.model_dump())
+    logger.debug("Connector data to update - %s", LazyDump(connector))
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    if crud_implements(crud, "update_connector"):
+        data = await crud.update_connector(
+            ModuleID.locations,
+            RoleEnum.emsp,
+            connector.model_dump(),
+            location_id,
+            evse_uid,
+            connector_id,
+            auth_token=auth_token,
+            party_context=party_context,
+            country_code=country_code,
+            party_id=party_id,
+            version=VersionNumber.v_2_1_1,
+        )
+        if data is None:
+            logger.debug(
+                "Location with id `%s` or evse with id `%s` was not found.",
+                location_id,
+                evse_uid,
+            )
+            raise NotFoundOCPIError
+        return ocpi_response(
+            data=[connector],
+            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        )
 
     old_data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -437,7 +555,7 @@ async def add_or_update_connector(
                 for old_connector in old_evse.connectors:
                     if old_connector.id == connector_id:
                         logger.debug(
-                            "Update connector with id - %s" % connector_id
+                            "Update connector with id - %s", connector_id
                         )
                         new_evse.connectors.remove(old_connector)
                         break
@@ -450,17 +568,18 @@ async def add_or_update_connector(
                     new_location.model_dump(),
                     location_id,
                     auth_token=auth_token,
+                    party_context=party_context,
                     country_code=country_code,
                     party_id=party_id,
                     version=VersionNumber.v_2_1_1,
                 )
 
-                return OCPIResponse(
-                    data=[connector.model_dump()],
+                return ocpi_response(
+                    data=[connector],
                     **status.OCPI_1000_GENERIC_SUCESS_CODE,
                 )
-        logger.debug("Evse with id `%s` was not found." % evse_uid)
-    logger.debug("Location with id `%s` was not found." % location_id)
+        logger.debug("Evse with id `%s` was not found.", evse_uid)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -497,17 +616,19 @@ async def partial_update_location(
         NotFoundOCPIError: If the location is not found.
     """
     logger.info(
-        "Received request to partially update location with id - `%s`."
-        % location_id
+        "Received request to partially update location with id - `%s`.",
+        location_id,
     )
-    logger.debug("Location data to update - %s" % location.model_dump())
+    logger.debug("Location data to update - %s", LazyDump(location))
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     old_data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -527,16 +648,17 @@ async def partial_update_location(
             new_location.model_dump(),
             location_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_1_1,
         )
 
-        return OCPIResponse(
-            data=[adapter.location_adapter(data, VersionNumber.v_2_1_1).model_dump()],
+        return ocpi_response(
+            data=[adapter.location_adapter(data, VersionNumber.v_2_1_1)],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("Location with id `%s` was not found." % location_id)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -579,16 +701,45 @@ async def partial_update_evse(
     """
     logger.info(
         "Received request to partially update evse by id - `%s` "
-        "(location id - `%s`)" % (location_id, evse_uid)
+        "(location id - `%s`)",
+        location_id,
+        evse_uid,
     )
-    logger.debug("Evse data to update - %s" % evse.model_dump())
+    logger.debug("Evse data to update - %s", LazyDump(evse))
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    if crud_implements(crud, "patch_evse"):
+        data = await crud.patch_evse(
+            ModuleID.locations,
+            RoleEnum.emsp,
+            evse.dict(exclude_defaults=True, exclude_unset=True),
+            location_id,
+            evse_uid,
+            auth_token=auth_token,
+            party_context=party_context,
+            country_code=country_code,
+            party_id=party_id,
+            version=VersionNumber.v_2_1_1,
+        )
+        if data is None:
+            logger.debug(
+                "Location with id `%s` or evse with id `%s` was not found.",
+                location_id,
+                evse_uid,
+            )
+            raise NotFoundOCPIError
+        return ocpi_response(
+            data=[EVSE(**data)],
+            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        )
 
     old_data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -613,16 +764,17 @@ async def partial_update_evse(
                     new_location.model_dump(),
                     location_id,
                     auth_token=auth_token,
+                    party_context=party_context,
                     country_code=country_code,
                     party_id=party_id,
                     version=VersionNumber.v_2_1_1,
                 )
-                return OCPIResponse(
-                    data=[new_evse.model_dump()],
+                return ocpi_response(
+                    data=[new_evse],
                     **status.OCPI_1000_GENERIC_SUCESS_CODE,
                 )
-        logger.debug("Evse with id `%s` was not found." % evse_uid)
-    logger.debug("Location with id `%s` was not found." % location_id)
+        logger.debug("Evse with id `%s` was not found.", evse_uid)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
 
 
@@ -668,17 +820,43 @@ async def partial_update_connector(
     """
     logger.info(
         "Received request to partially update connector by id - `%s` "
-        "(location id - `%s`, evse id - `%s`)"
-        % (connector_id, location_id, evse_uid)
+        "(location id - `%s`, evse id - `%s`)",
+        connector_id,
+        location_id,
+        evse_uid,
     )
-    logger.debug("Connector data to update - %s" % connector.model_dump())
+    logger.debug("Connector data to update - %s", LazyDump(connector))
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    if crud_implements(crud, "patch_connector"):
+        data = await crud.patch_connector(
+            ModuleID.locations,
+            RoleEnum.emsp,
+            connector.dict(exclude_defaults=True, exclude_unset=True),
+            location_id,
+            evse_uid,
+            connector_id,
+            auth_token=auth_token,
+            party_context=party_context,
+            country_code=country_code,
+            party_id=party_id,
+            version=VersionNumber.v_2_1_1,
+        )
+        if data is None:
+            logger.debug("Connector with id `%s` was not found.", connector_id)
+            raise NotFoundOCPIError
+        return ocpi_response(
+            data=[Connector(**data)],
+            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        )
 
     old_data = await crud.get(
         ModuleID.locations,
         RoleEnum.emsp,
         location_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -705,18 +883,19 @@ async def partial_update_connector(
                             new_location.model_dump(),
                             location_id,
                             auth_token=auth_token,
+                            party_context=party_context,
                             country_code=country_code,
                             party_id=party_id,
                             version=VersionNumber.v_2_1_1,
                         )
 
-                        return OCPIResponse(
-                            data=[new_connector.model_dump()],
+                        return ocpi_response(
+                            data=[new_connector],
                             **status.OCPI_1000_GENERIC_SUCESS_CODE,
                         )
                 logger.debug(
-                    "Connector with id `%s` was not found." % connector_id
+                    "Connector with id `%s` was not found.", connector_id
                 )
-        logger.debug("Evse with id `%s` was not found." % evse_uid)
-    logger.debug("Location with id `%s` was not found." % location_id)
+        logger.debug("Evse with id `%s` was not found.", evse_uid)
+    logger.debug("Location with id `%s` was not found.", location_id)
     raise NotFoundOCPIError
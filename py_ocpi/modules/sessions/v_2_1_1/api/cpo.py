@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, Response, Request
 
 from py_ocpi.modules.versions.enums import VersionNumber
-from py_ocpi.core.utils import get_list, get_auth_token
-from py_ocpi.core import status
+from py_ocpi.core.utils import get_list_response, get_auth_token
 from py_ocpi.core.schemas import OCPIResponse
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core.enums import ModuleID, RoleEnum
@@ -43,24 +45,16 @@ async def get_sessions(
     """
     logger.info("Received request to get sessions.")
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
-    data_list = await get_list(
+    return await get_list_response(
         response,
         filters,
         ModuleID.sessions,
         RoleEnum.cpo,
         VersionNumber.v_2_1_1,
         crud,
+        lambda data: adapter.session_adapter(data, VersionNumber.v_2_1_1),
         auth_token=auth_token,
-    )
-
-    sessions = []
-    for data in data_list:
-        sessions.append(
-            adapter.session_adapter(data, VersionNumber.v_2_1_1).model_dump()
-        )
-    logger.debug(f"Amount of sessions in response: {len(sessions)}")
-    return OCPIResponse(
-        data=sessions,
-        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        party_context=party_context,
     )
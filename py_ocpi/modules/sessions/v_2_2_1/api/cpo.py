@@ -2,11 +2,15 @@ from fastapi import APIRouter, Depends, Response, Request
 
 from py_ocpi.modules.sessions.v_2_2_1.schemas import ChargingPreferences
 from py_ocpi.modules.versions.enums import VersionNumber
-from py_ocpi.core.utils import get_list, get_auth_token
+from py_ocpi.core.utils import get_list_response, get_auth_token
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core.data_types import CiString
@@ -45,24 +49,18 @@ async def get_sessions(
     """
     logger.info("Received request to get sessions.")
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
-    data_list = await get_list(
+    return await get_list_response(
         response,
         filters,
         ModuleID.sessions,
         RoleEnum.cpo,
         VersionNumber.v_2_2_1,
         crud,
+        adapter.session_adapter,
         auth_token=auth_token,
-    )
-
-    sessions = []
-    for data in data_list:
-        sessions.append(adapter.session_adapter(data).model_dump())
-    logger.debug(f"Amount of sessions in response: {len(sessions)}")
-    return OCPIResponse(
-        data=sessions,
-        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        party_context=party_context,
     )
 
 
@@ -90,15 +88,17 @@ async def set_charging_preference(
         The OCPIResponse containing the updated charging preferences.
     """
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
     data = await crud.update(
         ModuleID.sessions,
         RoleEnum.cpo,
         charging_preferences.model_dump(),
         session_id,
         auth_token=auth_token,
+        party_context=party_context,
         version=VersionNumber.v_2_2_1,
     )
-    return OCPIResponse(
-        data=[adapter.charging_preference_adapter(data).model_dump()],
+    return ocpi_response(
+        data=[adapter.charging_preference_adapter(data)],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
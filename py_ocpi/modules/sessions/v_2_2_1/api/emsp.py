@@ -10,10 +10,15 @@ from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.core.utils import get_auth_token, partially_update_attributes
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.data_types import CiString
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.exceptions import NotFoundOCPIError
@@ -52,24 +57,26 @@ async def get_session(
     **Raises:**
         NotFoundOCPIError: If the session is not found.
     """
-    logger.info("Received request to get session with id - `%s`." % session_id)
+    logger.info("Received request to get session with id - `%s`.", session_id)
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.sessions,
         RoleEnum.emsp,
         session_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
     )
     if data:
-        return OCPIResponse(
-            data=[adapter.session_adapter(data, VersionNumber.v_2_2_1).model_dump()],
+        return ocpi_response(
+            data=[adapter.session_adapter(data, VersionNumber.v_2_2_1)],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("Session with id `%s` was not found." % session_id)
+    logger.debug("Session with id `%s` was not found.", session_id)
     raise NotFoundOCPIError
 
 
@@ -102,46 +109,50 @@ async def add_or_update_session(
         The OCPIResponse containing the added or updated session data.
     """
     logger.info(
-        "Received request to add or update session with id - `%s`." % session_id
+        "Received request to add or update session with id - `%s`.", session_id
     )
-    logger.debug("Session data to update - %s" % session.model_dump())
+    logger.debug("Session data to update - %s", LazyDump(session))
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.sessions,
         RoleEnum.emsp,
         session_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
     )
     if data:
-        logger.debug("Update session with id - `%s`." % session_id)
+        logger.debug("Update session with id - `%s`.", session_id)
         data = await crud.update(
             ModuleID.sessions,
             RoleEnum.emsp,
             session.model_dump(),
             session_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
         )
     else:
-        logger.debug("Create session with id - `%s`." % session_id)
+        logger.debug("Create session with id - `%s`.", session_id)
         data = await crud.create(
             ModuleID.sessions,
             RoleEnum.emsp,
             session.model_dump(),
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
         )
 
-    return OCPIResponse(
-        data=[adapter.session_adapter(data).model_dump()],
+    return ocpi_response(
+        data=[adapter.session_adapter(data)],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
 
@@ -178,17 +189,19 @@ async def partial_update_session(
         NotFoundOCPIError: If the session is not found.
     """
     logger.info(
-        "Received request to partially update session with id - `%s`."
-        % session_id
+        "Received request to partially update session with id - `%s`.",
+        session_id,
     )
-    logger.debug("Session data to update - %s" % session.model_dump())
+    logger.debug("Session data to update - %s", LazyDump(session))
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     old_data = await crud.get(
         ModuleID.sessions,
         RoleEnum.emsp,
         session_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
@@ -207,14 +220,15 @@ async def partial_update_session(
             new_session.model_dump(),
             session_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
         )
 
-        return OCPIResponse(
-            data=[adapter.session_adapter(data).model_dump()],
+        return ocpi_response(
+            data=[adapter.session_adapter(data)],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("Session with id `%s` was not found." % session_id)
+    logger.debug("Session with id `%s` was not found.", session_id)
     raise NotFoundOCPIError
@@ -4,14 +4,25 @@ from fastapi import APIRouter, Depends, Request
 
 from py_ocpi.core import status
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.data_types import String
 from py_ocpi.core.dependencies import get_crud, get_adapter
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.exceptions import NotFoundOCPIError
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
+from py_ocpi.core.conditional import (
+    conditional_response,
+    get_object_version,
+    is_not_modified,
+    not_modified_response,
+)
 from py_ocpi.core.utils import (
     get_auth_token,
     partially_update_attributes,
@@ -52,24 +63,41 @@ async def get_tariff(
     **Raises:**
         NotFoundOCPIError: If the tariff is not found.
     """
-    logger.info("Received request to get tariff with id - `%s`." % tariff_id)
+    logger.info("Received request to get tariff with id - `%s`.", tariff_id)
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
+
+    object_version = await get_object_version(
+        crud,
+        ModuleID.tariffs,
+        RoleEnum.emsp,
+        tariff_id,
+        auth_token=auth_token,
+        party_context=party_context,
+        country_code=country_code,
+        party_id=party_id,
+        version=VersionNumber.v_2_1_1,
+    )
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
 
     data = await crud.get(
         ModuleID.tariffs,
         RoleEnum.emsp,
         tariff_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
     )
     if data:
-        return OCPIResponse(
-            data=[adapter.tariff_adapter(data, VersionNumber.v_2_1_1).model_dump()],
-            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        return conditional_response(
+            request,
+            adapter.tariff_adapter(data, VersionNumber.v_2_1_1),
+            object_version,
         )
-    logger.debug("Tariff with id `%s` was not found." % tariff_id)
+    logger.debug("Tariff with id `%s` was not found.", tariff_id)
     raise NotFoundOCPIError
 
 
@@ -102,46 +130,50 @@ async def add_or_update_tariff(
         The OCPIResponse containing the tariff data.
     """
     logger.info(
-        "Received request to add or update tariff with id - `%s`." % tariff_id
+        "Received request to add or update tariff with id - `%s`.", tariff_id
     )
-    logger.debug("Tariff data to update - %s" % tariff.model_dump())
+    logger.debug("Tariff data to update - %s", LazyDump(tariff))
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.tariffs,
         RoleEnum.emsp,
         tariff_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
     )
     if data:
-        logger.debug("Update tariff with id - `%s`." % tariff_id)
+        logger.debug("Update tariff with id - `%s`.", tariff_id)
         data = await crud.update(
             ModuleID.tariffs,
             RoleEnum.emsp,
             tariff.model_dump(),
             tariff_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_1_1,
         )
     else:
-        logger.debug("Create tariff with id - `%s`." % tariff_id)
+        logger.debug("Create tariff with id - `%s`.", tariff_id)
         data = await crud.create(
             ModuleID.tariffs,
             RoleEnum.emsp,
             tariff.model_dump(),
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_1_1,
         )
 
-    return OCPIResponse(
-        data=[adapter.tariff_adapter(data, VersionNumber.v_2_1_1).model_dump()],
+    return ocpi_response(
+        data=[adapter.tariff_adapter(data, VersionNumber.v_2_1_1)],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
 
@@ -178,17 +210,18 @@ async def partial_update_tariff(
         NotFoundOCPIError: If the tariff is not found.
     """
     logger.info(
-        "Received request to partially update tariff with id - `%s`."
-        % tariff_id
+        "Received request to partially update tariff with id - `%s`.", tariff_id
     )
-    logger.debug("Tariff data to update - %s" % tariff.model_dump())
+    logger.debug("Tariff data to update - %s", LazyDump(tariff))
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     old_data = await crud.get(
         ModuleID.tariffs,
         RoleEnum.emsp,
         tariff_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -207,16 +240,17 @@ async def partial_update_tariff(
             new_tariff.model_dump(),
             tariff_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_1_1,
         )
 
-        return OCPIResponse(
-            data=[adapter.tariff_adapter(data, VersionNumber.v_2_1_1).model_dump()],
+        return ocpi_response(
+            data=[adapter.tariff_adapter(data, VersionNumber.v_2_1_1)],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("Tariff with id `%s` was not found." % tariff_id)
+    logger.debug("Tariff with id `%s` was not found.", tariff_id)
     raise NotFoundOCPIError
 
 
@@ -247,14 +281,16 @@ async def delete_tariff(
     **Raises:**
         NotFoundOCPIError: If the tariff is not found.
     """
-    logger.info("Received request to delete tariff with id - `%s`." % tariff_id)
+    logger.info("Received request to delete tariff with id - `%s`.", tariff_id)
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     tariff = await crud.get(
         ModuleID.tariffs,
         RoleEnum.emsp,
         tariff_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_1_1,
@@ -265,14 +301,15 @@ async def delete_tariff(
             RoleEnum.emsp,
             tariff_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_1_1,
         )
 
-        return OCPIResponse(
+        return ocpi_response(
             data=[],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("Tariff with id `%s` was not found." % tariff_id)
+    logger.debug("Tariff with id `%s` was not found.", tariff_id)
     raise NotFoundOCPIError
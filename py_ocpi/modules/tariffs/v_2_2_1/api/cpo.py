@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, Response, Request
 
-from py_ocpi.core.utils import get_list, get_auth_token
-from py_ocpi.core import status
+from py_ocpi.core.utils import get_list_response, get_auth_token
 from py_ocpi.core.schemas import OCPIResponse
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core.enums import ModuleID, RoleEnum
@@ -43,22 +45,16 @@ async def get_tariffs(
     """
     logger.info("Received request to get tariffs")
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
-    data_list = await get_list(
+    return await get_list_response(
         response,
         filters,
         ModuleID.tariffs,
         RoleEnum.cpo,
         VersionNumber.v_2_2_1,
         crud,
+        adapter.tariff_adapter,
         auth_token=auth_token,
-    )
-
-    tariffs = []
-    for data in data_list:
-        tariffs.append(adapter.tariff_adapter(data).model_dump())
-    logger.debug(f"Amount of tariffs in response: {len(tariffs)}")
-    return OCPIResponse(
-        data=tariffs,
-        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        party_context=party_context,
     )
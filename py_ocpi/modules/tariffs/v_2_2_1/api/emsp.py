@@ -5,10 +5,21 @@ from py_ocpi.modules.versions.enums import VersionNumber
 from py_ocpi.core.utils import get_auth_token
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
+from py_ocpi.core.conditional import (
+    conditional_response,
+    get_object_version,
+    is_not_modified,
+    not_modified_response,
+)
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.data_types import CiString
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.exceptions import NotFoundOCPIError
@@ -47,24 +58,41 @@ async def get_tariff(
     **Raises:**
         NotFoundOCPIError: If the tariff is not found.
     """
-    logger.info("Received request to get tariff with id - `%s`." % tariff_id)
+    logger.info("Received request to get tariff with id - `%s`.", tariff_id)
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
+
+    object_version = await get_object_version(
+        crud,
+        ModuleID.tariffs,
+        RoleEnum.emsp,
+        tariff_id,
+        auth_token=auth_token,
+        party_context=party_context,
+        country_code=country_code,
+        party_id=party_id,
+        version=VersionNumber.v_2_2_1,
+    )
+    if is_not_modified(request, object_version):
+        return not_modified_response(object_version)
 
     data = await crud.get(
         ModuleID.tariffs,
         RoleEnum.emsp,
         tariff_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
     )
     if data:
-        return OCPIResponse(
-            data=[adapter.tariff_adapter(data, VersionNumber.v_2_2_1).model_dump()],
-            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        return conditional_response(
+            request,
+            adapter.tariff_adapter(data, VersionNumber.v_2_2_1),
+            object_version,
         )
-    logger.debug("Tariff with id `%s` was not found." % tariff_id)
+    logger.debug("Tariff with id `%s` was not found.", tariff_id)
     raise NotFoundOCPIError
 
 
@@ -97,46 +125,50 @@ async def add_or_update_tariff(
         The OCPIResponse containing the tariff data.
     """
     logger.info(
-        "Received request to add or update tariff with id - `%s`." % tariff_id
+        "Received request to add or update tariff with id - `%s`.", tariff_id
     )
-    logger.debug("Tariff data to update - %s" % tariff.model_dump())
+    logger.debug("Tariff data to update - %s", LazyDump(tariff))
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.tariffs,
         RoleEnum.emsp,
         tariff_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
     )
     if data:
-        logger.debug("Update tariff with id - `%s`." % tariff_id)
+        logger.debug("Update tariff with id - `%s`.", tariff_id)
         data = await crud.update(
             ModuleID.tariffs,
             RoleEnum.emsp,
             tariff.model_dump(),
             tariff_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
         )
     else:
-        logger.debug("Create tariff with id - `%s`." % tariff_id)
+        logger.debug("Create tariff with id - `%s`.", tariff_id)
         data = await crud.create(
             ModuleID.tariffs,
             RoleEnum.emsp,
             tariff.model_dump(),
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
         )
 
-    return OCPIResponse(
-        data=[adapter.tariff_adapter(data).model_dump()],
+    return ocpi_response(
+        data=[adapter.tariff_adapter(data)],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
 
@@ -168,14 +200,16 @@ async def delete_tariff(
     **Raises:**
         NotFoundOCPIError: If the tariff is not found.
     """
-    logger.info("Received request to delete tariff with id - `%s`." % tariff_id)
+    logger.info("Received request to delete tariff with id - `%s`.", tariff_id)
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     tariff = await crud.get(
         ModuleID.tariffs,
         RoleEnum.emsp,
         tariff_id,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
@@ -186,14 +220,15 @@ async def delete_tariff(
             RoleEnum.emsp,
             tariff_id,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
         )
 
-        return OCPIResponse(
+        return ocpi_response(
             data=[],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("Tariff with id `%s` was not found." % tariff_id)
+    logger.debug("Tariff with id `%s` was not found.", tariff_id)
     raise NotFoundOCPIError
@@ -3,11 +3,15 @@ from fastapi import APIRouter, Depends, Response, Request
 from py_ocpi.modules.tokens.v_2_1_1.enums import TokenType
 from py_ocpi.modules.tokens.v_2_1_1.schemas import LocationReference
 from py_ocpi.modules.versions.enums import VersionNumber
-from py_ocpi.core.utils import get_list, get_auth_token
+from py_ocpi.core.utils import get_list_response, get_auth_token
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core.exceptions import NotFoundOCPIError
@@ -47,24 +51,18 @@ async def get_tokens(
     """
     logger.info("Received request to get tokens")
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
-    data_list = await get_list(
+    return await get_list_response(
         response,
         filters,
         ModuleID.tokens,
         RoleEnum.emsp,
         VersionNumber.v_2_1_1,
         crud,
+        lambda data: adapter.token_adapter(data, VersionNumber.v_2_1_1),
         auth_token=auth_token,
-    )
-
-    tokens = []
-    for data in data_list:
-        tokens.append(adapter.token_adapter(data, VersionNumber.v_2_1_1).model_dump())
-    logger.debug(f"Amount of tokens in response: {len(tokens)}")
-    return OCPIResponse(
-        data=tokens,
-        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        party_context=party_context,
     )
 
 
@@ -98,10 +96,11 @@ async def authorize_token(
     **Raises:**
         NotFoundOCPIError: If the token is not found.
     """
-    logger.info("Received request to authorize token with id `%s`" % token_uid)
-    logger.debug("Token type - `%s`" % token_type)
-    logger.debug("Location reference - `%s`" % location_reference)
+    logger.info("Received request to authorize token with id `%s`", token_uid)
+    logger.debug("Token type - `%s`", token_type)
+    logger.debug("Location reference - `%s`", location_reference)
     auth_token = get_auth_token(request, VersionNumber.v_2_1_1)
+    party_context = get_party_context(request)
 
     # check if token exists
     token = await crud.get(
@@ -109,6 +108,7 @@ async def authorize_token(
         RoleEnum.emsp,
         token_uid,
         auth_token=auth_token,
+        party_context=party_context,
         token_type=token_type,
         version=VersionNumber.v_2_1_1,
     )
@@ -129,25 +129,26 @@ async def authorize_token(
             Action.authorize_token,
             data=data,
             auth_token=auth_token,
+            party_context=party_context,
             version=VersionNumber.v_2_1_1,
         )
 
         # when the token information is not enough
         if not authroization_result:
             logger.debug("Authorization result is null.")
-            return OCPIResponse(
+            return ocpi_response(
                 data=[],
                 **status.OCPI_2002_NOT_ENOUGH_INFORMATION,
             )
 
-        return OCPIResponse(
+        return ocpi_response(
             data=[
                 adapter.authorization_adapter(
                     authroization_result, VersionNumber.v_2_1_1
-                ).model_dump()
+                )
             ],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
 
-    logger.debug("Token with id `%s` was not found." % token_uid)
+    logger.debug("Token with id `%s` was not found.", token_uid)
     raise NotFoundOCPIError
@@ -7,10 +7,15 @@ from py_ocpi.core.data_types import CiString
 from py_ocpi.core.enums import ModuleID, RoleEnum
 from py_ocpi.core.exceptions import NotFoundOCPIError
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
+from py_ocpi.core.logs import LazyDump
 from py_ocpi.core.utils import get_auth_token, partially_update_attributes
 from py_ocpi.core.dependencies import get_crud, get_adapter
 from py_ocpi.modules.versions.enums import VersionNumber
@@ -54,25 +59,27 @@ async def get_token(
     **Raises:**
         NotFoundOCPIError: If the token is not found.
     """
-    logger.info("Received request to get token with id - `%s`." % token_uid)
+    logger.info("Received request to get token with id - `%s`.", token_uid)
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.tokens,
         RoleEnum.cpo,
         token_uid,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         token_type=token_type,
         version=VersionNumber.v_2_2_1,
     )
     if data:
-        return OCPIResponse(
-            data=[adapter.token_adapter(data).model_dump()],
+        return ocpi_response(
+            data=[adapter.token_adapter(data)],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
-    logger.debug("Token with id `%s` was not found." % token_uid)
+    logger.debug("Token with id `%s` was not found.", token_uid)
     raise NotFoundOCPIError
 
 
@@ -109,23 +116,25 @@ async def add_or_update_token(
         The OCPIResponse containing the token data.
     """
     logger.info(
-        "Received request to add or update token with id - `%s`." % token_uid
+        "Received request to add or update token with id - `%s`.", token_uid
     )
-    logger.debug("Token data to update - %s" % token.model_dump())
+    logger.debug("Token data to update - %s", LazyDump(token))
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     data = await crud.get(
         ModuleID.tokens,
         RoleEnum.cpo,
         token_uid,
         auth_token=auth_token,
+        party_context=party_context,
         token_type=token_type,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
     )
     if data:
-        logger.debug("Update token with id - `%s`." % token_uid)
+        logger.debug("Update token with id - `%s`.", token_uid)
         data = await crud.update(
             ModuleID.tokens,
             RoleEnum.cpo,
@@ -133,24 +142,26 @@ async def add_or_update_token(
             token_uid,
             token_type=token_type,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
         )
     else:
-        logger.debug("Create token with id - `%s`." % token_uid)
+        logger.debug("Create token with id - `%s`.", token_uid)
         data = await crud.create(
             ModuleID.tokens,
             RoleEnum.cpo,
             token.model_dump(),
             token_type=token_type,
             auth_token=auth_token,
+            party_context=party_context,
             country_code=country_code,
             party_id=party_id,
             version=VersionNumber.v_2_2_1,
         )
-    return OCPIResponse(
-        data=[adapter.token_adapter(data).model_dump()],
+    return ocpi_response(
+        data=[adapter.token_adapter(data)],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
 
@@ -191,10 +202,11 @@ async def partial_update_token(
         NotFoundOCPIError: If the token is not found.
     """
     logger.info(
-        "Received request to partially update token with id - `%s`." % token_uid
+        "Received request to partially update token with id - `%s`.", token_uid
     )
-    logger.debug("Token data to update - %s" % token.model_dump())
+    logger.debug("Token data to update - %s", LazyDump(token))
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     old_data = await crud.get(
         ModuleID.tokens,
@@ -202,12 +214,13 @@ async def partial_update_token(
         token_uid,
         token_type=token_type,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
     )
     if not old_data:
-        logger.debug("Token with id `%s` was not found." % token_uid)
+        logger.debug("Token with id `%s` was not found.", token_uid)
 
         raise NotFoundOCPIError
     old_token = adapter.token_adapter(old_data)
@@ -224,11 +237,12 @@ async def partial_update_token(
         token_uid,
         token_type=token_type,
         auth_token=auth_token,
+        party_context=party_context,
         country_code=country_code,
         party_id=party_id,
         version=VersionNumber.v_2_2_1,
     )
-    return OCPIResponse(
-        data=[adapter.token_adapter(data).model_dump()],
+    return ocpi_response(
+        data=[adapter.token_adapter(data)],
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
@@ -3,11 +3,15 @@ from fastapi import APIRouter, Depends, Response, Request
 from py_ocpi.modules.tokens.v_2_2_1.enums import TokenType
 from py_ocpi.modules.tokens.v_2_2_1.schemas import LocationReference
 from py_ocpi.modules.versions.enums import VersionNumber
-from py_ocpi.core.utils import get_list, get_auth_token
+from py_ocpi.core.utils import get_list_response, get_auth_token
 from py_ocpi.core import status
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.adapter import Adapter
-from py_ocpi.core.authentication.verifier import AuthorizationVerifier
+from py_ocpi.core.authentication.verifier import (
+    AuthorizationVerifier,
+    get_party_context,
+)
 from py_ocpi.core.crud import Crud
 from py_ocpi.core.config import logger
 from py_ocpi.core.exceptions import NotFoundOCPIError
@@ -47,24 +51,18 @@ async def get_tokens(
     """
     logger.info("Received request to get tokens")
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
-    data_list = await get_list(
+    return await get_list_response(
         response,
         filters,
         ModuleID.tokens,
         RoleEnum.emsp,
         VersionNumber.v_2_2_1,
         crud,
+        adapter.token_adapter,
         auth_token=auth_token,
-    )
-
-    tokens = []
-    for data in data_list:
-        tokens.append(adapter.token_adapter(data).model_dump())
-    logger.debug(f"Amount of tokens in response: {len(tokens)}")
-    return OCPIResponse(
-        data=tokens,
-        **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        party_context=party_context,
     )
 
 
@@ -99,10 +97,11 @@ async def authorize_token(
     **Raises:**
         NotFoundOCPIError: If the token is not found.
     """
-    logger.info("Received request to authorize token with id `%s`" % token_uid)
-    logger.debug("Token type - `%s`" % token_type)
-    logger.debug("Location reference - `%s`" % location_reference)
+    logger.info("Received request to authorize token with id `%s`", token_uid)
+    logger.debug("Token type - `%s`", token_type)
+    logger.debug("Location reference - `%s`", location_reference)
     auth_token = get_auth_token(request)
+    party_context = get_party_context(request)
 
     # check if token exists
     token = await crud.get(
@@ -110,6 +109,7 @@ async def authorize_token(
         RoleEnum.emsp,
         token_uid,
         auth_token=auth_token,
+        party_context=party_context,
         token_type=token_type,
         version=VersionNumber.v_2_2_1,
     )
@@ -130,21 +130,22 @@ async def authorize_token(
             Action.authorize_token,
             data=data,
             auth_token=auth_token,
+            party_context=party_context,
             version=VersionNumber.v_2_2_1,
         )
 
         # when the token information is not enough
         if not authroization_result:
             logger.debug("Authorization result is null.")
-            return OCPIResponse(
+            return ocpi_response(
                 data=[],
                 **status.OCPI_2002_NOT_ENOUGH_INFORMATION,
             )
 
-        return OCPIResponse(
-            data=[adapter.authorization_adapter(authroization_result).model_dump()],
+        return ocpi_response(
+            data=[adapter.authorization_adapter(authroization_result)],
             **status.OCPI_1000_GENERIC_SUCESS_CODE,
         )
 
-    logger.debug("Token with id `%s` was not found." % token_uid)
+    logger.debug("Token with id `%s` was not found.", token_uid)
     raise NotFoundOCPIError
@@ -17,6 +17,7 @@ from py_ocpi.core.dependencies import (
     get_crud,
 )
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 
 
 router = APIRouter()
@@ -38,14 +39,14 @@ async def get_versions(
     **Returns:**
         The OCPIResponse containing a list of available OCPI versions.
     """
-    logger.info("Received request for version details: %s" % request.url)
+    logger.info("Received request for version details: %s", request.url)
     if server_cred is None:
         logger.debug("Unauthorized request.")
         raise HTTPException(
             fastapistatus.HTTP_401_UNAUTHORIZED,
             "Unauthorized",
         )
-    return OCPIResponse(
+    return ocpi_response(
         data=versions,
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
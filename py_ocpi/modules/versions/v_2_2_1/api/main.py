@@ -13,6 +13,7 @@ from py_ocpi.core.crud import Crud
 from py_ocpi.core import status
 from py_ocpi.core.config import logger
 from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.core.responses import ocpi_response
 from py_ocpi.core.dependencies import get_endpoints, get_crud
 
 from py_ocpi.modules.versions.v_2_2_1.schemas import (
@@ -39,15 +40,15 @@ async def get_version_details(
     **Returns:**
         The OCPIResponse containing details of the OCPI version 2.2.1.
     """
-    logger.info("Received request for version details: %s" % request.url)
+    logger.info("Received request for version details: %s", request.url)
     if server_cred is None:
         logger.debug("Unauthorized request.")
         raise HTTPException(fastapistatus.HTTP_401_UNAUTHORIZED, "Unauthorized")
 
-    return OCPIResponse(
+    return ocpi_response(
         data=VersionDetail(
             version=VersionNumber.v_2_2_1,
             endpoints=endpoints[VersionNumber.v_2_2_1],
-        ).model_dump(),
+        ),
         **status.OCPI_1000_GENERIC_SUCESS_CODE,
     )
@@ -0,0 +1,211 @@
+"""Minimal unit tests for py_ocpi.core.cache"""
+
+import asyncio
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from py_ocpi.main import get_application
+from py_ocpi.core import enums
+from py_ocpi.core.cache import CachedCrud
+from py_ocpi.core.enums import ModuleID, RoleEnum
+from py_ocpi.core.utils import crud_implements
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.test_v_2_2_1.test_locations.utils import (
+    AUTH_HEADERS,
+    CPO_BASE_URL,
+    LOCATIONS,
+    ClientAuthenticator,
+)
+
+
+class Crud:
+    calls = 0
+
+    @classmethod
+    async def get(cls, module, role, id, *args, **kwargs):
+        cls.calls += 1
+        return None if id == "missing" else {"id": id}
+
+    @classmethod
+    async def create(cls, module, role, data, *args, **kwargs):
+        return data
+
+    @classmethod
+    async def update(cls, module, role, data, id, *args, **kwargs):
+        return data
+
+    @classmethod
+    async def delete(cls, module, role, id, *args, **kwargs):
+        pass
+
+
+def get_cached_crud(**kwargs) -> CachedCrud:
+    Crud.calls = 0
+    return CachedCrud(Crud, ttl={ModuleID.locations: 60}, **kwargs)
+
+
+def get(crud, id, module=ModuleID.locations, **kwargs):
+    return asyncio.run(crud.get(module, RoleEnum.cpo, id, **kwargs))
+
+
+class TestCachedCrud:
+    """Test CachedCrud"""
+
+    def test_get_is_cached(self):
+        """Test get hits the wrapped crud once per key"""
+        crud = get_cached_crud()
+        assert get(crud, "1") == {"id": "1"}
+        assert get(crud, "1") == {"id": "1"}
+        assert get(crud, "1", party_id="ABC") == {"id": "1"}
+        assert Crud.calls == 2
+        assert crud.cache_info().hits == 1
+        assert crud.cache_info().misses == 2
+
+    def test_module_without_ttl_is_not_cached(self):
+        """Test modules without TTL are passed through"""
+        crud = get_cached_crud()
+        get(crud, "1", module=ModuleID.tariffs)
+        get(crud, "1", module=ModuleID.tariffs)
+        assert Crud.calls == 2
+        assert crud.cache_info().currsize == 0
+
+    def test_negative_caching(self):
+        """Test misses are cached for the negative TTL"""
+        crud = get_cached_crud(negative_ttl=0)
+        assert get(crud, "missing") is None
+        assert get(crud, "missing") is None
+        assert Crud.calls == 2
+
+        crud = get_cached_crud()
+        get(crud, "missing")
+        get(crud, "missing")
+        assert Crud.calls == 1
+
+    def test_expiry(self):
+        """Test entries expire after the module TTL"""
+        crud = get_cached_crud()
+        with patch("py_ocpi.core.cache.time.monotonic", return_value=0):
+            get(crud, "1")
+        with patch("py_ocpi.core.cache.time.monotonic", return_value=61):
+            get(crud, "1")
+        assert Crud.calls == 2
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted"""
+        crud = get_cached_crud(maxsize=2)
+        get(crud, "1")
+        get(crud, "2")
+        get(crud, "1")
+        get(crud, "3")
+        assert crud.cache_info().currsize == 2
+        get(crud, "1")
+        assert Crud.calls == 3
+        get(crud, "2")
+        assert Crud.calls == 4
+
+    def test_writes_invalidate(self):
+        """Test create, update and delete invalidate the object entries"""
+        crud = get_cached_crud()
+        for write in (
+            crud.create(ModuleID.locations, RoleEnum.cpo, {"id": "1"}),
+            crud.update(ModuleID.locations, RoleEnum.cpo, {}, "1"),
+            crud.delete(ModuleID.locations, RoleEnum.cpo, "1"),
+        ):
+            get(crud, "1", party_id="ABC")
+            get(crud, "2")
+            asyncio.run(write)
+            assert crud.cache_info().currsize == 1
+            get(crud, "2")
+        assert Crud.calls == 4
+
+    def test_get_overlapping_write_is_not_stored(self):
+        """Test a get loaded before an invalidation isn't cached"""
+        crud = get_cached_crud()
+
+        async def run():
+            loaded = asyncio.Event()
+            written = asyncio.Event()
+
+            class SlowCrud(Crud):
+                @classmethod
+                async def get(cls, module, role, id, *args, **kwargs):
+                    loaded.set()
+                    await written.wait()
+                    return {"id": id, "version": 1}
+
+            crud.__wrapped__ = SlowCrud
+            get_task = asyncio.create_task(
+                crud.get(ModuleID.locations, RoleEnum.cpo, "1")
+            )
+            await loaded.wait()
+            await crud.update(ModuleID.locations, RoleEnum.cpo, {}, "1")
+            written.set()
+            return await get_task
+
+        assert asyncio.run(run()) == {"id": "1", "version": 1}
+        assert crud.cache_info().currsize == 0
+
+    def test_evse_and_connector_writes_invalidate(self):
+        """Test EVSE and connector writes invalidate the location entries"""
+
+        class GranularCrud(Crud):
+            @classmethod
+            async def update_evse(cls, module, role, data, *args, **kwargs):
+                return data
+
+            @classmethod
+            async def patch_connector(cls, module, role, data, *args, **kwargs):
+                return data
+
+        crud = CachedCrud(GranularCrud, ttl={ModuleID.locations: 60})
+        GranularCrud.calls = 0
+        for write in (
+            crud.update_evse(ModuleID.locations, RoleEnum.cpo, {}, "1", "E"),
+            crud.patch_connector(
+                ModuleID.locations, RoleEnum.cpo, {}, "1", "E", "C"
+            ),
+        ):
+            get(crud, "1")
+            asyncio.run(write)
+            assert crud.cache_info().currsize == 0
+        assert GranularCrud.calls == 2
+
+    def test_crud_implements_unwraps(self):
+        """Test optional hooks of the wrapped crud are detected"""
+
+        class VersionedCrud(Crud):
+            @classmethod
+            async def get_version(cls, module, role, id, *args, **kwargs):
+                pass
+
+        assert crud_implements(CachedCrud(VersionedCrud, ttl={}), "get_version")
+        assert not crud_implements(CachedCrud(Crud, ttl={}), "get_version")
+
+    def test_application_uses_cache(self):
+        """Test get_application wraps crud when crud_cache_ttl is given"""
+
+        class LocationCrud:
+            calls = 0
+
+            @classmethod
+            async def get(cls, module, role, id, *args, **kwargs):
+                cls.calls += 1
+                return LOCATIONS[0]
+
+        app = get_application(
+            version_numbers=[VersionNumber.v_2_2_1],
+            roles=[enums.RoleEnum.cpo],
+            crud=LocationCrud,
+            authenticator=ClientAuthenticator,
+            modules=[enums.ModuleID.locations],
+            crud_cache_ttl={enums.ModuleID.locations: 60},
+        )
+        client = TestClient(app)
+        url = f"{CPO_BASE_URL}{LOCATIONS[0]['id']}"
+
+        assert client.get(url, headers=AUTH_HEADERS).status_code == 200
+        assert client.get(url, headers=AUTH_HEADERS).status_code == 200
+        assert LocationCrud.calls == 1
+        assert app.state.crud.cache_info().hits == 1
@@ -0,0 +1,174 @@
+"""Minimal unit tests for py_ocpi.core.coalescing"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from py_ocpi.main import get_application
+from py_ocpi.core import enums, schemas
+from py_ocpi.core.coalescing import PushCoalescer
+from py_ocpi.core.config import settings
+from py_ocpi.core.outbox import OutboxJob
+from py_ocpi.modules.locations.v_2_2_1.schemas import Location
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.test_v_2_2_1.test_locations.utils import LOCATIONS
+from tests.test_modules.utils import ClientAuthenticator, ENCODED_AUTH_TOKEN
+
+
+def make_job(object_id: str, revision: int, url: str = "http://a.com"):
+    return OutboxJob(
+        version="2.2.1",
+        module_id="locations",
+        object_id=object_id,
+        endpoints_url=url,
+        auth_token="token",
+        data={"id": object_id, "revision": revision},
+    )
+
+
+class MockFlush:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, jobs):
+        self.calls.append((asyncio.get_running_loop().time(), jobs))
+
+    @property
+    def jobs(self):
+        return [job for _, jobs in self.calls for job in jobs]
+
+
+class TestPushCoalescer:
+    """Test the coalescing of pushes"""
+
+    def test_storm_sends_latest(self):
+        """Test only the latest push of an object is sent per receiver"""
+
+        async def storm():
+            flush = MockFlush()
+            coalescer = PushCoalescer(debounce=0.05, max_delay=1)
+            coalescer.start(flush)
+            for revision in range(50):
+                coalescer.submit(make_job("1", revision))
+                coalescer.submit(make_job("1", revision, "http://b.com"))
+                coalescer.submit(make_job("2", revision))
+            await asyncio.sleep(0.15)
+            await coalescer.stop()
+            return coalescer, flush
+
+        coalescer, flush = asyncio.run(storm())
+
+        assert coalescer.submitted == 150
+        assert coalescer.flushed == 3
+        assert sorted(
+            (job.object_id, job.endpoints_url) for job in flush.jobs
+        ) == [
+            ("1", "http://a.com"),
+            ("1", "http://b.com"),
+            ("2", "http://a.com"),
+        ]
+        assert {job.data["revision"] for job in flush.jobs} == {49}
+
+    def test_max_delay(self):
+        """Test a push isn't held longer than max_delay"""
+
+        async def flapping():
+            flush = MockFlush()
+            coalescer = PushCoalescer(debounce=0.05, max_delay=0.1)
+            coalescer.start(flush)
+            start = asyncio.get_running_loop().time()
+            for revision in range(30):
+                coalescer.submit(make_job("1", revision))
+                await asyncio.sleep(0.01)
+            await coalescer.stop()
+            return start, flush
+
+        start, flush = asyncio.run(flapping())
+
+        # pushes every 10 ms never let the debounce window end
+        assert len(flush.calls) >= 2
+        assert flush.calls[0][0] - start < 0.15
+
+    def test_stop_sends_held_pushes(self):
+        """Test held pushes are sent when stopping"""
+
+        async def stop():
+            flush = MockFlush()
+            coalescer = PushCoalescer(debounce=10, max_delay=10)
+            coalescer.start(flush)
+            assert coalescer.submit(make_job("1", 0)) is False
+            assert coalescer.submit(make_job("1", 1)) is True
+            await coalescer.stop()
+            return coalescer, flush
+
+        coalescer, flush = asyncio.run(stop())
+
+        assert [job.data["revision"] for job in flush.jobs] == [1]
+        assert len(coalescer) == 0
+
+    def test_first_push_starts_timer(self):
+        """Test pushes are sent when start wasn't called, e.g. no lifespan"""
+
+        async def not_started():
+            flush = MockFlush()
+            coalescer = PushCoalescer(debounce=0.05, max_delay=1, flush=flush)
+            assert not coalescer.running
+            coalescer.submit(make_job("1", 0))
+            assert coalescer.running
+            await asyncio.sleep(0.15)
+            return coalescer, flush
+
+        coalescer, flush = asyncio.run(not_started())
+
+        assert [job.data["revision"] for job in flush.jobs] == [0]
+        assert len(coalescer) == 0
+
+
+def test_push_coalesced(monkeypatch):
+    """Test pushes of the app are coalesced"""
+    monkeypatch.setattr(settings, "PUSH_COALESCE_DEBOUNCE", 10)
+    crud = AsyncMock()
+    adapter = MagicMock()
+    crud.get.return_value = LOCATIONS[0]
+    adapter.location_adapter.return_value = Location(**LOCATIONS[0])
+
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=crud,
+        adapter=adapter,
+        authenticator=ClientAuthenticator,
+        modules=[],
+        http_push=True,
+    )
+    data = schemas.Push(
+        module_id=enums.ModuleID.locations,
+        object_id="1",
+        receivers=[
+            schemas.Receiver(endpoints_url="http://a.com", auth_token="token")
+        ],
+    ).model_dump()
+
+    send_outbox_jobs = AsyncMock()
+    with patch("py_ocpi.core.push.send_outbox_jobs", send_outbox_jobs):
+        with TestClient(app) as client:
+            responses = [
+                client.post(
+                    "/push/2.2.1",
+                    json=data,
+                    headers={"Authorization": f"Token {ENCODED_AUTH_TOKEN}"},
+                ).json()["receiver_responses"][0]
+                for _ in range(3)
+            ]
+
+    assert [r["status_code"] for r in responses] == [202, 202, 202]
+    assert [r["response"]["coalesced"] for r in responses] == [
+        False,
+        True,
+        True,
+    ]
+    # held pushes are sent on shutdown
+    send_outbox_jobs.assert_awaited_once()
+    assert len(send_outbox_jobs.await_args.args[0]) == 1
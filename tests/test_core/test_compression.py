@@ -0,0 +1,126 @@
+"""Minimal unit tests for py_ocpi.core.compression"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+from py_ocpi.main import get_application
+from py_ocpi.core import enums
+from py_ocpi.core.compression import ModulesGZipMiddleware
+from py_ocpi.core.config import settings
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.test_v_2_2_1.test_locations.utils import (
+    AUTH_HEADERS,
+    CPO_BASE_URL,
+    LOCATIONS,
+    ClientAuthenticator,
+)
+
+
+@pytest.fixture(autouse=True)
+def gzip_modules(monkeypatch):
+    monkeypatch.setattr(settings, "GZIP_MODULES", ["locations"])
+
+
+def get_client(crud) -> TestClient:
+    return TestClient(
+        get_application(
+            version_numbers=[VersionNumber.v_2_2_1],
+            roles=[enums.RoleEnum.cpo],
+            crud=crud,
+            authenticator=ClientAuthenticator,
+            modules=[enums.ModuleID.locations],
+        )
+    )
+
+
+def get_locations(amount: int) -> list:
+    locations = []
+    for i in range(amount):
+        location = copy.deepcopy(LOCATIONS[0])
+        location["id"] = f"location-{i}"
+        locations.append(location)
+    return locations
+
+
+class TestModulesGZipMiddleware:
+    """Test ModulesGZipMiddleware"""
+
+    def test_is_eligible(self):
+        """Test only the given modules routes are eligible"""
+        middleware = ModulesGZipMiddleware(None, modules=["locations"])
+        assert middleware.is_eligible("/ocpi/cpo/2.2.1/locations/")
+        assert middleware.is_eligible("/ocpi/emsp/2.2.1/locations/NL/ABC/1")
+        assert not middleware.is_eligible("/ocpi/cpo/2.2.1/tariffs/")
+        assert not middleware.is_eligible("/ocpi/versions")
+
+    def test_list_is_compressed(self):
+        """Test big list response is gzip compressed"""
+        locations = get_locations(20)
+
+        class Crud:
+            @classmethod
+            async def list(cls, module, role, filters, *args, **kwargs):
+                return locations, len(locations), True
+
+        response = get_client(Crud).get(
+            CPO_BASE_URL, headers={**AUTH_HEADERS, "Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["data"]) == 20
+
+    def test_streamed_list_is_compressed(self):
+        """Test streamed list response is gzip compressed"""
+        locations = get_locations(20)
+
+        class Crud:
+            @classmethod
+            async def iter_list(cls, module, role, filters, *args, **kwargs):
+                async def items():
+                    for location in locations:
+                        yield location
+
+                return items(), len(locations), True
+
+        response = get_client(Crud).get(
+            CPO_BASE_URL, headers={**AUTH_HEADERS, "Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["data"]) == 20
+        assert response.headers["x-total-count"] == "20"
+
+    def test_small_response_is_not_compressed(self):
+        """Test response under the minimum size is not compressed"""
+
+        class Crud:
+            @classmethod
+            async def list(cls, module, role, filters, *args, **kwargs):
+                return [], 0, True
+
+        response = get_client(Crud).get(
+            CPO_BASE_URL, headers={**AUTH_HEADERS, "Accept-Encoding": "gzip"}
+        )
+
+        assert "content-encoding" not in response.headers
+
+    def test_disabled(self, monkeypatch):
+        """Test responses are not compressed without GZIP_MODULES"""
+        monkeypatch.setattr(settings, "GZIP_MODULES", [])
+        locations = get_locations(20)
+
+        class Crud:
+            @classmethod
+            async def list(cls, module, role, filters, *args, **kwargs):
+                return locations, len(locations), True
+
+        response = get_client(Crud).get(
+            CPO_BASE_URL, headers={**AUTH_HEADERS, "Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
@@ -3,6 +3,7 @@ import pytest
 from datetime import datetime, timezone
 from pydantic import BaseModel, ValidationError
 
+from py_ocpi.core.config import settings
 from py_ocpi.core.data_types import (
     String,
     CiString,
@@ -49,6 +50,28 @@ class TestStringValidator:
         result = Model(value="émojis_✓")
         assert result.value == "émojis_✓"
 
+    def test_invalid_utf8_raises_error(self):
+        """Test string with lone surrogate raises ValueError"""
+        class Model(BaseModel):
+            value: String(20)
+
+        with pytest.raises(ValidationError, match="invalid string format"):
+            Model(value="abc\udc80")
+
+    def test_type_is_cached_per_max_length(self):
+        """Test the same class is returned for the same max length"""
+        assert String(10) is String(10)
+        assert String(10) is not String(11)
+        assert String(10) is not CiString(10)
+
+    def test_serializes_to_plain_string(self):
+        """Test dumped value is a plain str"""
+        class Model(BaseModel):
+            value: String(10)
+
+        result = Model(value="hello").model_dump()
+        assert type(result["value"]) is str
+
 
 class TestCiStringValidator:
     """Test CiString custom validator"""
@@ -78,6 +101,21 @@ class TestCiStringValidator:
         with pytest.raises(ValidationError, match="length must be lower or equal"):
             Model(value="toolong")
 
+    @pytest.mark.parametrize(
+        "lowercase, expected", [(True, "hello"), (False, "HELLO")]
+    )
+    def test_case_is_normalized(self, monkeypatch, lowercase, expected):
+        """Test value is normalized to the preferred case at validation"""
+        class Model(BaseModel):
+            value: CiString(10)
+
+        # the preference is changed after the model is built
+        monkeypatch.setattr(
+            settings, "CI_STRING_LOWERCASE_PREFERENCE", lowercase
+        )
+        result = Model(value="HeLLo")
+        assert result.value == expected
+
 
 class TestURLValidator:
     """Test URL custom validator"""
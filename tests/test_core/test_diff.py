@@ -0,0 +1,289 @@
+"""Minimal unit tests for py_ocpi.core.diff"""
+
+import asyncio
+import copy
+
+import httpx
+
+from py_ocpi.core import enums, schemas
+from py_ocpi.core.config import settings
+from py_ocpi.core.diff import (
+    SentObjects,
+    location_patch,
+    sent_objects,
+    session_patch,
+)
+from py_ocpi.core.partners import partner_registry
+from py_ocpi.core.push import send_to_receiver
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.mocks.async_client import fake_endpoints_data
+
+LOCATION = {
+    "id": "LOC1",
+    "name": "name",
+    "last_updated": "2024-01-01T00:00:00Z",
+    "evses": [
+        {
+            "uid": f"EVSE{evse}",
+            "status": "AVAILABLE",
+            "last_updated": "2024-01-01T00:00:00Z",
+            "connectors": [
+                {
+                    "id": f"{connector}",
+                    "standard": "IEC_62196_T2",
+                    "last_updated": "2024-01-01T00:00:00Z",
+                }
+                for connector in range(2)
+            ],
+        }
+        for evse in range(3)
+    ],
+}
+
+SESSION = {
+    "id": "SES1",
+    "kwh": 1,
+    "charging_periods": [{"start_date_time": "2024-01-01T00:00:00Z"}],
+    "last_updated": "2024-01-01T00:00:00Z",
+}
+
+LAST_UPDATED = "2024-01-01T00:01:00Z"
+
+
+def changed_location(**changes) -> dict:
+    location = copy.deepcopy(LOCATION)
+    location["last_updated"] = LAST_UPDATED
+    for path, value in changes.items():
+        target = location
+        *parents, field = path.split("__")
+        for parent in parents:
+            name, index = parent.rsplit("_", 1)
+            target = target[name][int(index)]
+            target["last_updated"] = LAST_UPDATED
+        target[field] = value
+    return location
+
+
+class TestLocationPatch:
+    """Test the narrowest target of location changes"""
+
+    def test_connector(self):
+        current = changed_location(evses_1__connectors_0__standard="CHADEMO")
+        patch = location_patch(LOCATION, current)
+        assert patch.path == "/EVSE1/0"
+        assert patch.data == {
+            "standard": "CHADEMO",
+            "last_updated": LAST_UPDATED,
+        }
+
+    def test_evse(self):
+        current = changed_location(evses_2__status="CHARGING")
+        patch = location_patch(LOCATION, current)
+        assert patch.path == "/EVSE2"
+        assert patch.data == {
+            "status": "CHARGING",
+            "last_updated": LAST_UPDATED,
+        }
+
+    def test_location(self):
+        current = changed_location(name="new name", evses_0__status="CHARGING")
+        patch = location_patch(LOCATION, current)
+        assert patch.path == ""
+        assert patch.data == {
+            "name": "new name",
+            "evses": current["evses"],
+            "last_updated": LAST_UPDATED,
+        }
+
+    def test_put_fallback(self):
+        """Test removed fields and EVSEs can't be patched"""
+        current = changed_location(name=None)
+        assert location_patch(LOCATION, current) is None
+
+        current = changed_location()
+        current["evses"].pop()
+        assert location_patch(LOCATION, current) is None
+
+
+class TestSessionPatch:
+    """Test the session changes"""
+
+    def test_appended_charging_periods(self):
+        current = copy.deepcopy(SESSION)
+        current["kwh"] = 2
+        current["charging_periods"].append(
+            {"start_date_time": "2024-01-01T00:01:00Z"}
+        )
+        current["last_updated"] = LAST_UPDATED
+
+        patch = session_patch(SESSION, current)
+        assert patch.path == ""
+        assert patch.data == {
+            "kwh": 2,
+            "charging_periods": [{"start_date_time": "2024-01-01T00:01:00Z"}],
+            "last_updated": LAST_UPDATED,
+        }
+
+    def test_replaced_charging_periods(self):
+        current = copy.deepcopy(SESSION)
+        current["charging_periods"] = []
+        assert session_patch(SESSION, current) is None
+
+
+def test_sent_objects_bounded():
+    objects = SentObjects(maxsize=2)
+    for object_id in ("1", "2", "3"):
+        objects.set("http://a.com", enums.ModuleID.locations, object_id, {})
+    objects.set("http://a.com", enums.ModuleID.tariffs, "1", {})
+
+    assert len(objects) == 2
+    objects.invalidate("http://a.com")
+    assert len(objects) == 0
+
+
+class MockPartnerClient:
+    """Records the pushes, answers the status codes in order, then 200"""
+
+    def __init__(self, *status_codes, ocpi_status_codes=()):
+        self.status_codes = list(status_codes)
+        self.ocpi_status_codes = list(ocpi_status_codes)
+        self.requests = []
+
+    async def get(self, url, headers):
+        return httpx.Response(200, json=fake_endpoints_data)
+
+    def build_request(self, method, url, headers, json):
+        return method, url, json
+
+    async def send(self, request):
+        self.requests.append(request)
+        status_code = self.status_codes.pop(0) if self.status_codes else 200
+        ocpi_status_code = (
+            self.ocpi_status_codes.pop(0) if self.ocpi_status_codes else 1000
+        )
+        return httpx.Response(
+            status_code, json={"status_code": ocpi_status_code}
+        )
+
+
+def test_push_patch(monkeypatch):
+    """Test changes are pushed with PATCH after a first PUT"""
+    monkeypatch.setattr(settings, "PUSH_PATCH", True)
+    partner_registry.invalidate()
+    sent_objects.invalidate()
+    receiver = schemas.Receiver(
+        endpoints_url="http://partner.com/details", auth_token="token"
+    )
+
+    def push(data, http_client):
+        return asyncio.run(
+            send_to_receiver(
+                VersionNumber.v_2_2_1,
+                enums.ModuleID.locations,
+                "LOC1",
+                data,
+                receiver,
+                "Token token",
+                http_client,
+            )
+        )
+
+    http_client = MockPartnerClient()
+    push(LOCATION, http_client)
+    current = changed_location(evses_1__status="CHARGING")
+    push(current, http_client)
+    assert [method for method, _, _ in http_client.requests] == [
+        "PUT",
+        "PATCH",
+    ]
+    assert http_client.requests[1][1].endswith("/LOC1/EVSE1")
+
+    # a refused PATCH is followed by a PUT
+    http_client = MockPartnerClient(400)
+    push(changed_location(evses_1__status="BLOCKED"), http_client)
+    assert [method for method, _, _ in http_client.requests] == [
+        "PATCH",
+        "PUT",
+    ]
+
+    # the next push after a refused PUT is a PUT
+    http_client = MockPartnerClient(500, 500)
+    push(changed_location(evses_1__status="AVAILABLE"), http_client)
+    push(changed_location(evses_1__status="CHARGING"), http_client)
+    assert [method for method, _, _ in http_client.requests] == [
+        "PATCH",
+        "PUT",
+        "PUT",
+    ]
+
+    # a PATCH refused with an OCPI error is followed by a PUT
+    http_client = MockPartnerClient(ocpi_status_codes=[2001])
+    push(changed_location(evses_1__status="BLOCKED"), http_client)
+    assert [method for method, _, _ in http_client.requests] == [
+        "PATCH",
+        "PUT",
+    ]
+
+    # a PUT refused with an OCPI error isn't the base of the next PATCH
+    http_client = MockPartnerClient(ocpi_status_codes=[2001, 2001])
+    push(changed_location(evses_1__status="AVAILABLE"), http_client)
+    push(changed_location(evses_1__status="CHARGING"), http_client)
+    push(changed_location(evses_1__status="AVAILABLE"), http_client)
+    assert [method for method, _, _ in http_client.requests] == [
+        "PATCH",
+        "PUT",
+        "PUT",
+        "PATCH",
+    ]
+    partner_registry.invalidate()
+    sent_objects.invalidate()
+
+
+def test_push_patch_concurrent_sends(monkeypatch):
+    """Test concurrent sends of an object wait for each other"""
+    monkeypatch.setattr(settings, "PUSH_PATCH", True)
+    partner_registry.invalidate()
+    sent_objects.invalidate()
+    receiver = schemas.Receiver(
+        endpoints_url="http://partner.com/details", auth_token="token"
+    )
+
+    class SlowPartnerClient(MockPartnerClient):
+        sending = False
+        overlapped = False
+
+        async def send(self, request):
+            self.overlapped |= self.sending
+            self.sending = True
+            await asyncio.sleep(0.01)
+            self.sending = False
+            return await super().send(request)
+
+    async def push(http_client):
+        await asyncio.gather(
+            *(
+                send_to_receiver(
+                    VersionNumber.v_2_2_1,
+                    enums.ModuleID.locations,
+                    "LOC1",
+                    data,
+                    receiver,
+                    "Token token",
+                    http_client,
+                )
+                for data in (LOCATION, changed_location(name="new"))
+            )
+        )
+
+    http_client = SlowPartnerClient()
+    asyncio.run(push(http_client))
+    assert not http_client.overlapped
+    # the PATCH is built from the version accepted by the first send
+    assert [method for method, _, _ in http_client.requests] == [
+        "PUT",
+        "PATCH",
+    ]
+    assert http_client.requests[1][2]["name"] == "new"
+    partner_registry.invalidate()
+    sent_objects.invalidate()
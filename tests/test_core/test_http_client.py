@@ -0,0 +1,47 @@
+"""Minimal unit tests for py_ocpi.core.http_client"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from py_ocpi.main import get_application
+from py_ocpi.core import enums
+from py_ocpi.core.config import settings
+from py_ocpi.core.http_client import create_http_client, get_app_http_client
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.utils import ClientAuthenticator
+
+
+def get_app() -> FastAPI:
+    return get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=None,
+        authenticator=ClientAuthenticator,
+        modules=[],
+    )
+
+
+class TestHttpClient:
+    """Test the application-scoped HTTP client"""
+
+    def test_create_http_client(self):
+        """Test client is configured from the settings"""
+        client = create_http_client()
+        assert client.timeout.read == settings.HTTP_CLIENT_TIMEOUT
+        assert client.timeout.connect == settings.HTTP_CLIENT_CONNECT_TIMEOUT
+
+    def test_lifespan(self):
+        """Test client is created and closed with the application"""
+        app = get_app()
+        with TestClient(app):
+            client = app.state.http_client
+            assert not client.is_closed
+            assert get_app_http_client(app) is client
+        assert client.is_closed
+
+    def test_created_on_first_use(self):
+        """Test client is created once if the lifespan didn't run"""
+        app = get_app()
+        client = get_app_http_client(app)
+        assert get_app_http_client(app) is client
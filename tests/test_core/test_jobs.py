@@ -0,0 +1,95 @@
+"""Minimal unit tests for py_ocpi.core.jobs"""
+
+import asyncio
+from collections import Counter
+
+from py_ocpi.core.jobs import JobExecutor
+
+
+class MockJobs:
+    """Records the jobs running at once by type"""
+
+    def __init__(self):
+        self.running = Counter()
+        self.max_running = Counter()
+        self.done = []
+
+    async def __call__(self, job_type, name, delay=0.01, fail=False):
+        self.running[job_type] += 1
+        self.max_running[job_type] = max(
+            self.max_running[job_type], self.running[job_type]
+        )
+        try:
+            await asyncio.sleep(delay)
+            if fail:
+                raise ValueError(name)
+            self.done.append(name)
+        finally:
+            self.running[job_type] -= 1
+
+
+class TestJobExecutor:
+    """Test the background jobs"""
+
+    def test_rejects_when_full(self):
+        async def full():
+            executor = JobExecutor(workers=1, max_queued=2)
+            jobs = MockJobs()
+            accepted = [
+                executor.submit("commands", jobs, "commands", i)
+                for i in range(3)
+            ]
+            stats = executor.stats()
+            await executor.stop()
+            return accepted, stats, executor.stats(), jobs
+
+        accepted, stats, stopped, jobs = asyncio.run(full())
+
+        assert accepted == [True, True, False]
+        assert stats.queued == 2
+        assert stats.rejected == 1
+        # queued jobs are drained on stop
+        assert jobs.done == [0, 1]
+        assert stopped.succeeded == 2
+        assert stopped.queued == stopped.running == 0
+
+    def test_type_limits(self):
+        """Test a capped type doesn't hold the workers back"""
+
+        async def capped():
+            executor = JobExecutor(
+                workers=4, max_queued=100, type_limits={"commands": 1}
+            )
+            jobs = MockJobs()
+            for i in range(3):
+                executor.submit("commands", jobs, "commands", f"c{i}")
+            for i in range(3):
+                executor.submit("push", jobs, "push", f"p{i}")
+            await asyncio.sleep(0.005)
+            stats = executor.stats("commands")
+            await executor.stop()
+            return stats, jobs
+
+        stats, jobs = asyncio.run(capped())
+
+        assert stats.running == 1
+        assert stats.queued == 2
+        assert jobs.max_running == {"commands": 1, "push": 3}
+        assert jobs.done[-2:] == ["c1", "c2"]
+
+    def test_failed_and_cancelled(self):
+        async def failing():
+            executor = JobExecutor(workers=2, max_queued=10)
+            jobs = MockJobs()
+            executor.submit("push", jobs, "push", "fail", fail=True)
+            executor.submit("push", jobs, "push", "slow", delay=10)
+            await asyncio.sleep(0.05)
+            await executor.stop(timeout=0.01)
+            return executor.stats("push"), executor.running
+
+        stats, running = asyncio.run(failing())
+
+        assert stats.failed == 1
+        assert stats.succeeded == 0
+        assert stats.running == 0
+        assert running is False
@@ -0,0 +1,69 @@
+"""Minimal unit tests for py_ocpi.core.logs"""
+
+import json
+import logging
+from logging.handlers import QueueHandler
+from unittest.mock import MagicMock
+
+from py_ocpi.core.logs import (
+    CustomFormatter,
+    JSONFormatter,
+    LazyDump,
+    LoggingConfig,
+)
+
+
+def make_record(level=logging.INFO, msg="data - %s", args=("value",)):
+    return logging.LogRecord("OCPI-Logger", level, "f.py", 1, msg, args, None)
+
+
+class TestFormatters:
+    """Test CustomFormatter and JSONFormatter"""
+
+    def test_custom_formatter_reuses_formatters(self):
+        """Test per-level formatters are built once"""
+        formatter = CustomFormatter()
+        debug_formatter = formatter.formatters[logging.DEBUG]
+        output = formatter.format(make_record(logging.DEBUG))
+        assert "[DEBUG] data - value (f.py:1)" in output
+        assert formatter.formatters[logging.DEBUG] is debug_formatter
+        assert formatter.format(make_record(logging.CRITICAL)) == "data - value"
+
+    def test_json_formatter(self):
+        """Test records are formatted as JSON objects"""
+        content = json.loads(JSONFormatter().format(make_record()))
+        assert content["level"] == "INFO"
+        assert content["message"] == "data - value"
+        assert content["lineno"] == 1
+
+
+class TestLazyDump:
+    """Test LazyDump"""
+
+    def test_dump_is_deferred(self):
+        """Test model is dumped only when the record is formatted"""
+        model = MagicMock()
+        model.model_dump.return_value = {"id": "1"}
+        logger = logging.getLogger("test-lazy-dump")
+        logger.setLevel(logging.INFO)
+
+        logger.debug("data - %s", LazyDump(model))
+        model.model_dump.assert_not_called()
+
+        record = make_record(args=(LazyDump(model),))
+        assert record.getMessage() == "data - {'id': '1'}"
+
+
+class TestLoggingConfig:
+    """Test LoggingConfig"""
+
+    def test_queue_handler(self):
+        """Test records go through a queue when use_queue is set"""
+        logger = logging.getLogger("test-logging-config")
+        config = LoggingConfig("production", logger, use_queue=True)
+        config.configure_logger()
+        try:
+            assert any(isinstance(h, QueueHandler) for h in logger.handlers)
+            assert config.listener is not None
+        finally:
+            config.stop_listener()
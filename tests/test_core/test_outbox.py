@@ -0,0 +1,321 @@
+"""Minimal unit tests for py_ocpi.core.outbox"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from py_ocpi.main import get_application
+from py_ocpi.core import enums, schemas
+from py_ocpi.core.config import settings
+from py_ocpi.core.outbox import (
+    MemoryOutboxStore,
+    Outbox,
+    OutboxJob,
+    SQLiteOutboxStore,
+)
+from py_ocpi.core.partners import partner_registry
+from py_ocpi.core.push import send_outbox_job
+from py_ocpi.modules.locations.v_2_2_1.schemas import Location
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.mocks.async_client import (
+    MockResponse,
+    fake_endpoints_data,
+)
+from tests.test_modules.test_v_2_2_1.test_locations.utils import LOCATIONS
+from tests.test_modules.utils import ClientAuthenticator, ENCODED_AUTH_TOKEN
+
+
+def make_job(object_id: str = "1") -> OutboxJob:
+    return OutboxJob(
+        version="2.2.1",
+        module_id="locations",
+        object_id=object_id,
+        endpoints_url="http://partner.com/details",
+        auth_token="token",
+        data={"id": object_id},
+    )
+
+
+class MockSender:
+    """Answers the status codes in order, then 200"""
+
+    def __init__(self, *status_codes):
+        self.status_codes = list(status_codes)
+        self.calls = 0
+
+    async def __call__(self, job, http_client):
+        self.calls += 1
+        status_code = self.status_codes.pop(0) if self.status_codes else 200
+        if isinstance(status_code, Exception):
+            raise status_code
+        return status_code
+
+
+async def drain(outbox: Outbox, jobs: list, timeout: float = 1) -> None:
+    outbox.start(http_client=None)
+    await outbox.enqueue(jobs)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        await asyncio.sleep(0.01)
+        metrics = await outbox.metrics()
+        if metrics.depth == 0:
+            break
+    await outbox.stop()
+
+
+def make_outbox(sender, store=None, **kwargs) -> Outbox:
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("poll_interval", 0.01)
+    return Outbox(store or MemoryOutboxStore(), sender, **kwargs)
+
+
+class TestOutbox:
+    """Test the outbox workers"""
+
+    def test_sent_jobs_are_removed(self):
+        """Test jobs are removed once accepted by the receiver"""
+        sender = MockSender()
+        outbox = make_outbox(sender)
+        asyncio.run(drain(outbox, [make_job("1"), make_job("2")]))
+
+        assert sender.calls == 2
+        assert outbox.sent == 2
+
+    def test_retry(self):
+        """Test failed attempts are retried with backoff"""
+        sender = MockSender(503, ConnectionError("refused"), 429)
+        outbox = make_outbox(sender)
+        asyncio.run(drain(outbox, [make_job()]))
+
+        assert sender.calls == 4
+        assert outbox.retried == 3
+        assert outbox.sent == 1
+
+    def test_dead_letters(self):
+        """Test client errors and exhausted jobs are dead lettered"""
+        store = MemoryOutboxStore()
+        outbox = make_outbox(
+            MockSender(400, 500, 500), store=store, max_attempts=2
+        )
+        asyncio.run(drain(outbox, [make_job("1"), make_job("2")]))
+
+        dead_letters = asyncio.run(store.dead_letters())
+        assert {job.object_id for job in dead_letters} == {"1", "2"}
+        assert outbox.dead_lettered == 2
+        metrics = asyncio.run(outbox.metrics())
+        assert metrics.depth == 0
+        assert metrics.dead_letters == 2
+
+        assert asyncio.run(store.requeue_dead_letters(0)) == 2
+        assert asyncio.run(outbox.metrics()).depth == 2
+
+    def test_newer_job_replaces_retried_job(self):
+        """Test an older job is not retried after a newer one is sent"""
+        sent = []
+
+        async def sender(job, http_client):
+            if job.data["version"] == 1 and not sent:
+                sent.append(None)
+                return 503
+            sent.append(job.data["version"])
+            return 200
+
+        async def run(outbox):
+            outbox.start(http_client=None)
+            await outbox.enqueue([make_job()._replace(data={"version": 1})])
+            while not sent:
+                await asyncio.sleep(0.01)
+            # version 1 is backed off
+            await outbox.enqueue([make_job()._replace(data={"version": 2})])
+            await asyncio.sleep(0.2)
+            await outbox.stop()
+
+        outbox = make_outbox(sender, backoff_base=0.05)
+        asyncio.run(run(outbox))
+
+        assert sent == [None, 2]
+        assert asyncio.run(outbox.metrics()).depth == 0
+
+    def test_key_sent_one_job_at_a_time(self):
+        """Test the jobs of an object are not sent concurrently"""
+        sending = set()
+        overlaps = []
+
+        async def sender(job, http_client):
+            overlaps.append(job.key in sending)
+            sending.add(job.key)
+            await asyncio.sleep(0.02)
+            sending.discard(job.key)
+            return 200
+
+        async def run(outbox):
+            outbox.start(http_client=None)
+            await outbox.enqueue([make_job()])
+            await asyncio.sleep(0.01)
+            # the first job is in flight
+            await outbox.enqueue([make_job(), make_job("2")])
+            await asyncio.sleep(0.2)
+            await outbox.stop()
+
+        outbox = make_outbox(sender)
+        asyncio.run(run(outbox))
+
+        assert overlaps == [False, False, False]
+        assert outbox.sent == 3
+
+    def test_backoff(self):
+        """Test backoff doubles up to the maximum, with jitter"""
+        outbox = make_outbox(MockSender(), backoff_base=1, backoff_max=10)
+        assert 0.5 <= outbox.backoff(1) <= 1
+        assert 2 <= outbox.backoff(3) <= 4
+        assert 5 <= outbox.backoff(10) <= 10
+
+    def test_metrics_lag(self):
+        """Test lag of the jobs waiting while the outbox is stopped"""
+        outbox = make_outbox(MockSender())
+        asyncio.run(outbox.enqueue([make_job()]))
+
+        metrics = asyncio.run(outbox.metrics())
+        assert metrics.depth == 1
+        assert metrics.lag >= 0
+
+
+class TestSQLiteOutboxStore:
+    """Test the SQLite store"""
+
+    def test_store(self, tmp_path):
+        """Test jobs are kept in the database"""
+        path = str(tmp_path / "outbox.sqlite3")
+        store = SQLiteOutboxStore(path)
+        ids = asyncio.run(
+            store.add(
+                [
+                    make_job("1")._replace(next_attempt_at=1),
+                    make_job("2")._replace(next_attempt_at=5),
+                ]
+            )
+        )
+        asyncio.run(store.close())
+
+        # jobs survive a restart
+        store = SQLiteOutboxStore(path)
+        due = asyncio.run(store.due(now=2, limit=10))
+        assert [job.id for job in due] == ids[:1]
+        assert due[0].data == {"id": "1"}
+        due_later = asyncio.run(store.due(now=10, limit=10, exclude=ids[:1]))
+        assert [job.id for job in due_later] == ids[1:]
+
+        asyncio.run(
+            store.reschedule(due[0]._replace(attempts=1, next_attempt_at=20))
+        )
+        asyncio.run(store.bury(due[0]._replace(last_error="error")))
+        asyncio.run(store.remove(ids[1]))
+
+        stats = asyncio.run(store.stats(now=10))
+        assert stats.pending == 0
+        assert stats.dead_letters == 1
+        assert asyncio.run(store.dead_letters())[0].last_error == "error"
+        asyncio.run(store.close())
+
+    def test_add_replaces_pending_job(self, tmp_path):
+        """Test a job replaces the pending job of the same object"""
+        store = SQLiteOutboxStore(str(tmp_path / "outbox.sqlite3"))
+        old_id, dead_id = asyncio.run(store.add([make_job("1"), make_job("2")]))
+        asyncio.run(store.bury(make_job("2")._replace(id=dead_id)))
+        (new_id,) = asyncio.run(
+            store.add([make_job("1")._replace(data={"id": "new"})])
+        )
+        asyncio.run(store.add([make_job("2")]))
+
+        due = asyncio.run(store.due(now=10, limit=10))
+        assert [job.data for job in due] == [{"id": "new"}, {"id": "2"}]
+        assert due[0].id == new_id != old_id
+        # the older dead letter is dropped
+        assert asyncio.run(store.requeue_dead_letters(0)) == 0
+        assert asyncio.run(store.stats(now=10)).pending == 2
+        asyncio.run(store.close())
+
+    def test_file_is_private(self, tmp_path):
+        """Test the database holding the tokens is readable by its owner"""
+        path = tmp_path / "outbox.sqlite3"
+        store = SQLiteOutboxStore(str(path))
+        asyncio.run(store.close())
+
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_path_is_required(self, monkeypatch):
+        """Test the outbox isn't enabled without OUTBOX_DB_PATH"""
+        monkeypatch.setattr(settings, "OUTBOX_DB_PATH", None)
+        with pytest.raises(ValueError):
+            get_application(
+                version_numbers=[VersionNumber.v_2_2_1],
+                roles=[enums.RoleEnum.cpo],
+                crud=AsyncMock(),
+                adapter=MagicMock(),
+                authenticator=ClientAuthenticator,
+                modules=[],
+                http_push=True,
+                push_outbox=True,
+            )
+
+
+def test_send_outbox_job():
+    """Test outbox job is sent to the module endpoint of the receiver"""
+    partner_registry.invalidate()
+    http_client = MagicMock()
+    http_client.get = AsyncMock(
+        return_value=MockResponse(fake_endpoints_data, 200)
+    )
+    http_client.send = AsyncMock(return_value=MockResponse({}, 201))
+
+    status_code = asyncio.run(send_outbox_job(make_job(), http_client))
+
+    assert status_code == 201
+    url = http_client.build_request.call_args.args[1]
+    assert url.endswith("/1")
+    partner_registry.invalidate()
+
+
+def test_push_enqueues():
+    """Test push endpoint answers without waiting for the receivers"""
+    crud = AsyncMock()
+    adapter = MagicMock()
+    crud.get.return_value = LOCATIONS[0]
+    adapter.location_adapter.return_value = Location(**LOCATIONS[0])
+    store = MemoryOutboxStore()
+
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=crud,
+        adapter=adapter,
+        authenticator=ClientAuthenticator,
+        modules=[],
+        http_push=True,
+        push_outbox=store,
+    )
+    client = TestClient(app)
+    data = schemas.Push(
+        module_id=enums.ModuleID.locations,
+        object_id="1",
+        receivers=[
+            schemas.Receiver(endpoints_url=url, auth_token="token")
+            for url in ("http://a.com", "http://b.com")
+        ],
+    ).model_dump()
+    response = client.post(
+        "/push/2.2.1",
+        json=data,
+        headers={"Authorization": f"Token {ENCODED_AUTH_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert [
+        r["status_code"] for r in response.json()["receiver_responses"]
+    ] == [202, 202]
+    assert asyncio.run(store.stats(0)).pending == 2
+    crud.get.assert_awaited_once()
@@ -0,0 +1,103 @@
+"""Minimal unit tests for py_ocpi.core.partners"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from py_ocpi.core.partners import PartnerEndpointsError, PartnerRegistry
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.mocks.async_client import (
+    MockResponse,
+    fake_endpoints_data,
+)
+
+URL = "http://partner.com/ocpi/2.2.1/details"
+ENDPOINTS = fake_endpoints_data["data"]["endpoints"]
+
+
+class MockPartnerClient:
+    def __init__(self, status_code: int = 200, data=fake_endpoints_data):
+        self.status_code = status_code
+        self.data = data
+        self.calls = 0
+
+    async def get(self, url, headers):
+        self.calls += 1
+        return MockResponse(self.data, self.status_code)
+
+
+class TestPartnerRegistry:
+    """Test the registry of partner endpoints"""
+
+    def test_set_and_get(self):
+        """Test endpoints are stored per url and version"""
+        registry = PartnerRegistry(ttl=60)
+        registry.set(URL, VersionNumber.v_2_2_1, ENDPOINTS)
+
+        assert registry.get(URL, VersionNumber.v_2_2_1) == ENDPOINTS
+        assert registry.get(URL, VersionNumber.v_2_1_1) is None
+        assert registry.get("http://other.com", VersionNumber.v_2_2_1) is None
+
+    def test_expired(self):
+        """Test endpoints are not used after the ttl"""
+        registry = PartnerRegistry(ttl=60)
+        with patch("py_ocpi.core.partners.time.monotonic", return_value=0):
+            registry.set(URL, VersionNumber.v_2_2_1, ENDPOINTS)
+        with patch("py_ocpi.core.partners.time.monotonic", return_value=61):
+            assert registry.get(URL, VersionNumber.v_2_2_1) is None
+        assert len(registry) == 0
+
+    def test_disabled(self):
+        """Test nothing is stored with ttl 0 or without endpoints"""
+        registry = PartnerRegistry(ttl=0)
+        registry.set(URL, VersionNumber.v_2_2_1, ENDPOINTS)
+        assert len(registry) == 0
+
+        registry = PartnerRegistry(ttl=60)
+        registry.set(URL, VersionNumber.v_2_2_1, [])
+        assert len(registry) == 0
+
+    def test_invalidate(self):
+        """Test endpoints of a partner are evicted for all versions"""
+        registry = PartnerRegistry(ttl=60)
+        registry.set(URL, VersionNumber.v_2_2_1, ENDPOINTS)
+        registry.set(URL, VersionNumber.v_2_1_1, ENDPOINTS)
+        registry.set("http://other.com", VersionNumber.v_2_2_1, ENDPOINTS)
+
+        registry.invalidate(URL)
+        assert len(registry) == 1
+        registry.invalidate()
+        assert len(registry) == 0
+
+    @pytest.mark.parametrize(
+        "http_client",
+        [
+            MockPartnerClient(500),
+            MockPartnerClient(404, {"status_code": 2000}),
+            MockPartnerClient(200, {"status_code": 1000}),
+        ],
+    )
+    def test_fetch_failed(self, http_client):
+        """Test failed version details requests raise and aren't stored"""
+        registry = PartnerRegistry(ttl=60)
+        with pytest.raises(PartnerEndpointsError):
+            asyncio.run(
+                registry.fetch(
+                    URL, VersionNumber.v_2_2_1, "Token a", http_client
+                )
+            )
+        assert registry.get(URL, VersionNumber.v_2_2_1) is None
+
+    def test_fetch(self):
+        """Test fetched endpoints are stored"""
+        registry = PartnerRegistry(ttl=60)
+
+        endpoints = asyncio.run(
+            registry.fetch(
+                URL, VersionNumber.v_2_2_1, "Token a", MockPartnerClient()
+            )
+        )
+        assert endpoints == ENDPOINTS
+        assert registry.get(URL, VersionNumber.v_2_2_1) == ENDPOINTS
@@ -0,0 +1,56 @@
+"""Minimal unit tests for py_ocpi.core.registry"""
+
+import pytest
+from pydantic import BaseModel
+
+from py_ocpi.core.adapter import BaseAdapter
+from py_ocpi.core.registry import ModelRegistry, model_registry
+from py_ocpi.modules.locations.v_2_2_1.schemas import Location
+from py_ocpi.modules.tariffs.v_2_2_1.schemas import Tariff
+from py_ocpi.modules.versions.enums import VersionNumber
+
+
+class TestModelRegistry:
+    """Test ModelRegistry lookups"""
+
+    def test_get_loads_module_model(self):
+        """Test model is loaded from the module schemas"""
+        registry = ModelRegistry()
+        model = registry.get("Location", "locations", "v_2_2_1")
+        assert model is Location
+
+    def test_get_unknown_module_raises_error(self):
+        """Test unknown module raises NotImplementedError"""
+        registry = ModelRegistry()
+        with pytest.raises(NotImplementedError):
+            registry.get("Unknown", "unknown", "v_2_2_1")
+
+    def test_load_skips_missing_models(self):
+        """Test load registers only the models existing for a version"""
+        registry = ModelRegistry()
+        registry.load([VersionNumber.v_2_1_1])
+        assert registry.get("Location", "locations", "v_2_1_1")
+        assert ("chargingprofiles", "v_2_1_1", "ClearProfileResult") not in (
+            registry._models
+        )
+
+
+def test_adapter_uses_registered_model():
+    """Test a custom model registered by an adapter is used"""
+
+    class CustomTariff(BaseModel):
+        id: str
+
+    class CustomAdapter(BaseAdapter): ...
+
+    class CustomSubAdapter(CustomAdapter): ...
+
+    CustomAdapter.register_model(
+        "Tariff", "tariffs", VersionNumber.v_2_2_1, CustomTariff
+    )
+    tariff = CustomSubAdapter.tariff_adapter({"id": "1"})
+    assert isinstance(tariff, CustomTariff)
+
+    # other adapters keep the OCPI schema
+    assert BaseAdapter.get_model("Tariff", "tariffs", "v_2_2_1") is Tariff
+    assert model_registry.get("Tariff", "tariffs", "v_2_2_1") is Tariff
@@ -0,0 +1,79 @@
+"""Minimal unit tests for py_ocpi.core.responses"""
+
+import asyncio
+import json
+
+import pytest
+
+from py_ocpi.core import status
+from py_ocpi.core.responses import ocpi_response, ocpi_stream_response
+from py_ocpi.core.schemas import OCPIResponse
+from py_ocpi.modules.locations.v_2_2_1.schemas import Location
+
+from tests.test_modules.test_v_2_2_1.test_locations.utils import LOCATIONS
+
+
+class TestOCPIResponse:
+    """Test ocpi_response rendering"""
+
+    def test_renders_models_like_model_dump(self):
+        """Test adapted models render as their json dump"""
+        location = Location(**LOCATIONS[0])
+        response = ocpi_response(
+            data=[location], **status.OCPI_1000_GENERIC_SUCESS_CODE
+        )
+        content = json.loads(response.body)
+        assert content["data"] == [location.model_dump(mode="json")]
+        assert content["status_code"] == 1000
+        assert content["status_message"] == "Generic success code"
+
+    def test_content_is_valid_envelope(self):
+        """Test rendered content validates as OCPIResponse"""
+        response = ocpi_response(
+            data=[], **status.OCPI_2000_GENERIC_CLIENT_ERROR
+        )
+        content = OCPIResponse.model_validate_json(response.body)
+        assert content.data == []
+        assert content.timestamp.endswith("Z")
+
+    def test_passes_headers(self):
+        """Test headers are sent with the response"""
+        response = ocpi_response(
+            data=[],
+            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+            headers={"X-Total-Count": "0"},
+        )
+        assert response.headers["x-total-count"] == "0"
+        assert response.headers["content-type"] == "application/json"
+
+
+class TestOCPIStreamResponse:
+    """Test ocpi_stream_response rendering"""
+
+    @staticmethod
+    async def render(response) -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    @staticmethod
+    async def iterate(items):
+        for item in items:
+            yield item
+
+    @pytest.mark.parametrize("amount", [0, 1, 3])
+    def test_renders_like_ocpi_response(self, amount):
+        """Test streamed body is the same as the ocpi_response body"""
+        items = [LOCATIONS[0]] * amount
+        stream = ocpi_stream_response(
+            self.iterate(items),
+            lambda data: Location(**data),
+            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        )
+        response = ocpi_response(
+            data=[Location(**data) for data in items],
+            **status.OCPI_1000_GENERIC_SUCESS_CODE,
+        )
+        body = asyncio.run(self.render(stream))
+        assert json.loads(body) | {"timestamp": "X"} == json.loads(
+            response.body
+        ) | {"timestamp": "X"}
+        assert stream.media_type == "application/json"
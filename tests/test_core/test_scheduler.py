@@ -0,0 +1,148 @@
+"""Minimal unit tests for py_ocpi.core.scheduler"""
+
+import asyncio
+
+from py_ocpi.core.enums import ModuleID, RoleEnum
+from py_ocpi.core.jobs import job_executor
+from py_ocpi.core.scheduler import DeadlineScheduler, Poll
+
+
+class MockFinish:
+    def __init__(self):
+        self.results = {}
+
+    def __call__(self, key):
+        async def finish(result):
+            self.results[key] = result
+
+        return finish
+
+
+class BatchCrud:
+    """Answers the polls with the results of the response urls"""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    async def get_results(self, module, role, requests):
+        self.calls.append([request["response_url"] for request in requests])
+        return [self.results.get(r["response_url"]) for r in requests]
+
+
+class SingleCrud:
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+
+    async def get(self, module, role, id, response_url, **kwargs):
+        self.calls += 1
+        return self.results.get(response_url)
+
+
+def poll(crud, response_url, **kwargs):
+    return Poll(
+        crud,
+        ModuleID.commands,
+        RoleEnum.cpo,
+        {"response_url": response_url},
+        **kwargs,
+    )
+
+
+class TestDeadlineScheduler:
+    """Test the pending operations"""
+
+    def test_resolve(self):
+        async def resolve():
+            scheduler = DeadlineScheduler(interval=10)
+            finish = MockFinish()
+            scheduler.schedule("a", 10, finish("a"))
+            assert scheduler.resolve("a", {"result": "ACCEPTED"})
+            assert not scheduler.resolve("a", {})
+            await scheduler.stop()
+            await job_executor.stop()
+            return scheduler, finish
+
+        scheduler, finish = asyncio.run(resolve())
+
+        assert finish.results == {"a": {"result": "ACCEPTED"}}
+        assert len(scheduler) == 0
+
+    def test_resolved_before_scheduled(self):
+        async def resolve():
+            scheduler = DeadlineScheduler(interval=10)
+            finish = MockFinish()
+            scheduler.reserve("a", 10)
+            scheduler.resolve("a", {"id": 1})
+            scheduler.schedule("a", 10, finish("a"))
+            await scheduler.stop()
+            await job_executor.stop()
+            return finish
+
+        assert asyncio.run(resolve()).results == {"a": {"id": 1}}
+
+    def test_batched_polls(self):
+        """Test the pending operations are polled with a call per tick"""
+
+        async def batch():
+            scheduler = DeadlineScheduler(interval=0.1)
+            finish = MockFinish()
+            crud = BatchCrud({"a": {"id": "a"}})
+            for key in ("a", "b", "c"):
+                scheduler.schedule(key, 10, finish(key), poll(crud, key))
+            await asyncio.sleep(0.02)
+            crud.results["b"] = {"id": "b"}
+            await asyncio.sleep(0.12)
+            pending = len(scheduler)
+            await scheduler.stop()
+            await job_executor.stop()
+            return crud, finish, pending
+
+        crud, finish, pending = asyncio.run(batch())
+
+        assert crud.calls == [["a", "b", "c"], ["b", "c"]]
+        assert finish.results == {"a": {"id": "a"}, "b": {"id": "b"}}
+        assert pending == 1
+
+    def test_polls_without_batch(self):
+        async def single():
+            scheduler = DeadlineScheduler(interval=10)
+            finish = MockFinish()
+            crud = SingleCrud({"a": {"id": "a"}})
+            for key in ("a", "b"):
+                scheduler.schedule(key, 10, finish(key), poll(crud, key))
+            await asyncio.sleep(0.01)
+            await scheduler.stop()
+            await job_executor.stop()
+            return crud, finish
+
+        crud, finish = asyncio.run(single())
+
+        assert crud.calls == 2
+        assert finish.results == {"a": {"id": "a"}}
+
+    def test_deadlines(self):
+        """Test the operations finish with None at their deadline"""
+
+        async def expire():
+            scheduler = DeadlineScheduler(interval=10)
+            finish = MockFinish()
+            crud = SingleCrud({"c": None})
+            for i, key in enumerate(("a", "b")):
+                scheduler.schedule(key, 0.1 * (i + 1), finish(key))
+            # data is the result only once the poll maps it
+            scheduler.schedule(
+                "c", 0.3, finish("c"), poll(crud, "c", result=lambda _: True)
+            )
+            await asyncio.sleep(0.15)
+            results = dict(finish.results)
+            await asyncio.sleep(0.1)
+            return scheduler, results, finish
+
+        scheduler, results, finish = asyncio.run(expire())
+
+        assert results == {"a": None, "c": True}
+        assert finish.results == {"a": None, "b": None, "c": True}
+        assert len(scheduler) == 0
+        assert scheduler._task.done()
@@ -0,0 +1,142 @@
+"""Minimal unit tests for py_ocpi.core.authentication.verifier"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from py_ocpi.main import get_application
+from py_ocpi.core import enums
+from py_ocpi.core.authentication.verifier import (
+    AuthTokenCache,
+    PartyContext,
+    authenticate,
+    auth_token_cache,
+    invalidate_auth_token,
+)
+from py_ocpi.core.exceptions import AuthorizationOCPIError
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from tests.test_modules.test_v_2_2_1.test_locations.utils import (
+    AUTH_HEADERS,
+    CPO_BASE_URL,
+    LOCATIONS,
+    ClientAuthenticator,
+)
+
+
+class Authenticator:
+    calls = 0
+    tokens = ["valid"]
+
+    @classmethod
+    async def authenticate(cls, auth_token: str) -> None:
+        cls.calls += 1
+        if auth_token not in cls.tokens:
+            raise AuthorizationOCPIError
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    Authenticator.calls = 0
+    monkeypatch.setattr(auth_token_cache, "ttl", 30)
+    invalidate_auth_token()
+    yield
+    invalidate_auth_token()
+
+
+class TestAuthTokenCache:
+    """Test the authenticated token cache"""
+
+    def test_valid_token_is_cached(self):
+        """Test authenticator is called once for a valid token"""
+        asyncio.run(authenticate(Authenticator, "valid"))
+        asyncio.run(authenticate(Authenticator, "valid"))
+        assert Authenticator.calls == 1
+
+    def test_invalid_token_is_not_cached(self):
+        """Test failed authentications are not cached"""
+        for _ in range(2):
+            with pytest.raises(AuthorizationOCPIError):
+                asyncio.run(authenticate(Authenticator, "invalid"))
+        assert Authenticator.calls == 2
+        assert len(auth_token_cache) == 0
+
+    def test_invalidate(self):
+        """Test invalidated token is authenticated again"""
+        asyncio.run(authenticate(Authenticator, "valid"))
+        invalidate_auth_token("valid")
+        asyncio.run(authenticate(Authenticator, "valid"))
+        assert Authenticator.calls == 2
+
+    def test_expiry_and_eviction(self):
+        """Test tokens expire after TTL and above maxsize"""
+        cache = AuthTokenCache(ttl=10, maxsize=2)
+        with patch(
+            "py_ocpi.core.authentication.verifier.time.monotonic",
+            return_value=0,
+        ):
+            cache.add(Authenticator, "1", {})
+            cache.add(Authenticator, "2", {})
+            assert cache.get(Authenticator, "1") is not None
+            cache.add(Authenticator, "3", {})
+            assert cache.get(Authenticator, "1") is not None
+            assert cache.get(Authenticator, "2") is None
+        with patch(
+            "py_ocpi.core.authentication.verifier.time.monotonic",
+            return_value=10,
+        ):
+            assert cache.get(Authenticator, "1") is None
+
+    def test_disabled(self):
+        """Test TTL 0 disables the cache"""
+        cache = AuthTokenCache(ttl=0, maxsize=10)
+        cache.add(Authenticator, "valid", {})
+        assert cache.get(Authenticator, "valid") is None
+
+
+class TestPartyContext:
+    """Test the party context built by the verifier"""
+
+    def test_party_context_is_given_to_crud(self):
+        """Test crud receives the authenticated party context"""
+
+        class PartyAuthenticator(ClientAuthenticator):
+            @classmethod
+            async def authenticate(cls, auth_token: str) -> dict:
+                await super().authenticate(auth_token)
+                return {
+                    "country_code": "NL",
+                    "party_id": "ABC",
+                    "roles": [enums.RoleEnum.emsp],
+                }
+
+        class Crud:
+            party_context = None
+
+            @classmethod
+            async def get(cls, module, role, id, *args, **kwargs):
+                cls.party_context = kwargs["party_context"]
+                assert kwargs["auth_token"] == cls.party_context.token
+                return LOCATIONS[0]
+
+        client = TestClient(
+            get_application(
+                version_numbers=[VersionNumber.v_2_2_1],
+                roles=[enums.RoleEnum.cpo],
+                crud=Crud,
+                authenticator=PartyAuthenticator,
+                modules=[enums.ModuleID.locations],
+            )
+        )
+        response = client.get(
+            f"{CPO_BASE_URL}{LOCATIONS[0]['id']}", headers=AUTH_HEADERS
+        )
+
+        assert response.status_code == 200
+        assert isinstance(Crud.party_context, PartyContext)
+        assert Crud.party_context.country_code == "NL"
+        assert Crud.party_context.party_id == "ABC"
+        assert Crud.party_context.roles == (enums.RoleEnum.emsp,)
+        assert Crud.party_context.version == VersionNumber.v_2_2_1
@@ -1,8 +1,23 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
 from py_ocpi import get_application
+from py_ocpi.main import lifespan
 from py_ocpi.core import enums
+from py_ocpi.core.exceptions import (
+    AuthorizationOCPIError,
+    NotFoundOCPIError,
+)
+from py_ocpi.core.scheduler import scheduler
+from py_ocpi.core.utils import encode_string_base64
+from py_ocpi.modules.locations.v_2_2_1.schemas import Location
 from py_ocpi.modules.versions.enums import VersionNumber
 
-from tests.test_modules.utils import ClientAuthenticator
+from tests.test_modules.utils import ClientAuthenticator, ENCODED_AUTH_TOKEN
+
+URL = "/ocpi/cpo/2.2.1/locations/"
+AUTH_HEADERS = {"authorization": f"Token {ENCODED_AUTH_TOKEN}"}
 
 
 def test_get_application():
@@ -22,3 +37,82 @@ def test_get_application():
     )
 
     assert app.url_path_for("get_versions") == "/ocpi/versions"
+
+
+def get_client(get) -> TestClient:
+    class Crud:
+        @classmethod
+        async def list(cls, module, role, filters, *args, **kwargs):
+            return await get()
+
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=Crud,
+        modules=[enums.ModuleID.locations],
+        authenticator=ClientAuthenticator,
+    )
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_exception_handler_not_found():
+    async def get():
+        raise NotFoundOCPIError
+
+    response = get_client(get).get(URL, headers=AUTH_HEADERS)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": str(NotFoundOCPIError())}
+
+
+def test_exception_handler_authorization():
+    response = get_client(None).get(
+        URL, headers={"authorization": f"Token {encode_string_base64('x')}"}
+    )
+
+    assert response.status_code == 403
+    assert response.json() == {"detail": str(AuthorizationOCPIError())}
+
+
+def test_exception_handler_validation_error():
+    async def get():
+        Location.model_validate({})
+
+    response = get_client(get).get(URL, headers=AUTH_HEADERS)
+
+    assert response.status_code == 500
+    assert response.json()["status_code"] == 3000
+    assert response.json()["data"] == []
+
+
+def test_exception_handler_unknown_error():
+    async def get():
+        raise RuntimeError("unknown")
+
+    response = get_client(get).get(URL, headers=AUTH_HEADERS)
+
+    assert response.status_code == 200
+    assert response.json()["status_code"] == 3000
+
+
+def test_lifespan_shared_scheduler():
+    """Test the scheduler is stopped with the last running application"""
+
+    def app():
+        return get_application(
+            version_numbers=[VersionNumber.v_2_2_1],
+            roles=[enums.RoleEnum.cpo],
+            crud=None,
+            modules=[],
+            authenticator=ClientAuthenticator,
+        )
+
+    async def run():
+        async with lifespan(app()):
+            async with lifespan(app()):
+                scheduler.reserve("http://partner.com/result", 60)
+            # the pending operation of the other application is kept
+            assert len(scheduler) == 1
+        assert len(scheduler) == 0
+
+    asyncio.run(run())
@@ -1,10 +1,23 @@
 import pytest
 
+from unittest.mock import patch
 from uuid import uuid4
 
-from py_ocpi.core.config import settings
+from fastapi.testclient import TestClient
 
-from .utils import EMSP_BASE_URL, AUTH_HEADERS, LOCATIONS, WRONG_AUTH_HEADERS
+from py_ocpi.main import get_application
+from py_ocpi.core import enums
+from py_ocpi.core.config import settings
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from .utils import (
+    EMSP_BASE_URL,
+    AUTH_HEADERS,
+    LOCATIONS,
+    WRONG_AUTH_HEADERS,
+    ClientAuthenticator,
+    Crud,
+)
 
 LOCATION_URL = (
     f"{EMSP_BASE_URL}{settings.COUNTRY_CODE}/{settings.PARTY_ID}/"
@@ -172,3 +185,120 @@ def test_emsp_patch_connector_v_2_1_1(client_emsp_v_2_1_1):
     assert response.status_code == 200
     assert len(response.json()["data"]) == 1
     assert response.json()["data"][0]["id"] == patch_data["id"]
+
+
+class GranularCrud(Crud):
+    @classmethod
+    async def update_evse(
+        cls, module, role, data, location_id, evse_uid, *args, **kwargs
+    ):
+        return data if location_id == LOCATIONS[0]["id"] else None
+
+    @classmethod
+    async def update_connector(
+        cls,
+        module,
+        role,
+        data,
+        location_id,
+        evse_uid,
+        connector_id,
+        *args,
+        **kwargs,
+    ):
+        return data if location_id == LOCATIONS[0]["id"] else None
+
+    @classmethod
+    async def patch_evse(
+        cls, module, role, data, location_id, evse_uid, *args, **kwargs
+    ):
+        if location_id != LOCATIONS[0]["id"]:
+            return None
+        return {**LOCATIONS[0]["evses"][0], **data, "row_id": 1}
+
+    @classmethod
+    async def patch_connector(
+        cls,
+        module,
+        role,
+        data,
+        location_id,
+        evse_uid,
+        connector_id,
+        *args,
+        **kwargs,
+    ):
+        if location_id != LOCATIONS[0]["id"]:
+            return None
+        return {
+            **LOCATIONS[0]["evses"][0]["connectors"][0],
+            **data,
+            "row_id": 1,
+        }
+
+
+@pytest.fixture
+def client_granular_emsp_v_2_1_1():
+    return TestClient(
+        get_application(
+            version_numbers=[VersionNumber.v_2_1_1],
+            roles=[enums.RoleEnum.emsp],
+            crud=GranularCrud,
+            authenticator=ClientAuthenticator,
+            modules=[enums.ModuleID.locations],
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "method, endpoint, json, key",
+    [
+        ("put", EVSE_URL, LOCATIONS[0]["evses"][0], "uid"),
+        (
+            "put",
+            CONNECTOR_URL,
+            LOCATIONS[0]["evses"][0]["connectors"][0],
+            "id",
+        ),
+        ("patch", EVSE_URL, {"status": "CHARGING"}, "status"),
+        ("patch", CONNECTOR_URL, {"voltage": 400}, "voltage"),
+    ],
+)
+def test_emsp_granular_update_v_2_1_1(
+    client_granular_emsp_v_2_1_1, method, endpoint, json, key
+):
+    with (
+        patch.object(GranularCrud, "get") as crud_get,
+        patch.object(GranularCrud, "update") as crud_update,
+    ):
+        response = getattr(client_granular_emsp_v_2_1_1, method)(
+            endpoint, json=json, headers=AUTH_HEADERS
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 1
+    assert response.json()["data"][0][key] == json[key]
+    # the crud result is returned as an OCPI object
+    assert "row_id" not in response.json()["data"][0]
+    crud_get.assert_not_called()
+    crud_update.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "method, endpoint, json",
+    [
+        ("put", EVSE_URL, LOCATIONS[0]["evses"][0]),
+        ("put", CONNECTOR_URL, LOCATIONS[0]["evses"][0]["connectors"][0]),
+        ("patch", EVSE_URL, {"status": "CHARGING"}),
+        ("patch", CONNECTOR_URL, {"voltage": 400}),
+    ],
+)
+def test_emsp_granular_update_not_found_v_2_1_1(
+    client_granular_emsp_v_2_1_1, method, endpoint, json
+):
+    endpoint = endpoint.replace(LOCATIONS[0]["id"], str(uuid4()))
+    response = getattr(client_granular_emsp_v_2_1_1, method)(
+        endpoint, json=json, headers=AUTH_HEADERS
+    )
+
+    assert response.status_code == 404
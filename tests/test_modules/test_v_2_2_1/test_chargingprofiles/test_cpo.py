@@ -78,9 +78,9 @@ def test_cpo_get_chargingprofile_no_charging_response(
 
 
 @patch(
-    "py_ocpi.modules.chargingprofiles.v_2_2_1.api.cpo.BackgroundTasks.add_task"
+    "py_ocpi.modules.chargingprofiles.v_2_2_1.api.cpo.schedule_get_chargingprofile"
 )
-def test_cpo_get_chargingprofile_v_2_2_1(mock_background, client_cpo_v_2_2_1):
+def test_cpo_get_chargingprofile_v_2_2_1(mock_schedule, client_cpo_v_2_2_1):
     response = client_cpo_v_2_2_1.get(
         f"{CHARGINGPROFILE_URL}?duration={1}&response_url=abs",
         headers=AUTH_HEADERS,
@@ -91,7 +91,7 @@ def test_cpo_get_chargingprofile_v_2_2_1(mock_background, client_cpo_v_2_2_1):
         response.json()["data"][0]["result"]
         == ChargingProfileResponseType.accepted
     )
-    assert mock_background.call_count == 1
+    assert mock_schedule.call_count == 1
 
 
 @patch("tests.test_modules.test_v_2_2_1.test_chargingprofiles.utils.Crud.get")
@@ -133,10 +133,10 @@ def test_cpo_add_or_update_chargingprofile_no_charging_response(
 
 
 @patch(
-    "py_ocpi.modules.chargingprofiles.v_2_2_1.api.cpo.BackgroundTasks.add_task"
+    "py_ocpi.modules.chargingprofiles.v_2_2_1.api.cpo.schedule_update_chargingprofile"
 )
 def test_cpo_add_or_update_chargingprofile_v_2_2_1(
-    mock_background, client_cpo_v_2_2_1
+    mock_schedule, client_cpo_v_2_2_1
 ):
     response = client_cpo_v_2_2_1.put(
         CHARGINGPROFILE_URL,
@@ -149,7 +149,7 @@ def test_cpo_add_or_update_chargingprofile_v_2_2_1(
         response.json()["data"][0]["result"]
         == ChargingProfileResponseType.accepted
     )
-    assert mock_background.call_count == 1
+    assert mock_schedule.call_count == 1
 
 
 @patch("tests.test_modules.test_v_2_2_1.test_chargingprofiles.utils.Crud.get")
@@ -187,11 +187,9 @@ def test_cpo_delete_chargingprofile_no_charging_response(
 
 
 @patch(
-    "py_ocpi.modules.chargingprofiles.v_2_2_1.api.cpo.BackgroundTasks.add_task"
+    "py_ocpi.modules.chargingprofiles.v_2_2_1.api.cpo.schedule_delete_chargingprofile"
 )
-def test_cpo_delete_chargingprofile_v_2_2_1(
-    mock_background, client_cpo_v_2_2_1
-):
+def test_cpo_delete_chargingprofile_v_2_2_1(mock_schedule, client_cpo_v_2_2_1):
     response = client_cpo_v_2_2_1.delete(
         f"{CHARGINGPROFILE_URL}?response_url=abs",
         headers=AUTH_HEADERS,
@@ -202,4 +200,4 @@ def test_cpo_delete_chargingprofile_v_2_2_1(
         response.json()["data"][0]["result"]
         == ChargingProfileResponseType.accepted
     )
-    assert mock_background.call_count == 1
+    assert mock_schedule.call_count == 1
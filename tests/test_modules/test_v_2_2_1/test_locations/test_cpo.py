@@ -61,3 +61,48 @@ def test_cpo_get_connector_v_2_2_1(client_cpo_v_2_2_1):
         response.json()["data"][0]["id"]
         == LOCATIONS[0]["evses"][0]["connectors"][0]["id"]
     )
+
+
+def test_cpo_get_location_not_modified_v_2_2_1(client_cpo_v_2_2_1):
+    response = client_cpo_v_2_2_1.get(GET_LOCATION_URL, headers=AUTH_HEADERS)
+
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+
+    response = client_cpo_v_2_2_1.get(
+        GET_LOCATION_URL, headers={**AUTH_HEADERS, "If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = client_cpo_v_2_2_1.get(
+        GET_LOCATION_URL,
+        headers={**AUTH_HEADERS, "If-Modified-Since": last_modified},
+    )
+
+    assert response.status_code == 304
+
+
+def test_cpo_get_location_not_modified_utc_zone_v_2_2_1(client_cpo_v_2_2_1):
+    response = client_cpo_v_2_2_1.get(
+        GET_LOCATION_URL,
+        headers={
+            **AUTH_HEADERS,
+            "If-Modified-Since": "Sun, 06 Nov 2094 08:49:37 -0000",
+        },
+    )
+
+    assert response.status_code == 304
+
+
+def test_cpo_get_evse_modified_v_2_2_1(client_cpo_v_2_2_1):
+    response = client_cpo_v_2_2_1.get(
+        GET_EVSE_URL, headers={**AUTH_HEADERS, "If-None-Match": '"0-0"'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != '"0-0"'
+    assert len(response.json()["data"]) == 1
@@ -1,6 +1,20 @@
-from py_ocpi.core.config import settings
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
 
-from .utils import EMSP_BASE_URL, AUTH_HEADERS, TARIFFS, WRONG_AUTH_HEADERS
+from py_ocpi.main import get_application
+from py_ocpi.core import enums
+from py_ocpi.core.config import settings
+from py_ocpi.modules.versions.enums import VersionNumber
+
+from .utils import (
+    EMSP_BASE_URL,
+    AUTH_HEADERS,
+    TARIFFS,
+    WRONG_AUTH_HEADERS,
+    ClientAuthenticator,
+    Crud,
+)
 
 TARIFF_URL = (
     f"{EMSP_BASE_URL}{settings.COUNTRY_CODE}/{settings.PARTY_ID}/"
@@ -55,3 +69,32 @@ def test_emsp_delete_tariff_v_2_2_1(client_emsp_v_2_2_1):
     response = client_emsp_v_2_2_1.delete(TARIFF_URL, headers=AUTH_HEADERS)
 
     assert response.status_code == 200
+
+
+def test_emsp_get_tariff_version_v_2_2_1():
+    class VersionedCrud(Crud):
+        @classmethod
+        async def get_version(cls, module, role, id, *args, **kwargs):
+            return TARIFFS[0]["last_updated"], "1"
+
+    client = TestClient(
+        get_application(
+            version_numbers=[VersionNumber.v_2_2_1],
+            roles=[enums.RoleEnum.emsp],
+            crud=VersionedCrud,
+            authenticator=ClientAuthenticator,
+            modules=[enums.ModuleID.tariffs],
+        )
+    )
+    response = client.get(TARIFF_URL, headers=AUTH_HEADERS)
+
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    with patch.object(VersionedCrud, "get") as crud_get:
+        response = client.get(
+            TARIFF_URL, headers={**AUTH_HEADERS, "If-None-Match": etag}
+        )
+
+    assert response.status_code == 304
+    crud_get.assert_not_called()
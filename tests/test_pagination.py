@@ -1,9 +1,12 @@
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import parse_qs, urlparse
 
 from fastapi.testclient import TestClient
 
 from py_ocpi import get_application
 from py_ocpi.core import enums
+from py_ocpi.core.config import settings
 from py_ocpi.modules.versions.enums import VersionNumber
 
 from tests.test_modules.utils import (
@@ -11,6 +14,7 @@ from tests.test_modules.utils import (
     ENCODED_AUTH_TOKEN,
     AUTH_TOKEN,
 )
+from tests.test_modules.test_v_2_2_1.test_locations.utils import LOCATIONS
 
 
 def test_inject_dependency_v_2_2_1():
@@ -63,3 +67,95 @@ def test_inject_dependency_v_2_1_1():
     assert response.headers.get("X-Total-Count") == "0"
     assert response.headers.get("X-Limit") == "50"
     assert response.headers.get("Link") == ""
+
+
+def test_iter_list_is_streamed_v_2_2_1():
+    class Crud:
+        @classmethod
+        async def iter_list(cls, module, role, filters, *args, **kwargs):
+            async def items():
+                for location in LOCATIONS:
+                    yield location
+
+            return items(), 10, False
+
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=Crud,
+        authenticator=ClientAuthenticator,
+        modules=[enums.ModuleID.locations],
+    )
+
+    client = TestClient(app)
+    response = client.get(
+        "/ocpi/cpo/2.2.1/locations",
+        headers={"Authorization": f"Token {ENCODED_AUTH_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"][0]["id"] == LOCATIONS[0]["id"]
+    assert response.json()["status_code"] == 1000
+    assert response.headers.get("X-Total-Count") == "10"
+    assert response.headers.get("X-Limit") == "50"
+    assert 'rel="next"' in response.headers.get("Link")
+
+
+def test_cursor_pagination_v_2_2_1(monkeypatch):
+    monkeypatch.setattr(settings, "CURSOR_PAGINATION", True)
+    crud = AsyncMock()
+    crud.list.return_value = LOCATIONS, 10, False
+
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=crud,
+        authenticator=ClientAuthenticator,
+        modules=[enums.ModuleID.locations],
+    )
+
+    client = TestClient(app)
+    response = client.get(
+        "/ocpi/cpo/2.2.1/locations",
+        headers={"Authorization": f"Token {ENCODED_AUTH_TOKEN}"},
+    )
+
+    link = response.headers.get("Link")
+    assert "offset" not in link
+    cursor = parse_qs(urlparse(link[1 : link.index(">")]).query)["cursor"][0]
+
+    response = client.get(
+        "/ocpi/cpo/2.2.1/locations",
+        params={"cursor": cursor},
+        headers={"Authorization": f"Token {ENCODED_AUTH_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    filters = crud.list.call_args.args[2]
+    assert filters["cursor"] == {
+        "last_updated": datetime.fromisoformat(LOCATIONS[-1]["last_updated"]),
+        "id": LOCATIONS[-1]["id"],
+    }
+
+
+def test_invalid_cursor_v_2_2_1():
+    crud = AsyncMock()
+    crud.list.return_value = [], 0, True
+
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=crud,
+        authenticator=ClientAuthenticator,
+        modules=[enums.ModuleID.locations],
+    )
+
+    client = TestClient(app)
+    response = client.get(
+        "/ocpi/cpo/2.2.1/locations",
+        params={"cursor": "invalid"},
+        headers={"Authorization": f"Token {ENCODED_AUTH_TOKEN}"},
+    )
+
+    assert response.status_code == 400
+    crud.list.assert_not_called()
@@ -1,14 +1,23 @@
+import asyncio
+import time
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 from fastapi.testclient import TestClient
 
 from py_ocpi import get_application
 from py_ocpi.core import enums, schemas
+from py_ocpi.core.config import settings
+from py_ocpi.core.dependencies import get_http_client
+from py_ocpi.core.partners import partner_registry
+from py_ocpi.core.push import push_object, push_objects
 from py_ocpi.modules.locations.v_2_2_1.schemas import Location
 from py_ocpi.modules.versions.enums import VersionNumber
 from tests.test_modules.mocks.async_client import (
-    MockAsyncClientGeneratorVersionsAndEndpoints,
+    MockAsyncClientVersionsAndEndpoints,
+    MockResponse,
+    fake_endpoints_data,
 )
 
 from tests.test_modules.utils import (
@@ -190,11 +199,7 @@ LOCATIONS = [
 ]
 
 
-@patch(
-    "py_ocpi.core.push.httpx.AsyncClient",
-    side_effect=MockAsyncClientGeneratorVersionsAndEndpoints,
-)
-def test_push(async_client):
+def test_push():
     crud = AsyncMock()
     adapter = MagicMock()
 
@@ -210,6 +215,9 @@ def test_push(async_client):
         modules=[],
         http_push=True,
     )
+    app.dependency_overrides[get_http_client] = (
+        lambda: MockAsyncClientVersionsAndEndpoints
+    )
 
     client = TestClient(app)
     data = schemas.Push(
@@ -229,3 +237,370 @@ def test_push(async_client):
 
     crud.get.assert_awaited_once()
     adapter.location_adapter.assert_called_once()
+
+
+class MockPartnerClient:
+    """Partner stand-in answering per receiver url"""
+
+    def __init__(self, delays: dict, send_statuses: list = None):
+        self.delays = delays
+        self.send_statuses = send_statuses or []
+        self.gets = 0
+        self.sends = 0
+
+    async def get(self, url, headers):
+        self.gets += 1
+        delay = self.delays.get(url, 0)
+        if delay is None:
+            raise httpx.ConnectError("Connection refused")
+        await asyncio.sleep(delay)
+        return MockResponse(fake_endpoints_data, 200)
+
+    def build_request(self, method, url, headers, json):
+        return url
+
+    async def send(self, request):
+        self.sends += 1
+        status_code = self.send_statuses.pop(0) if self.send_statuses else 200
+        if isinstance(status_code, Exception):
+            raise status_code
+        return MockResponse({"status_code": 1000}, status_code)
+
+
+def test_push_object_isolates_receivers(monkeypatch):
+    monkeypatch.setattr(settings, "PUSH_RECEIVER_TIMEOUT", 0.1)
+    crud = AsyncMock()
+    adapter = MagicMock()
+    crud.get.return_value = LOCATIONS[0]
+    adapter.location_adapter.return_value = Location(**LOCATIONS[0])
+
+    push = schemas.Push(
+        module_id=enums.ModuleID.locations,
+        object_id="1",
+        receivers=[
+            schemas.Receiver(endpoints_url=url, auth_token="token")
+            for url in ("http://ok.com", "http://down.com", "http://slow.com")
+        ],
+    )
+    http_client = MockPartnerClient(
+        {"http://down.com": None, "http://slow.com": 1}
+    )
+
+    result = asyncio.run(
+        push_object(
+            VersionNumber.v_2_2_1,
+            push,
+            crud,
+            adapter,
+            http_client=http_client,
+        )
+    )
+
+    assert [r.status_code for r in result.receiver_responses] == [
+        200,
+        502,
+        504,
+    ]
+    crud.get.assert_awaited_once()
+    adapter.location_adapter.assert_called_once()
+
+
+def test_push_object_is_concurrent(monkeypatch):
+    monkeypatch.setattr(settings, "PUSH_CONCURRENCY", 5)
+    crud = AsyncMock()
+    adapter = MagicMock()
+    crud.get.return_value = LOCATIONS[0]
+    adapter.location_adapter.return_value = Location(**LOCATIONS[0])
+
+    urls = [f"http://receiver-{i}.com" for i in range(10)]
+    push = schemas.Push(
+        module_id=enums.ModuleID.locations,
+        object_id="1",
+        receivers=[
+            schemas.Receiver(endpoints_url=url, auth_token="token")
+            for url in urls
+        ],
+    )
+    http_client = MockPartnerClient({url: 0.1 for url in urls})
+
+    start = time.perf_counter()
+    result = asyncio.run(
+        push_object(
+            VersionNumber.v_2_2_1,
+            push,
+            crud,
+            adapter,
+            http_client=http_client,
+        )
+    )
+
+    # 2 batches of 5 receivers
+    assert time.perf_counter() - start < 0.5
+    assert len(result.receiver_responses) == 10
+
+
+def test_push_object_uses_partner_registry():
+    crud = AsyncMock()
+    adapter = MagicMock()
+    crud.get.return_value = LOCATIONS[0]
+    adapter.location_adapter.return_value = Location(**LOCATIONS[0])
+
+    url = "http://registered.com"
+    endpoints = fake_endpoints_data["data"]["endpoints"]
+    moved_endpoints = [
+        {
+            **endpoints[0],
+            "role": "RECEIVER",
+            "url": "http://moved.com/locations",
+        }
+    ]
+    partner_registry.set(url, VersionNumber.v_2_2_1, moved_endpoints)
+    push = schemas.Push(
+        module_id=enums.ModuleID.locations,
+        object_id="1",
+        receivers=[schemas.Receiver(endpoints_url=url, auth_token="token")],
+    )
+
+    # no version details request with registered endpoints
+    http_client = MockPartnerClient({})
+    asyncio.run(
+        push_object(
+            VersionNumber.v_2_2_1,
+            push,
+            crud,
+            adapter,
+            http_client=http_client,
+        )
+    )
+    assert http_client.gets == 0
+
+    # endpoints are refreshed and the push retried once on 404
+    http_client = MockPartnerClient({}, send_statuses=[404])
+    result = asyncio.run(
+        push_object(
+            VersionNumber.v_2_2_1,
+            push,
+            crud,
+            adapter,
+            http_client=http_client,
+        )
+    )
+    assert http_client.gets == 1
+    assert http_client.sends == 2
+    assert result.receiver_responses[0].status_code == 200
+
+    # not retried if the endpoint didn't move
+    http_client = MockPartnerClient({}, send_statuses=[404])
+    result = asyncio.run(
+        push_object(
+            VersionNumber.v_2_2_1,
+            push,
+            crud,
+            adapter,
+            http_client=http_client,
+        )
+    )
+    assert http_client.gets == 1
+    assert http_client.sends == 1
+    assert result.receiver_responses[0].status_code == 404
+    partner_registry.invalidate()
+
+
+def test_push_timed_out_cdr_is_sent_once():
+    crud = AsyncMock()
+    adapter = MagicMock()
+    adapter.cdr_adapter.return_value.model_dump.return_value = {"id": "1"}
+
+    url = "http://registered.com"
+    endpoints = fake_endpoints_data["data"]["endpoints"]
+    partner_registry.set(
+        url,
+        VersionNumber.v_2_2_1,
+        [
+            {
+                **endpoints[0],
+                "identifier": enums.ModuleID.cdrs,
+                "role": "RECEIVER",
+                "url": "http://moved.com/cdrs",
+            }
+        ],
+    )
+    push = schemas.Push(
+        module_id=enums.ModuleID.cdrs,
+        object_id="1",
+        receivers=[schemas.Receiver(endpoints_url=url, auth_token="token")],
+    )
+
+    # the POST may have reached the receiver
+    http_client = MockPartnerClient(
+        {}, send_statuses=[httpx.ReadTimeout("timed out")]
+    )
+    result = asyncio.run(
+        push_object(
+            VersionNumber.v_2_2_1,
+            push,
+            crud,
+            adapter,
+            http_client=http_client,
+        )
+    )
+    assert http_client.sends == 1
+    assert http_client.gets == 0
+    assert result.receiver_responses[0].status_code == 502
+    partner_registry.invalidate()
+
+
+def test_batch_push():
+    class BulkCrud:
+        get = AsyncMock()
+        get_many = AsyncMock()
+
+    BulkCrud.get_many.return_value = [LOCATIONS[0], LOCATIONS[0]]
+    adapter = MagicMock()
+    adapter.location_adapter.return_value = Location(**LOCATIONS[0])
+
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=BulkCrud,
+        adapter=adapter,
+        authenticator=ClientAuthenticator,
+        modules=[],
+        http_push=True,
+    )
+    app.dependency_overrides[get_http_client] = lambda: MockPartnerClient({})
+
+    client = TestClient(app)
+    data = schemas.BatchPush(
+        module_id=enums.ModuleID.locations,
+        object_ids=["1", "2"],
+        receivers=[
+            schemas.Receiver(
+                endpoints_url="http://batch.com", auth_token="token"
+            ),
+        ],
+    ).model_dump()
+    response = client.post(
+        "/push/2.2.1/batch",
+        json=data,
+        headers={"Authorization": f"Token {ENCODED_AUTH_TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["receiver_responses"][0]["status_codes"] == [
+        200,
+        200,
+    ]
+    BulkCrud.get_many.assert_awaited_once()
+    BulkCrud.get.assert_not_awaited()
+    assert adapter.location_adapter.call_count == 2
+    partner_registry.invalidate()
+
+
+def test_push_objects_results():
+    crud = AsyncMock()
+    adapter = MagicMock()
+    crud.get.side_effect = [LOCATIONS[0], None, LOCATIONS[0]]
+    adapter.location_adapter.return_value = Location(**LOCATIONS[0])
+
+    push = schemas.BatchPush(
+        module_id=enums.ModuleID.locations,
+        object_ids=["1", "2", "3"],
+        receivers=[
+            schemas.Receiver(endpoints_url=url, auth_token="token")
+            for url in ("http://ok.com", "http://down.com")
+        ],
+    )
+    http_client = MockPartnerClient({"http://down.com": None})
+
+    result = asyncio.run(
+        push_objects(
+            VersionNumber.v_2_2_1,
+            push,
+            crud,
+            adapter,
+            http_client=http_client,
+        )
+    )
+
+    ok, down = result.receiver_responses
+    assert ok.status_codes == [200, 404, 200]
+    assert ok.errors == {"2": "Object not found."}
+    assert down.status_codes == [502, 502, 502]
+    assert down.detail == "Connection refused"
+    # version details are requested once per receiver
+    assert http_client.gets == 2
+    assert crud.get.await_count == 3
+    partner_registry.invalidate()
+
+
+def test_websocket_push_pipelined(monkeypatch):
+    """Test pushes of a websocket are answered as they complete"""
+    monkeypatch.setattr(settings, "PUSH_WS_MAX_IN_FLIGHT", 2)
+    delays = {"slow": 0.2, "fast": 0}
+    in_flight = []
+
+    async def push_object(version, push, *args):
+        in_flight.append(push.object_id)
+        await asyncio.sleep(delays.get(push.object_id, 0))
+        if push.object_id == "fast":
+            # the slow push is still pending
+            assert "slow" in in_flight
+        in_flight.remove(push.object_id)
+        return schemas.PushResponse(receiver_responses=[])
+
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=AsyncMock(),
+        adapter=MagicMock(),
+        authenticator=ClientAuthenticator,
+        modules=[],
+        websocket_push=True,
+    )
+
+    def message(object_id, correlation_id=None):
+        data = {
+            "module_id": "locations",
+            "object_id": object_id,
+            "receivers": [],
+        }
+        if correlation_id is not None:
+            data["correlation_id"] = correlation_id
+        return data
+
+    with patch("py_ocpi.core.push.push_object", push_object):
+        with TestClient(app) as client:
+            with client.websocket_connect(
+                f"/push/ws/2.2.1?token={ENCODED_AUTH_TOKEN}"
+            ) as websocket:
+                websocket.send_json(message("slow", "a"))
+                websocket.send_json(message("fast", "b"))
+                websocket.send_json({"module_id": "unknown"})
+                responses = [websocket.receive_json() for _ in range(3)]
+
+    assert [r.get("correlation_id") for r in responses] == ["b", None, "a"]
+    assert responses[0]["receiver_responses"] == []
+    assert "detail" in responses[1]
+
+
+def test_websocket_push_not_an_object():
+    """Test pushes which aren't JSON objects are answered with an error"""
+    app = get_application(
+        version_numbers=[VersionNumber.v_2_2_1],
+        roles=[enums.RoleEnum.cpo],
+        crud=AsyncMock(),
+        adapter=MagicMock(),
+        authenticator=ClientAuthenticator,
+        modules=[],
+        websocket_push=True,
+    )
+
+    with TestClient(app) as client:
+        with client.websocket_connect(
+            f"/push/ws/2.2.1?token={ENCODED_AUTH_TOKEN}"
+        ) as websocket:
+            websocket.send_json(["locations"])
+            response = websocket.receive_json()
+
+    assert response == {"detail": "The push must be a JSON object."}